@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 
 _logger = None
 _signature_cache = WeakKeyDictionary()  # type: ignore
+_header_environ_keys: Dict[str, str] = {}
+_environ_header_names: Dict[str, Optional[str]] = {}
 _epoch_ord = date(1970, 1, 1).toordinal()
 _legal_cookie_chars = f"{string.ascii_letters}{string.digits}/=!#$%&'*+-.^_`|~:".encode(
     "ascii"
@@ -147,6 +149,52 @@ def _get_environ(obj: Any) -> Dict[str, Any]:
     return env
 
 
+def _header_environ_key(name: str) -> str:
+    """Get the environ key of a request header name, such as
+    ``HTTP_USER_AGENT`` for ``User-Agent``. The same few names are used
+    over and over, so the keys are cached.
+    """
+    key = _header_environ_keys.get(name)
+
+    if key is None:
+        key = name.upper().replace("-", "_")
+
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+
+        # Clients choose the names, don't let the cache grow forever.
+        if len(_header_environ_keys) < 1000:
+            _header_environ_keys[name] = key
+
+    return key
+
+
+def _environ_header_name(key: str) -> Optional[str]:
+    """Get the header name of an environ key, such as ``User-Agent`` for
+    ``HTTP_USER_AGENT``, or ``None`` if the key isn't a header. Cached
+    like :func:`_header_environ_key`.
+    """
+    try:
+        return _environ_header_names[key]
+    except KeyError:
+        pass
+
+    if key.startswith("HTTP_") and key not in (
+        "HTTP_CONTENT_TYPE",
+        "HTTP_CONTENT_LENGTH",
+    ):
+        name: Optional[str] = key[5:].replace("_", "-").title()
+    elif key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+        name = key.replace("_", "-").title()
+    else:
+        name = None
+
+    if len(_environ_header_names) < 1000:
+        _environ_header_names[key] = name
+
+    return name
+
+
 def _has_level_handler(logger):
     """Check if there is a handler in the logging chain that will handle
     the given logger's effective level.
@@ -1,7 +1,9 @@
 import base64
 import codecs
 import mimetypes
+import operator
 import re
+from array import array
 from collections.abc import Container
 from collections.abc import Iterable
 from collections.abc import MutableSet
@@ -28,6 +30,8 @@ from typing import TypeVar
 from typing import Union
 
 from . import exceptions
+from ._internal import _environ_header_name
+from ._internal import _header_environ_key
 from ._internal import _make_encode_wrapper
 from ._internal import _missing
 from .filesystem import get_filesystem_encoding
@@ -665,41 +669,8 @@ class MultiDict(TypeConversionDict):
         return f"{type(self).__name__}({list(self.items(multi=True))!r})"
 
 
-class _omd_bucket:
-    """Wraps values in the :class:`OrderedMultiDict`.  This makes it
-    possible to keep an order over multiple different keys.  It requires
-    a lot of extra memory and slows down access a lot, but makes it
-    possible to access elements in O(1) and iterate in O(n).
-    """
-
-    __slots__ = ("prev", "key", "value", "next")
-
-    def __init__(
-        self,
-        omd: Union["ImmutableOrderedMultiDict", "OrderedMultiDict"],
-        key: Hashable,
-        value: Any,
-    ) -> None:
-        self.prev = omd._last_bucket
-        self.key = key
-        self.value = value
-        self.next = None
-
-        if omd._first_bucket is None:
-            omd._first_bucket = self  # type: ignore
-        if omd._last_bucket is not None:
-            omd._last_bucket.next = self
-        omd._last_bucket = self  # type: ignore
-
-    def unlink(self, omd: "OrderedMultiDict") -> None:
-        if self.prev:
-            self.prev.next = self.next
-        if self.next:
-            self.next.prev = self.prev
-        if omd._first_bucket is self:
-            omd._first_bucket = self.next  # type: ignore
-        if omd._last_bucket is self:
-            omd._last_bucket = self.prev  # type: ignore
+#: Marks the key of a removed value in :class:`OrderedMultiDict`.
+_omd_removed = object()
 
 
 class OrderedMultiDict(MultiDict):
@@ -707,20 +678,27 @@ class OrderedMultiDict(MultiDict):
     order of the fields.  To convert the ordered multi dict into a
     list you can use the :meth:`items` method and pass it ``multi=True``.
 
-    In general an :class:`OrderedMultiDict` is an order of magnitude
-    slower than a :class:`MultiDict`.
+    In general an :class:`OrderedMultiDict` is slower than a
+    :class:`MultiDict`.
 
     .. admonition:: note
 
        Due to a limitation in Python you cannot convert an ordered
        multi dict into a regular dict by using ``dict(multidict)``.
        Instead you have to use the :meth:`to_dict` method, otherwise
-       the internal bucket objects are exposed.
+       the internal value positions are exposed.
+
+    .. versionchanged:: 2.0
+        Values are stored in insertion order in two lists instead of a
+        linked list of buckets. Removed values leave a marker that is
+        cleaned up once half of the entries are removed.
     """
 
     def __init__(self, mapping: Optional[Any] = None) -> None:
         dict.__init__(self)
-        self._first_bucket = self._last_bucket = None
+        self._keys: List[Hashable] = []
+        self._values: List[Any] = []
+        self._removed = 0
         if mapping is not None:
             OrderedMultiDict.update(self, mapping)
 
@@ -749,6 +727,12 @@ class OrderedMultiDict(MultiDict):
                 return False
         return True
 
+    def __ne__(self, other: object) -> bool:
+        rv = self.__eq__(other)
+        if rv is NotImplemented:
+            return rv
+        return not rv
+
     __hash__ = None
 
     def __reduce_ex__(
@@ -772,13 +756,11 @@ class OrderedMultiDict(MultiDict):
         return list(self.items(multi=True))
 
     def __setstate__(self, values):
-        dict.clear(self)
-        for key, value in values:
-            self.add(key, value)
+        OrderedMultiDict.__init__(self, values)
 
     def __getitem__(self, key: object) -> object:
         if key in self:
-            return dict.__getitem__(self, key)[0].value
+            return self._values[dict.__getitem__(self, key)[0]]
         raise exceptions.BadRequestKeyError(key)
 
     def __setitem__(self, key: Hashable, value: Any) -> None:
@@ -789,58 +771,54 @@ class OrderedMultiDict(MultiDict):
         self.pop(key)
 
     def keys(self) -> Iterator[Any]:  # type: ignore
-        return (key for key, value in self.items())
+        return iter(dict.keys(self))
 
-    __iter__ = keys
+    def __iter__(self) -> Iterator[Any]:
+        return iter(dict.keys(self))
 
     def values(self) -> Iterator[Any]:  # type: ignore
-        return (value for key, value in self.items())
+        values = self._values
+        return (values[positions[0]] for positions in dict.values(self))
 
     def items(  # type: ignore
         self, multi: bool = False
     ) -> Iterator[
         Union[Tuple[str, str], Tuple[str, int], Tuple[bytes, int], Tuple[bytes, bytes]]
     ]:
-        ptr = self._first_bucket
-        if multi:
-            while ptr is not None:
-                yield ptr.key, ptr.value
-                ptr = ptr.next
-        else:
-            returned_keys: Set[Any] = set()
-            while ptr is not None:
-                if ptr.key not in returned_keys:
-                    returned_keys.add(ptr.key)
-                    yield ptr.key, ptr.value
-                ptr = ptr.next
+        values = self._values
+        if not multi:
+            return ((k, values[positions[0]]) for k, positions in dict.items(self))
+        if not self._removed:
+            return zip(self._keys, values)
+        return ((k, v) for k, v in zip(self._keys, values) if k is not _omd_removed)
 
     def lists(self) -> Iterator[Tuple[Hashable, List[Any]]]:
-        returned_keys: Set[Any] = set()
-        ptr = self._first_bucket
-        while ptr is not None:
-            if ptr.key not in returned_keys:
-                yield ptr.key, self.getlist(ptr.key)
-                returned_keys.add(ptr.key)
-            ptr = ptr.next
+        values = self._values
+        for key, positions in dict.items(self):
+            yield key, [values[pos] for pos in positions]
 
     def listvalues(self):
         for _key, values in self.lists():
             yield values
 
     def add(self, key: Hashable, value: Any) -> None:
-        dict.setdefault(self, key, []).append(_omd_bucket(self, key, value))
+        keys = self._keys
+        dict.setdefault(self, key, []).append(len(keys))
+        keys.append(key)
+        self._values.append(value)
 
     def getlist(self, key: Hashable, type: Optional[Callable] = None) -> List[Any]:
         try:
             rv = dict.__getitem__(self, key)
         except KeyError:
             return []
+        values = self._values
         if type is None:
-            return [x.value for x in rv]
+            return [values[pos] for pos in rv]
         result = []
-        for item in rv:
+        for pos in rv:
             try:
-                result.append(type(item.value))
+                result.append(type(values[pos]))
             except ValueError:
                 pass
         return result
@@ -857,42 +835,388 @@ class OrderedMultiDict(MultiDict):
         for key, value in iter_multi_items(mapping):
             OrderedMultiDict.add(self, key, value)
 
+    def _remove(self, positions: List[int]) -> List[Any]:
+        """Replace the values at the positions with a marker and return
+        them.  Once more than half of the entries are markers, drop them
+        and renumber the remaining positions.
+        """
+        keys = self._keys
+        values = self._values
+        rv = [values[pos] for pos in positions]
+        for pos in positions:
+            keys[pos] = _omd_removed
+            values[pos] = None
+        self._removed += len(positions)
+        if self._removed * 2 > len(keys):
+            self._values = [
+                v for k, v in zip(keys, values) if k is not _omd_removed
+            ]
+            self._keys = keys = [k for k in keys if k is not _omd_removed]
+            self._removed = 0
+            dict.clear(self)
+            for pos, key in enumerate(keys):
+                dict.setdefault(self, key, []).append(pos)
+        return rv
+
     def poplist(self, key: Hashable) -> List[int]:
-        buckets = dict.pop(self, key, ())
-        for bucket in buckets:
-            bucket.unlink(self)
-        return [x.value for x in buckets]
+        return self._remove(dict.pop(self, key, []))
 
     def pop(
         self, key: str, default: Optional[Union[Any, "_Missing"]] = _missing
     ) -> Optional[Any]:
         try:
-            buckets = dict.pop(self, key)
+            positions = dict.pop(self, key)
         except KeyError:
             if default is not _missing:
                 return default
             raise exceptions.BadRequestKeyError(key)
-        for bucket in buckets:
-            bucket.unlink(self)
-        return buckets[0].value
+        return self._remove(positions)[0]
 
     def popitem(self) -> Tuple[Hashable, Any]:
         try:
-            key, buckets = dict.popitem(self)
+            key, positions = dict.popitem(self)
         except KeyError as e:
             raise exceptions.BadRequestKeyError(e.args[0])
-        for bucket in buckets:
-            bucket.unlink(self)
-        return key, buckets[0].value
+        return key, self._remove(positions)[0]
 
     def popitemlist(self) -> Tuple[str, List[int]]:
         try:
-            key, buckets = dict.popitem(self)
+            key, positions = dict.popitem(self)
         except KeyError as e:
             raise exceptions.BadRequestKeyError(e.args[0])
-        for bucket in buckets:
-            bucket.unlink(self)
-        return key, [x.value for x in buckets]
+        return key, self._remove(positions)
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._keys = []
+        self._values = []
+        self._removed = 0
+
+
+class CompactMultiDict(MultiDict):
+    """Works like a regular :class:`MultiDict` but stores keys and values
+    in two parallel lists instead of a list per key.  The dict itself only
+    maps each key to its first value, like :class:`OrderedMultiDict`, and
+    the positions of the other values are only looked up once they are
+    needed, so parsing a large query string or form allocates far fewer
+    objects than a :class:`MultiDict` or an :class:`OrderedMultiDict`.
+
+    Keys and values are returned in the same order as a
+    :class:`MultiDict` would return them.  Removing a key has to rebuild
+    the lists, which makes :meth:`pop`, :meth:`setlist` and deleting
+    keys more expensive than with a :class:`MultiDict`.  Because values
+    are not stored as lists per key, :meth:`setlistdefault` is not
+    supported and setting an empty list removes the key.
+
+    Set :attr:`~werkzeug.wrappers.Request.parameter_storage_class` to
+    :class:`ImmutableCompactMultiDict` to use it for request data.
+
+    .. versionadded:: 2.0
+    """
+
+    _keys: List[Hashable]
+    _values: List[Any]
+    #: Maps each key to the position of its first value, in the same
+    #: order as the dict.  ``None`` until positions are needed.
+    _index: Optional[Dict[Hashable, int]] = None
+    #: The position of the next value with the same key for each
+    #: position, or -1.  ``None`` if no key has more than one value.
+    _next: Optional[array] = None
+
+    def __init__(self, mapping: Optional[Any] = None) -> None:
+        dict.__init__(self)
+
+        if isinstance(mapping, CompactMultiDict):
+            self._keys = mapping._keys[:]
+            self._values = mapping._values[:]
+            dict.update(self, dict.items(mapping))
+            return
+
+        keys: List[Hashable] = []
+        values: List[Any] = []
+        self._keys = keys
+        self._values = values
+        add_key = keys.append
+        add_value = values.append
+
+        if isinstance(mapping, dict):
+            mapping = iter_multi_items(mapping)
+
+        for key, value in mapping or ():
+            add_key(key)
+            add_value(value)
+
+        self._fill()
+
+    def _fill(self) -> None:
+        """Store the first value of each key in the dict."""
+        keys = self._keys
+        values = self._values
+        dict.clear(self)
+        dict.update(self, zip(keys, values))
+
+        if dict.__len__(self) != len(keys):
+            # Updating keeps the place of existing keys but took the
+            # last values, going backwards ends at the first ones.
+            dict.update(self, zip(reversed(keys), reversed(values)))
+
+    def _get_index(self) -> Dict[Hashable, int]:
+        index = self._index
+
+        if index is None:
+            keys = self._keys
+            # Keys keep the position of their first insertion, values
+            # are the position of the last value with that key.
+            index = dict(zip(keys, range(len(keys))))
+
+            if len(index) != len(keys):
+                # Walk backwards to link each value to the next one with
+                # the same key and leave the first position in the index.
+                nxt = self._next = array("l", [-1]) * len(keys)
+
+                for pos in range(len(keys) - 1, -1, -1):
+                    key = keys[pos]
+                    following = index[key]
+
+                    if following != pos:
+                        nxt[pos] = following
+                        index[key] = pos
+
+            self._index = index
+
+        return index
+
+    def _positions(self, key: Hashable) -> List[int]:
+        pos = self._get_index().get(key)
+
+        if pos is None:
+            return []
+
+        nxt = self._next
+
+        if nxt is None:
+            return [pos]
+
+        rv = []
+
+        while pos != -1:
+            rv.append(pos)
+            pos = nxt[pos]
+
+        return rv
+
+    def _remove_positions(self, remove: Set[int]) -> None:
+        self._keys = [k for i, k in enumerate(self._keys) if i not in remove]
+        self._values = [v for i, v in enumerate(self._values) if i not in remove]
+        self._index = self._next = None
+        self._fill()
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        return type(self), (list(self.items(multi=True)),)
+
+    def __getstate__(self) -> List[Tuple[Hashable, Any]]:  # type: ignore
+        return list(self.items(multi=True))
+
+    def __setstate__(  # type: ignore
+        self, values: List[Tuple[Hashable, Any]]
+    ) -> None:
+        CompactMultiDict.__init__(self, values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiDict):
+            if len(self) != len(other):
+                return False
+
+            for key, values in self.lists():
+                if other.getlist(key) != values:
+                    return False
+
+            return True
+
+        if isinstance(other, dict):
+            return dict(self.lists()) == other
+
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        rv = self.__eq__(other)
+
+        if rv is NotImplemented:
+            return rv
+
+        return not rv
+
+    __hash__ = None  # type: ignore
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+
+        raise exceptions.BadRequestKeyError(key)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        positions = self._positions(key)
+
+        if not positions:
+            self.add(key, value)
+            return
+
+        self._values[positions[0]] = value
+        dict.__setitem__(self, key, value)
+
+        if len(positions) > 1:
+            self._remove_positions(set(positions[1:]))
+
+    def __delitem__(self, key: Hashable) -> None:
+        self.pop(key)
+
+    def values(self) -> Iterator[Any]:  # type: ignore
+        return iter(dict.values(self))
+
+    def items(  # type: ignore
+        self, multi: bool = False
+    ) -> Iterator[Tuple[Hashable, Any]]:
+        if not multi:
+            yield from dict.items(self)
+            return
+
+        index = self._get_index()
+        values = self._values
+        nxt = self._next
+
+        if nxt is None:
+            yield from zip(self._keys, values)
+        else:
+            for key, pos in index.items():
+                while pos != -1:
+                    yield key, values[pos]
+                    pos = nxt[pos]
+
+    def lists(self) -> Iterator[Tuple[Hashable, List[Any]]]:
+        values = self._values
+
+        for key in self._get_index():
+            yield key, [values[pos] for pos in self._positions(key)]
+
+    def listvalues(self) -> Iterator[List[Any]]:
+        return (values for key, values in self.lists())
+
+    def add(self, key: Hashable, value: Any) -> None:
+        index = self._index
+
+        if index is not None:
+            pos = len(self._keys)
+            first = index.setdefault(key, pos)
+            nxt = self._next
+
+            if first != pos:
+                if nxt is None:
+                    nxt = self._next = array("l", [-1]) * pos
+
+                while nxt[first] != -1:
+                    first = nxt[first]
+
+                nxt[first] = pos
+
+            if nxt is not None:
+                nxt.append(-1)
+
+        dict.setdefault(self, key, value)
+        self._keys.append(key)
+        self._values.append(value)
+
+    def getlist(self, key: Hashable, type: Optional[Callable] = None) -> List[Any]:
+        values = self._values
+
+        if type is None:
+            return [values[pos] for pos in self._positions(key)]
+
+        result = []
+
+        for pos in self._positions(key):
+            try:
+                result.append(type(values[pos]))
+            except ValueError:
+                pass
+
+        return result
+
+    def setlist(self, key: Hashable, new_list: Iterable) -> None:
+        positions = self._positions(key)
+
+        if not positions:
+            for value in new_list:
+                self.add(key, value)
+
+            return
+
+        # Put the new values where the first old one was, which keeps
+        # the key in the same place as it would be in a MultiDict.
+        new_list = list(new_list)
+        first = positions[0]
+        remove = set(positions)
+        keys = self._keys[:first]
+        values = self._values[:first]
+        keys.extend(repeat(key, len(new_list)))
+        values.extend(new_list)
+
+        for pos in range(first + 1, len(self._keys)):
+            if pos not in remove:
+                keys.append(self._keys[pos])
+                values.append(self._values[pos])
+
+        self._keys = keys
+        self._values = values
+        self._index = self._next = None
+        self._fill()
+
+    def setlistdefault(self, key, default_list=None):
+        raise TypeError("setlistdefault is unsupported for compact multi dicts")
+
+    def update(self, mapping: Mapping) -> None:  # type: ignore
+        for key, value in iter_multi_items(mapping):
+            CompactMultiDict.add(self, key, value)
+
+    def poplist(self, key: Hashable) -> List[Any]:
+        positions = self._positions(key)
+
+        if not positions:
+            return []
+
+        rv = [self._values[pos] for pos in positions]
+        self._remove_positions(set(positions))
+        return rv
+
+    def pop(
+        self, key: Hashable, default: Optional[Union[Any, "_Missing"]] = _missing
+    ) -> Optional[Any]:
+        values = self.poplist(key)
+
+        if not values:
+            if default is not _missing:
+                return default
+
+            raise exceptions.BadRequestKeyError(key)
+
+        return values[0]
+
+    def popitem(self) -> Tuple[Hashable, Any]:
+        key, values = self.popitemlist()
+        return key, values[0]
+
+    def popitemlist(self) -> Tuple[Hashable, List[Any]]:
+        if not dict.__len__(self):
+            raise exceptions.BadRequestKeyError("popitem(): dictionary is empty")
+
+        # Like dict.popitem, remove the key that was added last.
+        key = list(self)[-1]
+        return key, self.poplist(key)
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._keys = []
+        self._values = []
+        self._index = self._next = None
 
 
 def _options_header_vkw(value: str, kw: Dict[str, str]) -> str:
@@ -935,12 +1259,20 @@ class Headers:
        multi dicts do it.  The main difference is that bytes can be set as
        well which will automatically be latin1 decoded.
 
+    .. versionchanged:: 2.0
+        Lookups by name use an index of the lowercase names instead of
+        scanning the list.
+
     .. versionchanged:: 0.9
        The :meth:`linked` function was removed without replacement as it
        was an API that does not support the changes to the encoding model.
     """
 
     _list: List[Any]
+    # Maps lowercase names to the positions of their items in _list.
+    # Built by the first lookup, kept up to date by add and set, and
+    # dropped by other changes to the list.
+    _index: Optional[Dict[str, List[int]]] = None
 
     def __init__(self, defaults: Optional[Any] = None) -> None:
         self._list = []
@@ -950,6 +1282,36 @@ class Headers:
             else:
                 self.extend(defaults)
 
+    def _get_index(self) -> Dict[str, List[int]]:
+        index = self._index
+
+        if index is None:
+            index = self._index = {}
+
+            for idx, (key, _) in enumerate(self._list):
+                ikey = key.lower()
+                positions = index.get(ikey)
+
+                if positions is None:
+                    index[ikey] = [idx]
+                else:
+                    positions.append(idx)
+
+        return index
+
+    def _remove_positions(self, remove: Set[int]) -> None:
+        self._list[:] = [t for idx, t in enumerate(self._list) if idx not in remove]
+        self._index = None
+
+    def _values(self, ikey: str) -> List[str]:
+        """The values for a lowercase name, in order."""
+        positions = self._get_index().get(ikey)
+
+        if positions is None:
+            return []
+
+        return [self._list[idx][1] for idx in positions]
+
     def __getitem__(self, key: Union[str, int, slice], _get_mode: bool = False) -> Any:
         if not _get_mode:
             if isinstance(key, int):
@@ -958,10 +1320,9 @@ class Headers:
                 return self.__class__(self._list[key])
         if not isinstance(key, str):
             raise exceptions.BadRequestKeyError(key)
-        ikey = key.lower()
-        for k, v in self._list:
-            if k.lower() == ikey:
-                return v
+        positions = self._get_index().get(key.lower())
+        if positions is not None:
+            return self._list[positions[0]][1]
         # micro optimization: if we are in get mode we will catch that
         # exception one stack level down so we can raise a standard
         # key error instead of our special one.
@@ -1042,18 +1403,19 @@ class Headers:
         :return: a :class:`list` of all the values for the key.
         :param as_bytes: return bytes instead of strings.
         """
-        ikey = key.lower()  # type: ignore
+        values = self._values(key.lower())  # type: ignore
+        if not as_bytes and type is None:
+            return values
         result = []
-        for k, v in self:
-            if k.lower() == ikey:
-                if as_bytes:
-                    v = v.encode("latin1")
-                if type is not None:
-                    try:
-                        v = type(v)
-                    except ValueError:
-                        continue
-                result.append(v)
+        for v in values:
+            if as_bytes:
+                v = v.encode("latin1")
+            if type is not None:
+                try:
+                    v = type(v)
+                except ValueError:
+                    continue
+            result.append(v)
         return result
 
     def get_all(self, name: str) -> List[Any]:
@@ -1107,13 +1469,11 @@ class Headers:
     ) -> None:
         if _index_operation and isinstance(key, (int, slice)):
             del self._list[key]
+            self._index = None
             return
-        key = key.lower()  # type: ignore
-        new = []
-        for k, v in self._list:
-            if k.lower() != key:
-                new.append((k, v))
-        self._list[:] = new
+        positions = self._get_index().get(key.lower())  # type: ignore
+        if positions is not None:
+            self._remove_positions(set(positions))
 
     def remove(self, key: UnicodeEncodable) -> None:
         """Remove a key.
@@ -1136,8 +1496,10 @@ class Headers:
         :return: an item.
         """
         if key is None:
+            self._index = None
             return self._list.pop()
         if isinstance(key, int):
+            self._index = None
             return self._list.pop(key)
         try:
             rv = self[key]
@@ -1154,11 +1516,9 @@ class Headers:
 
     def __contains__(self, key: Union[str, int]) -> bool:
         """Check if a key is present."""
-        try:
-            self.__getitem__(key, _get_mode=True)  # type: ignore
-        except KeyError:
+        if not isinstance(key, str):
             return False
-        return True
+        return key.lower() in self._get_index()
 
     has_key = __contains__
 
@@ -1192,6 +1552,8 @@ class Headers:
         _key = _unicodify_header_value(_key)
         _value = _unicodify_header_value(_value)
         self._validate_value(_value)
+        if self._index is not None:
+            self._index.setdefault(_key.lower(), []).append(len(self._list))
         self._list.append((_key, _value))
 
     def _validate_value(self, value: Any) -> None:
@@ -1214,6 +1576,7 @@ class Headers:
     def clear(self):
         """Clears all headers."""
         del self._list[:]
+        self._index = None
 
     def set(
         self, _key: UnicodeEncodable, _value: Union[UnicodeEncodable, str], **kw
@@ -1237,20 +1600,17 @@ class Headers:
         _key = _unicodify_header_value(_key)
         _value = _unicodify_header_value(_value)
         self._validate_value(_value)
-        if not self._list:
-            self._list.append((_key, _value))
-            return
-        listiter = iter(self._list)
         ikey = _key.lower()
-        for idx, (old_key, _old_value) in enumerate(listiter):
-            if old_key.lower() == ikey:
-                # replace first occurrence
-                self._list[idx] = (_key, _value)
-                break
-        else:
+        index = self._get_index()
+        positions = index.get(ikey)
+        if positions is None:
+            index[ikey] = [len(self._list)]
             self._list.append((_key, _value))
             return
-        self._list[idx + 1 :] = [t for t in listiter if t[0].lower() != ikey]
+        # replace first occurrence
+        self._list[positions[0]] = (_key, _value)
+        if len(positions) > 1:
+            self._remove_positions(set(positions[1:]))
 
     def setlist(
         self, key: UnicodeEncodable, values: List[Union[UnicodeEncodable, str]]
@@ -1320,6 +1680,7 @@ class Headers:
                 self._list[key] = value[0]
             else:
                 self._list[key] = value
+            self._index = None
         else:
             self.set(key, value)
 
@@ -1451,8 +1812,19 @@ class EnvironHeaders(ImmutableHeadersMixin, Headers):  # type: ignore
     subclass of the :exc:`~exceptions.BadRequest` HTTP exception and will
     render a page for a ``400 BAD REQUEST`` if caught in a catch-all for
     HTTP exceptions.
+
+    .. versionchanged:: 2.0
+        The translation between header names and environ keys is cached,
+        and so is the list of headers as long as the environ doesn't
+        change.
     """
 
+    # The environ keys and values the cached items were read from, the
+    # items, and an index of the values by lowercase name.
+    _cache: Optional[
+        Tuple[List[str], List[Any], List[Tuple[str, str]], Dict[str, List[str]]]
+    ] = None
+
     def __init__(self, environ: WSGIEnvironment) -> None:
         self.environ = environ
 
@@ -1471,31 +1843,56 @@ class EnvironHeaders(ImmutableHeadersMixin, Headers):  # type: ignore
         # used because get() calls it.
         if not isinstance(key, str):
             raise KeyError(key)
-        key = key.upper().replace("-", "_")
-        if key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
-            return _unicodify_header_value(self.environ[key])
-        return _unicodify_header_value(self.environ[f"HTTP_{key}"])
+        return _unicodify_header_value(self.environ[_header_environ_key(key)])
+
+    def _get_items(
+        self,
+    ) -> Tuple[List[str], List[Any], List[Tuple[str, str]], Dict[str, List[str]]]:
+        environ = self.environ
+        cache = self._cache
+
+        # Reuse the items if the environ has the same keys with the same
+        # value objects. Comparing identities is much faster than
+        # translating all keys again, and catches any change.
+        if (
+            cache is not None
+            and len(cache[0]) == len(environ)
+            and cache[0] == list(environ)
+            and all(map(operator.is_, cache[1], environ.values()))
+        ):
+            return cache
+
+        items = []
+        index: Dict[str, List[str]] = {}
+
+        for key, value in environ.items():
+            name = _environ_header_name(key)
+
+            if name is None or (not value and key[:5] != "HTTP_"):
+                continue
+
+            value = _unicodify_header_value(value)
+            items.append((name, value))
+            index.setdefault(name.lower(), []).append(value)
+
+        cache = self._cache = (list(environ), list(environ.values()), items, index)
+        return cache
+
+    def _values(self, ikey: str) -> List[str]:
+        return list(self._get_items()[3].get(ikey, ()))
+
+    def __contains__(self, key: Union[str, int]) -> bool:  # type: ignore
+        try:
+            self.__getitem__(key, _get_mode=True)  # type: ignore
+        except KeyError:
+            return False
+        return True
 
     def __len__(self) -> int:
-        # the iter is necessary because otherwise list calls our
-        # len which would call list again and so forth.
-        return len(list(iter(self)))
+        return len(self._get_items()[2])
 
     def __iter__(self) -> Iterator[Tuple[str, str]]:
-        for key, value in self.environ.items():
-            if key.startswith("HTTP_") and key not in (
-                "HTTP_CONTENT_TYPE",
-                "HTTP_CONTENT_LENGTH",
-            ):
-                yield (
-                    key[5:].replace("_", "-").title(),
-                    _unicodify_header_value(value),
-                )
-            elif key in ("CONTENT_TYPE", "CONTENT_LENGTH") and value:
-                yield (
-                    key.replace("_", "-").title(),
-                    _unicodify_header_value(value),
-                )
+        return iter(self._get_items()[2])
 
     def copy(self):
         raise TypeError(f"cannot create {type(self).__name__!r} copies")
@@ -1724,6 +2121,92 @@ class ImmutableMultiDict(ImmutableMultiDictMixin, MultiDict):  # type: ignore
         return self
 
 
+class ImmutableLazyMultiDict(ImmutableMultiDict):  # type: ignore
+    """An :class:`ImmutableMultiDict` that takes the items from an
+    iterable of ``(key, value)`` pairs only as far as needed.  Looking up
+    a key stops at its first value.  Iterating, getting the length or
+    getting all the values of a key takes the remaining pairs.
+
+    Set :attr:`~werkzeug.wrappers.Request.parameter_storage_class` to
+    this class to decode the query string in
+    :attr:`~werkzeug.wrappers.Request.args` only up to the keys that are
+    looked up.
+
+    .. admonition:: note
+
+       Like :class:`OrderedMultiDict`, converting it with
+       ``dict(multidict)`` or ``**multidict`` gives the first value for
+       each key instead of the list of values.  Use :meth:`to_dict`
+       instead.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, mapping: Optional[Any] = None) -> None:
+        dict.__init__(self)
+        self._pairs = iter_multi_items(mapping or ())
+        # Take one pair so the dict is not empty if there are any pairs.
+        for key, value in self._pairs:
+            dict.__setitem__(self, key, [value])
+            break
+
+    def _consume(self, key: Any = _missing) -> None:
+        """Store the pairs up to and including the first one with
+        ``key``, or all remaining pairs.
+        """
+        pairs = self._pairs
+        if pairs is None:
+            return
+        for k, v in pairs:
+            dict.setdefault(self, k, []).append(v)
+            if k == key:
+                return
+        self._pairs = None
+
+    def __bool__(self) -> bool:
+        return dict.__len__(self) > 0
+
+    def __contains__(self, key: object) -> bool:
+        if dict.__contains__(self, key):
+            return True
+        self._consume(key)
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if key in self:
+            return dict.__getitem__(self, key)[0]
+        raise exceptions.BadRequestKeyError(key)
+
+    def consumes_all(name: str):  # type: ignore # noqa: B902
+        def oncall(self, *args, **kw):
+            self._consume()
+            return getattr(super(), name)(*args, **kw)
+
+        oncall.__name__ = name
+        return oncall
+
+    __len__ = consumes_all("__len__")
+    __iter__ = consumes_all("__iter__")
+    __eq__ = consumes_all("__eq__")
+    __ne__ = consumes_all("__ne__")
+    __hash__ = ImmutableMultiDict.__hash__
+    keys = consumes_all("keys")
+    values = consumes_all("values")
+    items = consumes_all("items")
+    lists = consumes_all("lists")
+    listvalues = consumes_all("listvalues")
+    getlist = consumes_all("getlist")
+
+    if hasattr(dict, "__reversed__"):
+        __reversed__ = consumes_all("__reversed__")
+
+    if hasattr(dict, "__or__"):
+        __or__ = consumes_all("__or__")
+        __ror__ = consumes_all("__ror__")
+
+    del consumes_all
+
+
 class ImmutableOrderedMultiDict(  # type: ignore
     ImmutableMultiDictMixin, OrderedMultiDict
 ):
@@ -1746,6 +2229,25 @@ class ImmutableOrderedMultiDict(  # type: ignore
         return self
 
 
+class ImmutableCompactMultiDict(  # type: ignore
+    ImmutableMultiDictMixin, CompactMultiDict
+):
+    """An immutable :class:`CompactMultiDict`.
+
+    .. versionadded:: 2.0
+    """
+
+    def copy(self) -> CompactMultiDict:
+        """Return a shallow mutable copy of this object.  Keep in mind that
+        the standard library's :func:`copy` function is a no-op for this class
+        like for any other python immutable type (eg: :class:`tuple`).
+        """
+        return CompactMultiDict(self)
+
+    def __copy__(self) -> "ImmutableCompactMultiDict":
+        return self
+
+
 class Accept(ImmutableList):
     """An :class:`Accept` object is just a list subclass for lists of
     ``(value, quality)`` tuples.  It is automatically sorted by specificity
@@ -1,18 +1,18 @@
-import codecs
+import binascii
 import re
+import threading
+from collections import deque
 from functools import update_wrapper
 from io import BytesIO
 from itertools import chain
-from itertools import repeat
-from itertools import tee
 from typing import Any
-from typing import AnyStr
 from typing import BinaryIO
 from typing import Callable
 from typing import Dict
 from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
 from typing import Type
@@ -26,12 +26,13 @@ from .datastructures import Headers
 from .datastructures import MultiDict
 from .http import parse_options_header
 from .urls import url_decode_stream
+from .wsgi import _make_chunk_view_iter
 from .wsgi import get_content_length
 from .wsgi import get_input_stream
-from .wsgi import make_line_iter
 from werkzeug.types import WSGIEnvironment
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor  # noqa: F401
     from werkzeug.datastructures import ImmutableMultiDict  # noqa: F401
     from werkzeug.wsgi import LimitedStream  # noqa: F401
 
@@ -45,9 +46,6 @@ except ImportError:
     SpooledTemporaryFile = None  # type: ignore
 
 
-#: an iterator that yields empty strings
-_empty_string_iter = repeat("")
-
 #: a regular expression for multipart boundaries
 _multipart_boundary_re = re.compile("^[ -~]{0,200}[!-~]$")
 
@@ -55,6 +53,16 @@ _multipart_boundary_re = re.compile("^[ -~]{0,200}[!-~]$")
 #: for multipart messages.
 _supported_multipart_encodings = frozenset(["base64", "quoted-printable"])
 
+#: a regular expression for the line breaks accepted in multipart data
+_line_break_re = re.compile(rb"\r\n?|\n")
+
+#: the bytes that are ignored when decoding base64
+_base64_ignored = bytes(
+    set(range(256)).difference(
+        b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+    )
+)
+
 
 def default_stream_factory(
     total_content_length: int,
@@ -81,6 +89,8 @@ def parse_form_data(
     max_content_length: None = None,
     cls: None = None,
     silent: bool = True,
+    file_sink_factory: Optional[Callable] = None,
+    max_form_parts: Optional[int] = None,
 ) -> Tuple[BinaryIO, Type[dict], Type[dict]]:
     """Parse the form data in the environ and return it as tuple in the form
     ``(stream, form, files)``.  You should only call this method if the
@@ -102,6 +112,10 @@ def parse_form_data(
     .. versionadded:: 0.5.1
        The optional `silent` flag was added.
 
+    .. versionchanged:: 2.0
+       The `file_sink_factory` and `max_form_parts` parameters were
+       added.
+
     :param environ: the WSGI environment to be used for parsing.
     :param stream_factory: An optional callable that returns a new read and
                            writeable file descriptor.  This callable works
@@ -120,6 +134,12 @@ def parse_form_data(
     :param cls: an optional dict class to use.  If this is not specified
                        or `None` the default :class:`MultiDict` is used.
     :param silent: If set to False parsing errors will not be caught.
+    :param file_sink_factory: An optional callable that returns a sink
+        that the data of an uploaded file is passed to instead of
+        writing it to the stream directly.  See :class:`FormDataParser`.
+    :param max_form_parts: The maximum number of multipart parts or url
+        encoded fields to parse.  If there are more an
+        :exc:`~exceptions.RequestEntityTooLarge` exception is raised.
     :return: A tuple in the form ``(stream, form, files)``.
     """
     return FormDataParser(
@@ -130,6 +150,8 @@ def parse_form_data(
         max_content_length,
         cls,
         silent,
+        file_sink_factory,
+        max_form_parts,
     ).parse_from_environ(environ)
 
 
@@ -161,6 +183,10 @@ class FormDataParser:
 
     .. versionadded:: 0.8
 
+    .. versionchanged:: 2.0
+       The `file_sink_factory` and `max_form_parts` parameters were
+       added.
+
     :param stream_factory: An optional callable that returns a new read and
                            writeable file descriptor.  This callable works
                            the same as :meth:`~BaseResponse._get_file_stream`.
@@ -178,6 +204,17 @@ class FormDataParser:
     :param cls: an optional dict class to use.  If this is not specified
                        or `None` the default :class:`MultiDict` is used.
     :param silent: If set to False parsing errors will not be caught.
+    :param file_sink_factory: An optional callable that is called with
+        the ``container`` returned by the stream factory and the
+        ``name``, ``filename`` and ``headers`` of an uploaded file as
+        keyword arguments.  It returns a sink with a ``write(data)``
+        method that is passed the data of the file instead of the
+        container, and a ``flush()`` method that is called once all the
+        data was passed.  The :class:`FileStorage` for the file is only
+        created after that.  See :class:`ExecutorFileSink`.
+    :param max_form_parts: The maximum number of multipart parts or url
+        encoded fields to parse.  If there are more an
+        :exc:`~exceptions.RequestEntityTooLarge` exception is raised.
     """
 
     def __init__(
@@ -189,6 +226,8 @@ class FormDataParser:
         max_content_length: Optional[int] = None,
         cls: Optional[Type[dict]] = None,
         silent: bool = True,
+        file_sink_factory: Optional[Callable] = None,
+        max_form_parts: Optional[int] = None,
     ) -> None:
         if stream_factory is None:
             stream_factory = default_stream_factory
@@ -201,6 +240,8 @@ class FormDataParser:
             cls = MultiDict
         self.cls = cls
         self.silent = silent
+        self.file_sink_factory = file_sink_factory
+        self.max_form_parts = max_form_parts
 
     def get_parse_func(
         self, mimetype: str, options: Dict[str, str]
@@ -270,6 +311,8 @@ class FormDataParser:
             self.errors,
             max_form_memory_size=self.max_form_memory_size,
             cls=self.cls,
+            file_sink_factory=self.file_sink_factory,
+            max_form_parts=self.max_form_parts,
         )
         boundary = options.get("boundary")
         if boundary is None:
@@ -293,8 +336,12 @@ class FormDataParser:
             and content_length > self.max_form_memory_size
         ):
             raise exceptions.RequestEntityTooLarge()
-        form = url_decode_stream(stream, self.charset, errors=self.errors, cls=self.cls)
-        return stream, form, self.cls()  # type: ignore
+        items = url_decode_stream(
+            stream, self.charset, errors=self.errors, return_iterator=True
+        )
+        if self.max_form_parts is not None:
+            items = _limit_parts(items, self.max_form_parts)
+        return stream, self.cls(items), self.cls()  # type: ignore
 
     #: mapping of mimetypes to parsing functions
     parse_functions = {
@@ -304,6 +351,13 @@ class FormDataParser:
     }
 
 
+def _limit_parts(items: Iterator, max_form_parts: int) -> Iterator:
+    for count, item in enumerate(items, 1):
+        if count > max_form_parts:
+            raise exceptions.RequestEntityTooLarge()
+        yield item
+
+
 def is_valid_multipart_boundary(boundary):
     """Checks if the string given is a valid multipart boundary."""
     return _multipart_boundary_re.match(boundary) is not None
@@ -350,6 +404,332 @@ def parse_multipart_headers(iterable: Union[List[str], chain]) -> Headers:
     return Headers(result)
 
 
+class Field(NamedTuple):
+    """Event of a :class:`MultipartDecoder` for the start of a form field.
+
+    .. versionadded:: 2.0
+    """
+
+    name: Optional[str]
+    headers: Headers
+
+
+class File(NamedTuple):
+    """Event of a :class:`MultipartDecoder` for the start of a file.
+
+    .. versionadded:: 2.0
+    """
+
+    name: Optional[str]
+    filename: str
+    headers: Headers
+
+
+class Data(NamedTuple):
+    """Event of a :class:`MultipartDecoder` with a chunk of the current
+    part's data.  ``more_data`` is ``False`` for the last chunk, which
+    ends the part.
+
+    .. versionadded:: 2.0
+    """
+
+    data: bytes
+    more_data: bool
+
+
+class Epilogue(NamedTuple):
+    """Event of a :class:`MultipartDecoder` for the end of the message.
+    ``data`` is what was received after the closing boundary so far.
+
+    .. versionadded:: 2.0
+    """
+
+    data: bytes
+
+
+class NeedData(NamedTuple):
+    """Event of a :class:`MultipartDecoder` that needs more data before
+    it can return the next event.
+
+    .. versionadded:: 2.0
+    """
+
+
+#: the :class:`NeedData` event returned by :class:`MultipartDecoder`
+NEED_DATA = NeedData()
+
+_preamble = "preamble"
+_part = "part"
+_data = "data"
+_epilogue = "epilogue"
+_complete = "complete"
+
+
+class MultipartDecoder:
+    """Decodes a ``multipart/form-data`` body without doing any I/O, so
+    it can be used with blocking streams as well as from event loops.
+    Pass the received bytes to :meth:`receive_data` and call
+    :meth:`next_event` until it returns :data:`NEED_DATA`::
+
+        decoder = MultipartDecoder(boundary)
+
+        while True:
+            event = decoder.next_event()
+            if event is NEED_DATA:
+                decoder.receive_data(stream.read(65536) or None)
+            elif isinstance(event, Epilogue):
+                break
+            else:
+                ...
+
+    Each part starts with a :class:`Field` or :class:`File` event,
+    followed by :class:`Data` events.  The message ends with an
+    :class:`Epilogue` event, anything received after that is ignored.
+    Malformed data raises a :exc:`ValueError`.
+
+    Part boundaries are found by searching the buffered data, so the
+    contents of a part are returned in chunks as large as the received
+    data no matter how many newlines they contain.
+
+    :param boundary: The boundary from the ``Content-Type`` header.
+    :param buffer_size: The longest line accepted in the part headers.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, boundary: bytes, buffer_size: int = 64 * 1024) -> None:
+        self.boundary = boundary
+        self.buffer_size = buffer_size
+        self._next_part = b"--" + boundary
+        self._last_part = self._next_part + b"--"
+        self._buffer = bytearray()
+        self._state = _preamble
+        self._input_complete = False
+        self._header_lines: List[bytes] = []
+        # the position of the first unparsed line in the preamble and
+        # headers, and where to search for the next boundary in data
+        self._pos = 0
+        self._search = 0
+        # a boundary right at the start of a part's data does not need
+        # a line break in front of it
+        self._at_start = True
+
+    def receive_data(self, data: Optional[Union[bytes, memoryview]]) -> None:
+        """Add received data to the buffer.  Pass ``None`` once the whole
+        body has been received.  The data is copied, so a reused buffer
+        can be passed.
+        """
+        if data is None:
+            self._input_complete = True
+        elif self._state != _complete:
+            self._buffer += data
+
+    def next_event(self) -> Union[Field, File, Data, Epilogue, NeedData]:
+        """Return the next event, or :data:`NEED_DATA` if more data has
+        to be received first.
+        """
+        if self._state == _preamble:
+            while True:
+                line = self._find_line_end(self._pos)
+                if line is None:
+                    return NEED_DATA
+                end, line_end = line
+                terminator = bytes(self._buffer[self._pos : end]).strip()
+                self._pos = line_end
+                if terminator or end == line_end:
+                    break
+
+            if terminator == self._last_part:
+                del self._buffer[: self._pos]
+                self._state = _epilogue
+            elif terminator == self._next_part:
+                self._state = _part
+            else:
+                raise ValueError("Expected boundary at start of multipart data")
+
+        if self._state == _part:
+            return self._next_part_headers()
+        elif self._state == _data:
+            return self._next_data()
+        elif self._state == _epilogue:
+            self._state = _complete
+            epilogue = bytes(self._buffer)
+            del self._buffer[:]
+            return Epilogue(epilogue)
+
+        return NEED_DATA
+
+    def _find_line_end(self, pos: int) -> Optional[Tuple[int, int]]:
+        """Return the start and end of the line break that ends the line
+        at ``pos``, or ``None`` if more data is needed.  If the line is
+        not terminated, because the input is complete or the line is
+        longer than the buffer size, both are equal.
+        """
+        buffer = self._buffer
+        match = _line_break_re.search(buffer, pos)
+
+        if match is not None:
+            # a CR at the end could be the first half of a CRLF
+            if match.end() < len(buffer) or match.group() != b"\r":
+                return match.start(), match.end()
+            elif self._input_complete:
+                return match.start(), match.end()
+        elif self._input_complete or len(buffer) - pos > self.buffer_size:
+            end = min(len(buffer), pos + self.buffer_size)
+            return end, end
+
+        return None
+
+    def _next_part_headers(self) -> Union[Field, File, NeedData]:
+        while True:
+            line = self._find_line_end(self._pos)
+            if line is None:
+                return NEED_DATA
+            end, line_end = line
+            is_empty = end == self._pos
+            self._header_lines.append(bytes(self._buffer[self._pos : line_end]))
+            self._pos = line_end
+            if is_empty or end == line_end:
+                break
+
+        headers = parse_multipart_headers(self._header_lines)
+        self._header_lines = []
+        del self._buffer[: self._pos]
+        self._pos = self._search = 0
+        self._at_start = True
+        self._state = _data
+
+        disposition = headers.get("content-disposition")
+        if disposition is None:
+            raise ValueError("Missing Content-Disposition header")
+        disposition, extra = parse_options_header(disposition)
+        name = extra.get("name")
+        filename = extra.get("filename")
+
+        if filename is not None:
+            return File(name, filename, headers)
+
+        return Field(name, headers)
+
+    def _next_data(self) -> Union[Data, NeedData]:
+        buffer = self._buffer
+        next_part = self._next_part
+
+        while True:
+            index = buffer.find(next_part, self._search)
+
+            if index == -1:
+                if self._input_complete:
+                    raise ValueError("unexpected end of stream")
+                # keep enough to recognize a boundary and the line break
+                # before it once more data is received
+                self._search = max(self._search, len(buffer) - len(next_part) + 1)
+                return self._emit_data(len(buffer) - len(next_part) - 1)
+
+            # the line break before the boundary is not part of the data
+            end = index
+            if index > 0:
+                if buffer[index - 1] == 10:
+                    end -= 1
+                    if end > 0 and buffer[end - 1] == 13:
+                        end -= 1
+                elif buffer[index - 1] == 13:
+                    end -= 1
+                else:
+                    self._search = index + 1
+                    continue
+            elif not self._at_start:
+                self._search = index + 1
+                continue
+
+            # the boundary may be followed by "--" and whitespace only
+            line = self._find_line_end(index + len(next_part))
+            if line is None:
+                return self._emit_data(end)
+            tail_end, line_end = line
+            tail = buffer[index + len(next_part) : tail_end].rstrip()
+            if tail not in (b"", b"--"):
+                self._search = index + 1
+                continue
+
+            data = bytes(buffer[:end])
+            del buffer[:line_end]
+            self._state = _epilogue if tail else _part
+            return Data(data, False)
+
+    def _emit_data(self, end: int) -> Union[Data, NeedData]:
+        if end <= 0:
+            return NEED_DATA
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        self._search = max(self._search - end, 0)
+        self._at_start = False
+        return Data(data, True)
+
+
+class _Base64Decoder:
+    """Decodes base64 data that is received in chunks.  The data is
+    decoded in blocks that are a multiple of four characters long, the
+    rest is kept for the next chunk.
+    """
+
+    def __init__(self) -> None:
+        self._rest = b""
+
+    def decode(self, data: bytes, final: bool) -> bytes:
+        data = self._rest + data.translate(None, _base64_ignored)
+        end = len(data) if final else len(data) - len(data) % 4
+        self._rest = data[end:]
+        data = data[:end]
+
+        if b"=" not in data:
+            return binascii.a2b_base64(data)
+
+        # Decode each padded group on its own, a2b_base64 would stop at
+        # the first padding.
+        rv = []
+        start = 0
+
+        while start < len(data):
+            end = data.find(b"=", start)
+            if end == -1:
+                end = len(data)
+            else:
+                while end < len(data) and data[end] == 61:
+                    end += 1
+            rv.append(binascii.a2b_base64(data[start:end]))
+            start = end
+
+        return b"".join(rv)
+
+
+class _QuotedPrintableDecoder:
+    """Decodes quoted-printable data that is received in chunks.  The
+    data is decoded up to the last line break, the rest is kept for the
+    next chunk.
+    """
+
+    def __init__(self) -> None:
+        self._rest = b""
+
+    def decode(self, data: bytes, final: bool) -> bytes:
+        data = self._rest + data
+        end = len(data)
+
+        if not final:
+            # a CR at the end could be the first half of a CRLF
+            end = max(data.rfind(b"\n"), data.rfind(b"\r", 0, end - 1)) + 1
+
+        self._rest = data[end:]
+        return binascii.a2b_qp(data[:end])
+
+
+#: the decoders for the supported transfer encodings
+_transfer_decoders = {
+    "base64": _Base64Decoder,
+    "quoted-printable": _QuotedPrintableDecoder,
+}
+
 _begin_form = "begin_form"
 _begin_file = "begin_file"
 _cont = "cont"
@@ -367,6 +747,8 @@ class MultiPartParser:
             Union[Type["ImmutableMultiDict"], Type[dict], Type["MultiDict"]]
         ] = None,
         buffer_size: int = 64 * 1024,
+        file_sink_factory: Optional[Callable] = None,
+        max_form_parts: Optional[int] = None,
     ) -> None:
         self.charset = charset
         self.errors = errors
@@ -384,6 +766,8 @@ class MultiPartParser:
         assert buffer_size >= 1024, "buffer size has to be at least 1KB"
 
         self.buffer_size = buffer_size
+        self.file_sink_factory = file_sink_factory
+        self.max_form_parts = max_form_parts
 
     def _fix_ie_filename(self, filename: str) -> str:
         """Internet Explorer 6 transmits the full file name if a file is
@@ -394,19 +778,6 @@ class MultiPartParser:
             return filename.split("\\")[-1]
         return filename
 
-    def _find_terminator(self, iterator: Union[Iterable[AnyStr]]) -> Union[bytes, str]:
-        """The terminator might have some additional newlines before it.
-        There is at least one application that xsends additional newlines
-        before headers (the python setuptools package).
-        """
-        for line in iterator:
-            if not line:
-                break
-            line = line.strip()
-            if line:
-                return line
-        return b""
-
     def fail(self, message):
         raise ValueError(message)
 
@@ -419,6 +790,17 @@ class MultiPartParser:
             return transfer_encoding
         return None
 
+    def _get_transfer_decoder(
+        self, headers: Headers
+    ) -> Optional[Union[_Base64Decoder, _QuotedPrintableDecoder]]:
+        """Return a decoder for the part's ``Content-Transfer-Encoding``,
+        or ``None`` if it does not need to be decoded.
+        """
+        transfer_encoding = self.get_part_encoding(headers)
+        if transfer_encoding is None:
+            return None
+        return _transfer_decoders[transfer_encoding]()
+
     def get_part_charset(self, headers: Headers) -> str:
         # Figure out input charset for current part
         content_type = headers.get("content-type")
@@ -484,99 +866,58 @@ class MultiPartParser:
         Always obeys the grammar
         parts = ( begin_form cont* end |
                   begin_file cont* end )*
-        """
-        next_part = b"--" + boundary
-        last_part = next_part + b"--"
-
-        iterator = chain(
-            make_line_iter(
-                file,
-                limit=content_length,
-                buffer_size=self.buffer_size,
-                cap_at_buffer=cap_at_buffer,
-            ),
-            _empty_string_iter,
-        )
-
-        terminator = self._find_terminator(iterator)
-
-        if terminator == last_part:
-            return
-        elif terminator != next_part:
-            self.fail("Expected boundary at start of multipart data")
-
-        while terminator != last_part:
-            headers = parse_multipart_headers(iterator)
-
-            disposition = headers.get("content-disposition")
-            if disposition is None:
-                self.fail("Missing Content-Disposition header")
-            disposition, extra = parse_options_header(disposition)
-            transfer_encoding = self.get_part_encoding(headers)
-            name = extra.get("name")
-            filename = extra.get("filename")
-
-            # if no content type is given we stream into memory.  A list is
-            # used as a temporary container.
-            if filename is None:
-                yield _begin_form, (headers, name)
-
-            # otherwise we parse the rest of the headers and ask the stream
-            # factory for something we can write in.
-            else:
-                yield _begin_file, (headers, name, filename)
-
-            buf = b""
-            for line in iterator:
-                if not line:
-                    self.fail("unexpected end of stream")
 
-                if line[:2] == b"--":  # type: ignore
-                    terminator = line.rstrip()
-                    if terminator in (next_part, last_part):  # type: ignore
-                        break
+        .. versionchanged:: 2.0
+           The body is parsed with a :class:`MultipartDecoder`.  ``cont``
+           chunks hold all the data that was read instead of a single
+           line, unless ``cap_at_buffer`` is disabled, then they end at
+           a line break.
+        """
+        decoder = MultipartDecoder(boundary, self.buffer_size)
+        chunks = _make_chunk_view_iter(file, content_length, self.buffer_size)
 
-                if transfer_encoding is not None:
-                    if transfer_encoding == "base64":
-                        transfer_encoding = "base64_codec"
+        while True:
+            try:
+                event = decoder.next_event()
+            except ValueError as e:
+                self.fail(str(e))
+
+            if event is NEED_DATA:
+                decoder.receive_data(next(chunks, None))
+            elif isinstance(event, Field):
+                transfer_decoder = self._get_transfer_decoder(event.headers)
+                carry = bytearray()
+                yield _begin_form, (event.headers, event.name)
+            elif isinstance(event, File):
+                transfer_decoder = self._get_transfer_decoder(event.headers)
+                carry = bytearray()
+                yield _begin_file, (event.headers, event.name, event.filename)
+            elif isinstance(event, Data):
+                data = event.data
+
+                if transfer_decoder is not None:
                     try:
-                        line = codecs.decode(line, transfer_encoding)  # type: ignore
-                    except Exception:
+                        data = transfer_decoder.decode(data, not event.more_data)
+                    except ValueError:
                         self.fail("could not decode transfer encoded chunk")
-
-                # we have something in the buffer from the last iteration.
-                # this is usually a newline delimiter.
-                if buf:
-                    yield _cont, buf
-                    buf = b""
-
-                # If the line ends with windows CRLF we write everything except
-                # the last two bytes.  In all other cases however we write
-                # everything except the last byte.  If it was a newline, that's
-                # fine, otherwise it does not matter because we will write it
-                # the next iteration.  this ensures we do not write the
-                # final newline into the stream.  That way we do not have to
-                # truncate the stream.  However we do have to make sure that
-                # if something else than a newline is in there we write it
-                # out.
-                if line[-2:] == b"\r\n":  # type: ignore
-                    buf = b"\r\n"
-                    cutoff = -2
-                else:
-                    buf = line[-1:]  # type: ignore
-                    cutoff = -1
-                yield _cont, line[:cutoff]
-
+                elif not cap_at_buffer:
+                    # only pass on complete lines, the rest is kept for the
+                    # next chunk
+                    carry += data
+                    end = len(carry)
+                    if event.more_data:
+                        end = max(carry.rfind(b"\n"), carry.rfind(b"\r", 0, end - 1))
+                        end += 1
+                    data = bytes(carry[:end])
+                    del carry[:end]
+
+                if data:
+                    yield _cont, data
+
+                if not event.more_data:
+                    yield _end, None
             else:
-                raise ValueError("unexpected end of part")
-
-            # if we have a leftover in the buffer that is not a newline
-            # character we have to flush it, otherwise we will chop of
-            # certain values.
-            if buf not in (b"", b"\r", b"\n", b"\r\n"):
-                yield _cont, buf
-
-            yield _end, None
+                return
 
     def parse_parts(
         self, file: BinaryIO, boundary: bytes, content_length: int
@@ -585,8 +926,14 @@ class MultiPartParser:
         ``('form', (name, val))`` parts.
         """
         in_memory = 0
+        parts = 0
 
         for ellt, ell in self.parse_lines(file, boundary, content_length):
+            if ellt == _begin_file or ellt == _begin_form:
+                parts += 1
+                if self.max_form_parts is not None and parts > self.max_form_parts:
+                    raise exceptions.RequestEntityTooLarge()
+
             if ellt == _begin_file:
                 headers, name, filename = ell  # type: ignore
                 is_file = True
@@ -594,7 +941,17 @@ class MultiPartParser:
                 filename, container = self.start_file_streaming(
                     filename, headers, content_length  # type: ignore
                 )
-                _write = container.write
+                if self.file_sink_factory is None:
+                    sink = None
+                    _write = container.write
+                else:
+                    sink = self.file_sink_factory(
+                        container=container,
+                        name=name,
+                        filename=filename,
+                        headers=headers,
+                    )
+                    _write = sink.write
 
             elif ellt == _begin_form:
                 headers, name = ell  # type: ignore
@@ -615,6 +972,8 @@ class MultiPartParser:
 
             elif ellt == _end:
                 if is_file:
+                    if sink is not None:
+                        sink.flush()
                     container.seek(0)
                     yield (  # type: ignore
                         "file",
@@ -638,9 +997,128 @@ class MultiPartParser:
     def parse(
         self, file: BinaryIO, boundary: bytes, content_length: int
     ) -> Tuple[dict, dict]:
-        formstream, filestream = tee(
-            self.parse_parts(file, boundary, content_length), 2
-        )
-        form = (p[1] for p in formstream if p[0] == "form")
-        files = (p[1] for p in filestream if p[0] == "file")
+        form = []
+        files = []
+
+        for kind, item in self.parse_parts(file, boundary, content_length):
+            if kind == "form":
+                form.append(item)
+            else:
+                files.append(item)
+
         return self.cls(form), self.cls(files)  # type: ignore
+
+
+class _SinkLane:
+    """Passes chunks to ``func`` in order on an executor, with at most
+    one task running and ``max_pending`` chunks waiting at a time.
+    """
+
+    def __init__(self, func: Callable, executor: "Executor", max_pending: int) -> None:
+        self.func = func
+        self.executor = executor
+        self.max_pending = max_pending
+        self._chunks: deque = deque()
+        self._condition = threading.Condition()
+        self._running = False
+        self._error: Optional[Exception] = None
+
+    def put(self, data: bytes) -> None:
+        with self._condition:
+            while len(self._chunks) >= self.max_pending and self._error is None:
+                self._condition.wait()
+            self._raise_error()
+            self._chunks.append(data)
+            if not self._running:
+                self.executor.submit(self._run)
+                self._running = True
+
+    def join(self) -> None:
+        with self._condition:
+            while self._running:
+                self._condition.wait()
+            self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._chunks:
+                    self._running = False
+                    self._condition.notify_all()
+                    return
+                data = self._chunks[0]
+
+            try:
+                self.func(data)
+            except Exception as e:
+                with self._condition:
+                    self._error = e
+                    self._chunks.clear()
+                    self._running = False
+                    self._condition.notify_all()
+                return
+
+            with self._condition:
+                self._chunks.popleft()
+                self._condition.notify_all()
+
+
+class ExecutorFileSink:
+    """A sink for :class:`FormDataParser` that writes the data of an
+    uploaded file to its container, and passes it to any number of hash
+    objects, on a :class:`concurrent.futures.ThreadPoolExecutor`.  This
+    lets writing to disk and hashing overlap with reading the request
+    body and with each other.  Each of them gets the data in order, and
+    at most ``max_pending`` chunks are queued for each before
+    :meth:`write` waits.
+
+    .. code-block:: python
+
+        executor = ThreadPoolExecutor()
+        digests = {}
+
+        def file_sink_factory(container, name, filename, headers):
+            sha256 = hashlib.sha256()
+            digests[name] = sha256
+            return ExecutorFileSink(container, executor, [sha256])
+
+        parser = FormDataParser(file_sink_factory=file_sink_factory)
+
+    :param container: The stream the file is written to.
+    :param executor: The thread pool to run writes and hash updates on.
+    :param hashes: Objects with an ``update(data)`` method, like the ones
+        returned by :func:`hashlib.new`.
+    :param max_pending: The number of chunks that may be queued.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(
+        self,
+        container: BinaryIO,
+        executor: "Executor",
+        hashes: Iterable[Any] = (),
+        max_pending: int = 4,
+    ) -> None:
+        self.container = container
+        self.hashes = list(hashes)
+        self._lanes = [
+            _SinkLane(func, executor, max_pending)
+            for func in [container.write] + [h.update for h in self.hashes]
+        ]
+
+    def write(self, data: bytes) -> None:
+        """Queue a chunk of data.  Raises the exception of a failed write
+        or hash update.
+        """
+        for lane in self._lanes:
+            lane.put(data)
+
+    def flush(self) -> None:
+        """Wait until all the queued data is written and hashed."""
+        for lane in self._lanes:
+            lane.join()
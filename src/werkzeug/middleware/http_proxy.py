@@ -19,6 +19,7 @@ from ..datastructures import EnvironHeaders
 from ..http import is_hop_by_hop_header
 from ..urls import url_parse
 from ..urls import url_quote
+from ..wsgi import _make_chunk_view_iter
 from ..wsgi import get_input_stream
 
 if TYPE_CHECKING:
@@ -177,12 +178,7 @@ class ProxyMiddleware:
                 con.endheaders()
                 stream = get_input_stream(environ)
 
-                while 1:
-                    data = stream.read(self.chunk_size)
-
-                    if not data:
-                        break
-
+                for data in _make_chunk_view_iter(stream, None, self.chunk_size):
                     if chunked:
                         con.send(b"%x\r\n%s\r\n" % (len(data), data))
                     else:
@@ -12,7 +12,9 @@ that may be slowing down your application.
 :license: BSD-3-Clause
 """
 import os.path
+import random
 import sys
+import threading
 import time
 from pstats import Stats
 from typing import IO
@@ -55,6 +57,15 @@ class ProfilerMiddleware:
     If it is a callable, it will be called with the WSGI ``environ``
     dict and should return a filename.
 
+    Profiling makes requests several times slower. To keep the overhead
+    low, pass ``sample_rate`` to only profile that fraction of requests,
+    the others are passed to the application unchanged. With
+    ``aggregate_interval``, the profiles of all sampled requests are
+    merged instead of reported one by one. The merged stats are written
+    to ``stream``, and saved to ``profile_dir`` as
+    ``aggregate.{time}.prof``, by the first request that ends after the
+    interval passed.
+
     :param app: The WSGI application to wrap.
     :param stream: Write stats to this stream. Disable with ``None``.
     :param sort_by: A tuple of columns to sort stats by. See
@@ -64,12 +75,19 @@ class ProfilerMiddleware:
     :param profile_dir: Save profile data files to this directory.
     :param filename_format: Format string for profile data file names,
         or a callable returning a name. See explanation above.
+    :param sample_rate: The fraction of requests to profile, between 0
+        and 1.
+    :param aggregate_interval: Merge the profiles of requests and write
+        them every this many seconds.
 
     .. code-block:: python
 
         from werkzeug.middleware.profiler import ProfilerMiddleware
         app = ProfilerMiddleware(app)
 
+    .. versionadded:: 2.0
+        Added ``sample_rate`` and ``aggregate_interval``.
+
     .. versionchanged:: 0.15
         Stats are written even if ``profile_dir`` is given, and can be
         disable by passing ``stream=None``.
@@ -89,6 +107,8 @@ class ProfilerMiddleware:
         restrictions: Iterable[Union[str, float]] = (),
         profile_dir: Optional[Text] = None,
         filename_format: Text = "{method}.{path}.{elapsed:.0f}ms.{time:.0f}.prof",
+        sample_rate: float = 1.0,
+        aggregate_interval: Optional[float] = None,
     ) -> None:
         self._app = app
         self._stream = stream
@@ -96,10 +116,19 @@ class ProfilerMiddleware:
         self._restrictions = restrictions
         self._profile_dir = profile_dir
         self._filename_format = filename_format
+        self._sample_rate = sample_rate
+        self._aggregate_interval = aggregate_interval
+        self._aggregate: Optional[Stats] = None
+        self._aggregate_count = 0
+        self._aggregate_start = time.time()
+        self._lock = threading.Lock()
 
     def __call__(
         self, environ: "WSGIEnvironment", start_response: "StartResponse"
-    ) -> List[bytes]:
+    ) -> Iterable[bytes]:
+        if self._sample_rate < 1 and random.random() >= self._sample_rate:
+            return self._app(environ, start_response)
+
         response_body: List[bytes] = []
 
         def catching_start_response(status, headers, exc_info=None):
@@ -119,6 +148,10 @@ class ProfilerMiddleware:
         body = b"".join(response_body)
         elapsed = time.time() - start
 
+        if self._aggregate_interval is not None:
+            self._add_to_aggregate(profile, self._aggregate_interval)
+            return [body]
+
         if self._profile_dir is not None:
             if callable(self._filename_format):
                 filename = self._filename_format(environ)
@@ -144,3 +177,39 @@ class ProfilerMiddleware:
             print(f"{'-' * 80}\n", file=self._stream)
 
         return [body]
+
+    def _add_to_aggregate(self, profile: Profile, interval: float) -> None:
+        with self._lock:
+            if self._aggregate is None:
+                self._aggregate = Stats(profile, stream=self._stream)
+            else:
+                self._aggregate.add(profile)
+
+            self._aggregate_count += 1
+            now = time.time()
+
+            if now - self._aggregate_start < interval:
+                return
+
+            stats = self._aggregate
+            count = self._aggregate_count
+            start = self._aggregate_start
+            self._aggregate = None
+            self._aggregate_count = 0
+            self._aggregate_start = now
+
+            # Write while holding the lock, so files and stream output
+            # of consecutive intervals don't overlap.
+            if self._profile_dir is not None:
+                filename = os.path.join(self._profile_dir, f"aggregate.{now:.0f}.prof")
+                stats.dump_stats(filename)
+
+            if self._stream is not None:
+                stats.sort_stats(*self._sort_by)
+                print("-" * 80, file=self._stream)
+                print(
+                    f"{count} requests in {now - start:.1f} seconds",
+                    file=self._stream,
+                )
+                stats.print_stats(*self._restrictions)
+                print(f"{'-' * 80}\n", file=self._stream)
@@ -111,6 +111,7 @@ import posixpath
 import re
 import uuid
 import warnings
+from collections import OrderedDict
 from pprint import pformat
 from string import Template
 from threading import Lock
@@ -121,6 +122,7 @@ from typing import Hashable
 from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Pattern
 from typing import Set
@@ -684,7 +686,8 @@ class Rule(RuleFactory):
     _converters: Optional[Dict[Hashable, Any]]
     _static_weights: Optional[List[Any]]
     _argument_weights: Optional[List[Any]]
-    _regex: Optional[Pattern]
+    _regex_source: Optional[str]
+    _cacheable: bool
 
     def __init__(
         self,
@@ -738,7 +741,8 @@ class Rule(RuleFactory):
             self.arguments = set(map(str, defaults))
         else:
             self.arguments = set()
-        self._trace = self._converters = self._regex = self._argument_weights = None
+        self._trace = self._converters = self._argument_weights = None
+        self._regex_source = None
 
     def empty(self) -> "Rule":
         """
@@ -833,7 +837,12 @@ class Rule(RuleFactory):
         )
 
     def compile(self) -> None:
-        """Compiles the regular expression and stores it."""
+        """Compiles the regular expression and stores it.
+
+        .. versionchanged:: 2.0
+            The regular expression and the URL builders are compiled
+            the first time they are used.
+        """
         assert self.map is not None, "rule not bound"
 
         if self.map.host_matching:
@@ -886,12 +895,16 @@ class Rule(RuleFactory):
         if not self.is_leaf:
             self._trace.append((False, "/"))
 
-        self._build = self._compile_builder(False).__get__(self, None)  # type: ignore
-        self._build_unknown = self._compile_builder(True).__get__(  # type: ignore
-            self, None
-        )
+        self._cacheable = all(c.cacheable for c in self._converters.values())
+
+        # Compiling the regex and builders is the slowest part of adding
+        # a rule, so it's deferred until they are used. Discard the ones
+        # from before the rule was rebound.
+        for name in ("_regex", "_build", "_build_unknown"):
+            self.__dict__.pop(name, None)
 
         if self.build_only:
+            self._regex_source = None
             return
 
         if not (self.is_leaf and self.strict_slashes):
@@ -900,8 +913,22 @@ class Rule(RuleFactory):
         else:
             tail = ""
 
-        regex = f"^{''.join(regex_parts)}{tail}$"
-        self._regex = re.compile(regex)
+        self._regex_source = f"^{''.join(regex_parts)}{tail}$"
+
+    @cached_property
+    def _regex(self) -> Optional[Pattern]:
+        if self._regex_source is None:
+            return None
+
+        return re.compile(self._regex_source)
+
+    @cached_property
+    def _build(self) -> Callable:
+        return self._compile_builder(False).__get__(self, None)  # type: ignore
+
+    @cached_property
+    def _build_unknown(self) -> Callable:
+        return self._compile_builder(True).__get__(self, None)  # type: ignore
 
     def match(self, path: str, method: Optional[str] = None) -> Optional[dict]:
         """Check if the rule matches a given path. Path is a string in the
@@ -1201,11 +1228,39 @@ class Rule(RuleFactory):
 
 
 class BaseConverter:
-    """Base class for all converters."""
+    """Base class for all converters.
+
+    .. versionchanged:: 2.0
+        Added ``part_isolating`` and ``cacheable``.
+    """
 
     regex = "[^/]+"
     weight = 100
 
+    #: Whether the converter's regex only ever matches within a single
+    #: path segment, never across a slash. Matchers that index rules by
+    #: path segment, like :class:`TrieMatcher`, rely on this. Set it to
+    #: ``False`` if the converter's regex can match a ``/``.
+    part_isolating = True
+
+    #: Whether :meth:`to_python` always returns the same value for the
+    #: same input and has no side effects. If a map has a match cache,
+    #: matches that try a rule using a converter that sets this to
+    #: ``False`` are not cached.
+    cacheable = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # If the converter doesn't say whether it isolates parts, guess
+        # based on whether its regex mentions slashes. A converter that
+        # only defines __init__ may set any regex on the instance.
+        if "part_isolating" not in cls.__dict__:
+            if "regex" in cls.__dict__:
+                cls.part_isolating = "/" not in cls.regex
+            elif "__init__" in cls.__dict__:
+                cls.part_isolating = False
+
     def __init__(self, map: "Map") -> None:
         self.map = map
 
@@ -1236,6 +1291,8 @@ class UnicodeConverter(BaseConverter):
     :param length: the exact length of the string.
     """
 
+    part_isolating = True
+
     def __init__(
         self,
         map: "Map",
@@ -1269,6 +1326,7 @@ class AnyConverter(BaseConverter):
     def __init__(self, map: "Map", *items) -> None:
         BaseConverter.__init__(self, map)
         self.regex = f"(?:{'|'.join([re.escape(x) for x in items])})"
+        self.part_isolating = not any("/" in x for x in items)
 
 
 class PathConverter(BaseConverter):
@@ -1283,6 +1341,7 @@ class PathConverter(BaseConverter):
 
     regex = "[^/].*?"
     weight = 200
+    part_isolating = False
 
 
 class NumberConverter(BaseConverter):
@@ -1292,6 +1351,7 @@ class NumberConverter(BaseConverter):
     """
 
     weight = 50
+    part_isolating = True
 
     def __init__(
         self,
@@ -1418,6 +1478,369 @@ DEFAULT_CONVERTERS = {
 }
 
 
+class RuleMatcher:
+    """Finds the rules of a :class:`Map` that could match a request.
+    This default matcher returns every rule, which are then checked one
+    after the other by :meth:`MapAdapter.match`.
+
+    Subclasses can index the rules to skip ones that can't match. The
+    adapter still checks each candidate, so a matcher may return rules
+    that don't match, but it must never leave out a rule that would,
+    and it must keep the order of :meth:`Rule.match_compare_key`.
+
+    Set :attr:`Map.matcher_class` to use a different matcher.
+
+    :param map: The :class:`Map` this matcher finds rules for.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, map: "Map") -> None:
+        self.map = map
+        self._rules: List[Rule] = []
+
+    def update(self, rules: List[Rule]) -> None:
+        """Called by :meth:`Map.update` with the rules, sorted by
+        :meth:`Rule.match_compare_key`, after they changed.
+        """
+        self._rules = [rule for rule in rules if not rule.build_only]
+
+    def match_candidates(self, domain_part: str, path_part: str) -> Iterable[Rule]:
+        """Return the rules that could match the given request, in the
+        order they should be tried.
+
+        :param domain_part: The subdomain, or the host if
+            :attr:`Map.host_matching` is enabled.
+        :param path_part: The path to match.
+        """
+        return self._rules
+
+
+class _SegmentNode:
+    """A node in the segment tree used by :class:`TrieMatcher`.
+
+    :internal:
+    """
+
+    __slots__ = ("rules", "static", "dynamic")
+
+    def __init__(self) -> None:
+        #: Indexes of the rules whose indexed path ends at this node.
+        self.rules: List[int] = []
+        self.static: Dict[str, "_SegmentNode"] = {}
+        self.dynamic: Dict[str, Tuple[Pattern, "_SegmentNode"]] = {}
+
+
+def _rule_segments(rule: Rule) -> Tuple[Optional[str], List[Tuple[bool, str]]]:
+    """Split a compiled rule into the static domain it matches, or
+    ``None`` if the domain has variable parts, and the leading path
+    segments that can be indexed. Each segment is a tuple of
+    ``(is_dynamic, value)`` where the value is the static text or the
+    converter's regex.
+
+    :internal:
+    """
+    trace = rule._trace
+    sep = trace.index((False, "|"))
+
+    if any(is_dynamic for is_dynamic, _ in trace[:sep]):
+        domain = None
+    else:
+        domain = "".join(data for _, data in trace[:sep])
+
+    segments = []
+    parts: List[Tuple[bool, str]] = []
+
+    for is_dynamic, data in trace[sep + 1 :]:
+        if not is_dynamic and data.startswith("/"):
+            if parts:
+                segments.append(parts)
+                parts = []
+        else:
+            parts.append((is_dynamic, data))
+
+    if parts:
+        segments.append(parts)
+
+    rv = []
+
+    # Stop at the first segment that mixes static and variable parts or
+    # whose converter might match more or less than one whole segment.
+    for parts in segments:
+        if len(parts) != 1:
+            break
+
+        is_dynamic, data = parts[0]
+
+        if is_dynamic:
+            converter = rule._converters[data]
+
+            if not converter.part_isolating or re.fullmatch(converter.regex, ""):
+                break
+
+            data = converter.regex
+
+        rv.append((is_dynamic, data))
+
+    return domain, rv
+
+
+class TrieMatcher(RuleMatcher):
+    """Indexes the rules in a tree of path segments so that matching
+    only tries the rules that share the request's leading segments,
+    instead of every rule in the map. Static segments are looked up in
+    a dict, and segments that are a single converter are followed if
+    the converter's regex matches the segment. This makes the cost of
+    matching grow with the depth of the path rather than the number of
+    rules. Each domain has its own tree.
+
+    Matching results are the same as with the default
+    :class:`RuleMatcher`, including priority, redirects, and
+    :exc:`~werkzeug.exceptions.MethodNotAllowed`. Custom converters
+    whose regex can match a ``/`` must set
+    :attr:`BaseConverter.part_isolating` to ``False``.
+
+    .. code-block:: python
+
+        class TrieMap(Map):
+            matcher_class = TrieMatcher
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, map: "Map") -> None:
+        super().__init__(map)
+        self._index: Tuple[List[Rule], Dict[str, _SegmentNode], _SegmentNode] = (
+            [],
+            {},
+            _SegmentNode(),
+        )
+
+    def update(self, rules: List[Rule]) -> None:
+        rules = [rule for rule in rules if not rule.build_only]
+        static_domains: Dict[str, _SegmentNode] = {}
+        dynamic_domain = _SegmentNode()
+
+        for index, rule in enumerate(rules):
+            domain, segments = _rule_segments(rule)
+
+            if domain is None:
+                node = dynamic_domain
+            else:
+                node = static_domains.setdefault(domain, _SegmentNode())
+
+            for is_dynamic, data in segments:
+                if is_dynamic:
+                    if data not in node.dynamic:
+                        node.dynamic[data] = (re.compile(data), _SegmentNode())
+
+                    node = node.dynamic[data][1]
+                else:
+                    node = node.static.setdefault(data, _SegmentNode())
+
+            node.rules.append(index)
+
+        # Replace everything at once, the map may be matched concurrently.
+        self._rules = rules
+        self._index = (rules, static_domains, dynamic_domain)
+
+    def match_candidates(self, domain_part: str, path_part: str) -> Iterable[Rule]:
+        rules, static_domains, dynamic_domain = self._index
+        segments = [segment for segment in path_part.split("/") if segment]
+        depth = len(segments)
+        stack = [(dynamic_domain, 0)]
+        found = []
+
+        if domain_part in static_domains:
+            stack.append((static_domains[domain_part], 0))
+
+        while stack:
+            node, pos = stack.pop()
+            found.extend(node.rules)
+
+            if pos == depth:
+                continue
+
+            segment = segments[pos]
+
+            if segment in node.static:
+                stack.append((node.static[segment], pos + 1))
+
+            for pattern, child in node.dynamic.values():
+                if pattern.fullmatch(segment) is not None:
+                    stack.append((child, pos + 1))
+
+        found.sort()
+        return [rules[index] for index in found]
+
+
+_named_group_re = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+
+def _combine_patterns(rules: List[Rule]) -> Optional[Pattern]:
+    """Combine the regexes of the rules into one alternation. Named
+    groups are made non-capturing so that names don't clash. Returns
+    ``None`` if the rules can't be combined.
+
+    :internal:
+    """
+    parts = []
+
+    for rule in rules:
+        pattern = rule._regex.pattern
+
+        if not (pattern.startswith("^") and pattern.endswith("$")):
+            return None
+
+        parts.append(_named_group_re.sub("(?:", pattern[1:-1]))
+
+    try:
+        return re.compile(f"^(?:{'|'.join(parts)})$")
+    except re.error:
+        return None
+
+
+class RegexMatcher(RuleMatcher):
+    """Combines the regexes of the rules into larger regexes so that the
+    regex engine skips over rules that don't match, instead of trying
+    each rule's regex from Python. Matching continues from the first
+    rule of the combined regex that matched, so results are the same as
+    with the default :class:`RuleMatcher`.
+
+    Each combined regex covers :attr:`block_size` rules. The regexes
+    don't capture which rule matched, as CPython's regex engine gets
+    much slower when it has to track thousands of groups.
+
+    The regexes are compiled, on first use, for each static domain part
+    (subdomain or host) used by the rules, along with one for any other
+    domain part. They are discarded only when the map's rules change.
+
+    .. code-block:: python
+
+        class RegexMap(Map):
+            matcher_class = RegexMatcher
+
+    .. versionadded:: 2.0
+    """
+
+    #: The number of rules to combine into each regex.
+    block_size = 64
+
+    def __init__(self, map: "Map") -> None:
+        super().__init__(map)
+        self._index: Tuple[
+            List[Rule],
+            Dict[str, List[int]],
+            List[int],
+            Dict[
+                Optional[str],
+                Tuple[List[Rule], List[Tuple[int, Optional[Pattern]]]],
+            ],
+        ] = ([], {}, [], {})
+
+    def update(self, rules: List[Rule]) -> None:
+        rules = [rule for rule in rules if not rule.build_only]
+        static_domains: Dict[str, List[int]] = {}
+        dynamic_domain = []
+
+        for index, rule in enumerate(rules):
+            domain, _ = _rule_segments(rule)
+
+            if domain is None:
+                dynamic_domain.append(index)
+            else:
+                static_domains.setdefault(domain, []).append(index)
+
+        # Replace everything at once, the map may be matched concurrently.
+        self._rules = rules
+        self._index = (rules, static_domains, dynamic_domain, {})
+
+    def _compile_domain(
+        self, rules: List[Rule]
+    ) -> Tuple[List[Rule], List[Tuple[int, Optional[Pattern]]]]:
+        blocks: List[Tuple[int, Optional[Pattern]]] = []
+
+        for start in range(0, len(rules), self.block_size):
+            pattern = _combine_patterns(rules[start : start + self.block_size])
+
+            # If the rules couldn't be combined, for example because a
+            # converter uses a backreference, try every rule from here.
+            if pattern is None:
+                blocks.append((start, None))
+                break
+
+            blocks.append((start, pattern))
+
+        return rules, blocks
+
+    def match_candidates(self, domain_part: str, path_part: str) -> Iterable[Rule]:
+        rules, static_domains, dynamic_domain, domains = self._index
+        key = domain_part if domain_part in static_domains else None
+
+        if key not in domains:
+            indexes = sorted(static_domains.get(key, []) + dynamic_domain)
+            domains[key] = self._compile_domain([rules[index] for index in indexes])
+
+        domain_rules, blocks = domains[key]
+        path = f"{domain_part}|{path_part}"
+
+        for start, pattern in blocks:
+            if pattern is None or pattern.match(path) is not None:
+                return domain_rules[start:]
+
+        return ()
+
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUCache:
+    """A thread safe cache that holds up to ``maxsize`` items, discarding
+    the least recently used item when it's full.
+
+    :internal:
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or ``None`` if it isn't cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> _CacheInfo:
+        return _CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
 class Map:
     """The map class stores all the URL rules and some configuration
     parameters.  Some of the configuration values are only stored on the
@@ -1448,6 +1871,15 @@ class Map:
                           feature and disables the subdomain one.  If
                           enabled the `host` parameter to rules is used
                           instead of the `subdomain` one.
+    :param match_cache_size: Cache the results of up to this many
+        successful matches, and of matches that raised
+        :exc:`~werkzeug.exceptions.MethodNotAllowed`, by domain part,
+        path, method, and WebSocket. The least recently used result is
+        discarded when the cache is full. The cache is cleared when the
+        rules change. See :meth:`match_cache_info`.
+
+    .. versionchanged:: 2.0
+        Added ``match_cache_size``.
 
     .. versionchanged:: 1.0
         If ``url_scheme`` is ``ws`` or ``wss``, only WebSocket rules
@@ -1471,6 +1903,20 @@ class Map:
     #: .. versionadded:: 1.0
     lock_class = Lock
 
+    #: The :class:`RuleMatcher` used to find the rules that could match
+    #: a request. :class:`TrieMatcher` or :class:`RegexMatcher` can be
+    #: used for maps with many rules.
+    #:
+    #: .. versionadded:: 2.0
+    matcher_class = RuleMatcher
+
+    #: The maximum number of entries in the cache of rules to try when
+    #: building a URL for an endpoint with a set of argument names. The
+    #: cache is emptied when it's full.
+    #:
+    #: .. versionadded:: 2.0
+    build_cache_size = 1024
+
     def __init__(
         self,
         rules: Optional[Union[List[RuleTemplateFactory], List[Rule]]] = None,
@@ -1484,11 +1930,15 @@ class Map:
         sort_key: Optional[Callable] = None,
         encoding_errors: str = "replace",
         host_matching: bool = False,
+        match_cache_size: int = 0,
     ) -> None:
         self._rules: List[Any] = []
         self._rules_by_endpoint: Dict[Hashable, Any] = {}
         self._remap = True
         self._remap_lock = self.lock_class()
+        self._matcher = self.matcher_class(self)
+        self._match_cache = _LRUCache(match_cache_size) if match_cache_size else None
+        self._build_cache: Dict[Hashable, Tuple[Rule, ...]] = {}
 
         self.default_subdomain = default_subdomain
         self.charset = charset
@@ -1528,6 +1978,18 @@ class Map:
                 return True
         return False
 
+    def match_cache_info(self) -> Optional[_CacheInfo]:
+        """Return a named tuple of ``hits``, ``misses``, ``maxsize``,
+        and ``currsize`` for the match cache, or ``None`` if the map
+        has no match cache.
+
+        .. versionadded:: 2.0
+        """
+        if self._match_cache is None:
+            return None
+
+        return self._match_cache.info()
+
     def iter_rules(self, endpoint=None):
         """Iterate over all rules or the rules of an endpoint.
 
@@ -1540,6 +2002,55 @@ class Map:
             return iter(self._rules_by_endpoint[endpoint])
         return iter(self._rules)
 
+    def _build_candidates(
+        self, endpoint: Hashable, values: Dict[str, Any], method: Optional[str]
+    ) -> Iterable[Rule]:
+        """Return the rules for the endpoint that could build a URL for
+        the argument names and method. The result is cached, as it
+        doesn't depend on the values. :meth:`Rule.suitable_for` still
+        needs to be checked against the values.
+
+        :internal:
+        """
+        rules = self._rules_by_endpoint.get(endpoint, ())
+
+        # There's nothing to skip if the endpoint has a single rule.
+        if len(rules) < 2:
+            return rules
+
+        key = (endpoint, frozenset(values), method)
+
+        try:
+            return self._build_cache[key]
+        except KeyError:
+            pass
+
+        rv = []
+
+        for rule in rules:
+            # Only rule classes that don't change suitable_for can be
+            # filtered by argument names.
+            if type(rule).suitable_for is Rule.suitable_for:
+                if (
+                    method is not None
+                    and rule.methods is not None
+                    and method not in rule.methods
+                ):
+                    continue
+
+                defaults = rule.defaults or ()
+
+                if any(k not in defaults and k not in values for k in rule.arguments):
+                    continue
+
+            rv.append(rule)
+
+        if len(self._build_cache) >= self.build_cache_size:
+            self._build_cache.clear()
+
+        self._build_cache[key] = rv = tuple(rv)
+        return rv
+
     def add(self, rulefactory: Union[Rule, RuleTemplateFactory]) -> None:
         """Add a new rule or factory to the map and bind it.  Requires that the
         rule is not bound to another map.
@@ -1731,6 +2242,13 @@ class Map:
             self._rules.sort(key=lambda x: x.match_compare_key())
             for rules in self._rules_by_endpoint.values():
                 rules.sort(key=lambda x: x.build_compare_key())
+            self._matcher.update(self._rules)
+
+            if self._match_cache is not None:
+                self._match_cache.clear()
+
+            self._build_cache.clear()
+
             self._remap = False
 
     def __repr__(self) -> str:
@@ -1943,8 +2461,25 @@ class MapAdapter:
 
         have_match_for = set()
         websocket_mismatch = False
+        cache = self.map._match_cache
+        cacheable = cache is not None
+
+        if cacheable:
+            cache_key = (path, method, websocket)
+            cached = cache.get(cache_key)
+
+            if cached is not None:
+                rule, rv = cached
+
+                if rule is None:
+                    raise MethodNotAllowed(valid_methods=list(rv))
+
+                if return_rule:
+                    return rule, dict(rv)
+                else:
+                    return rule.endpoint, dict(rv)
 
-        for rule in self.map._rules:
+        for rule in self.map._matcher.match_candidates(domain_part, path_part):
             try:
                 rv = rule.match(path, method)
             except RequestPath as e:
@@ -1964,6 +2499,16 @@ class MapAdapter:
                         query_args,  # type: ignore
                     )
                 )
+
+            # Don't cache the result if a converter that isn't cacheable
+            # was called, which happens if the rule's regex matched.
+            if (
+                cacheable
+                and not rule._cacheable
+                and (rv is not None or rule._regex.search(path) is not None)
+            ):
+                cacheable = False
+
             if rv is None:
                 continue
             if rule.methods is not None and method not in rule.methods:
@@ -2011,12 +2556,18 @@ class MapAdapter:
                     )
                 )
 
+            if cacheable:
+                cache.set(cache_key, (rule, dict(rv)))
+
             if return_rule:
                 return rule, rv
             else:
                 return rule.endpoint, rv
 
         if have_match_for:
+            if cacheable:
+                cache.set(cache_key, (None, frozenset(have_match_for)))
+
             raise MethodNotAllowed(valid_methods=list(have_match_for))
 
         if websocket_mismatch:
@@ -2166,7 +2717,7 @@ class MapAdapter:
         # host is found, go with first result.
         first_match = None
 
-        for rule in self.map._rules_by_endpoint.get(endpoint, ()):
+        for rule in self.map._build_candidates(endpoint, values, method):
             if rule.suitable_for(values, method):
                 rv = rule.build(values, append_unknown)
 
@@ -2263,13 +2814,85 @@ class MapAdapter:
            Added the ``append_unknown`` parameter.
         """
         self.map.update()
+        return self._build_url(
+            endpoint, values, method, force_external, append_unknown, url_scheme, None
+        )
+
+    def build_many(
+        self,
+        builds: Iterable[Tuple[str, Optional[Any]]],
+        method: Optional[str] = None,
+        force_external: bool = False,
+        append_unknown: bool = True,
+        url_scheme: Optional[str] = None,
+    ) -> List[str]:
+        """Build a URL for each ``(endpoint, values)`` pair. This is
+        the same as calling :meth:`build` for each pair with the other
+        arguments, but the host and script root of each domain are only
+        computed once.
+
+        >>> m = Map([
+        ...     Rule('/', endpoint='index'),
+        ...     Rule('/downloads/<int:id>', endpoint='downloads/show')
+        ... ])
+        >>> urls = m.bind("example.com", "/")
+        >>> urls.build_many([("index", None), ("downloads/show", {"id": 42})])
+        ['/', '/downloads/42']
+
+        :param builds: An iterable of ``(endpoint, values)`` pairs.
+        :param method: The HTTP method for the rules.
+        :param force_external: Build full canonical external URLs.
+        :param append_unknown: Append unknown values as query string
+            arguments.
+        :param url_scheme: Scheme to use in place of the bound
+            :attr:`url_scheme`.
+
+        .. versionadded:: 2.0
+        """
+        self.map.update()
+        prefixes: Dict[Tuple[Optional[str], bool], str] = {}
+        return [
+            self._build_url(
+                endpoint,
+                values,
+                method,
+                force_external,
+                append_unknown,
+                url_scheme,
+                prefixes,
+            )
+            for endpoint, values in builds
+        ]
 
+    def _build_url(
+        self,
+        endpoint: str,
+        values: Optional[Any],
+        method: Optional[str],
+        force_external: bool,
+        append_unknown: bool,
+        url_scheme: Optional[str],
+        prefixes: Optional[Dict[Tuple[Optional[str], bool], str]],
+    ) -> str:
+        """Helper for :meth:`build` and :meth:`build_many`. If
+        ``prefixes`` is given, the part of the URL before the path is
+        stored in it for each domain part, to be reused by later calls
+        with the same arguments.
+
+        :internal:
+        """
         if values:
             if isinstance(values, MultiDict):
-                temp_values = {}
+                temp_values: Dict[Any, Any] = {}
                 # dict.items(values) is like `values.lists()`
-                # without the call or `list()` coercion overhead.
-                for key, value in dict.items(values):
+                # without the call or `list()` coercion overhead, but
+                # only if the subclass keeps the lists in the dict.
+                items: Iterable[Tuple[Hashable, List[Any]]]
+                if type(values).lists is MultiDict.lists:
+                    items = dict.items(values)
+                else:
+                    items = values.lists()
+                for key, value in items:
                     if not value:
                         continue
                     if len(value) == 1:  # flatten single item lists
@@ -2289,6 +2912,10 @@ class MapAdapter:
             raise BuildError(endpoint, values, method, self)
 
         domain_part, path, websocket = rv
+
+        if prefixes is not None and (domain_part, websocket) in prefixes:
+            return f"{prefixes[domain_part, websocket]}/{path.lstrip('/')}"
+
         host = self.get_host(domain_part)
 
         if url_scheme is None:
@@ -2310,7 +2937,12 @@ class MapAdapter:
             (self.map.host_matching and host == self.server_name)
             or (not self.map.host_matching and domain_part == self.subdomain)
         ):
-            return f"{self.script_name.rstrip('/')}/{path.lstrip('/')}"
+            prefix = self.script_name.rstrip("/")
+        else:
+            scheme = f"{url_scheme}:" if url_scheme else ""
+            prefix = f"{scheme}//{host}{self.script_name[:-1]}"
+
+        if prefixes is not None:
+            prefixes[domain_part, websocket] = prefix
 
-        scheme = f"{url_scheme}:" if url_scheme else ""
-        return f"{scheme}//{host}{self.script_name[:-1]}/{path.lstrip('/')}"
+        return f"{prefix}/{path.lstrip('/')}"
@@ -11,22 +11,37 @@ It provides features like interactive debugging and code reloading. Use
     from myapp import create_app
     from werkzeug import run_simple
 """
+import asyncio
+import bisect
 import io
+import json
 import os
 import platform
+import queue
 import signal
 import socket
 import socketserver
+import stat
 import sys
+import threading
+import time
+import traceback
 import warnings
+from concurrent.futures import CancelledError
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
 from datetime import timedelta
 from http.server import BaseHTTPRequestHandler
 from http.server import HTTPServer
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import IO
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import Union
@@ -37,12 +52,16 @@ if TYPE_CHECKING:
     from cryptography.hazmat.backends.openssl.x509 import _Certificate  # noqa: F401
 from werkzeug.types import WSGIEnvironment
 
+from ._internal import _header_environ_key
 from ._internal import _log
 from ._internal import _wsgi_encoding_dance
 from .exceptions import InternalServerError
 from .urls import uri_to_iri
 from .urls import url_parse
 from .urls import url_unquote
+from .wsgi import _RangeWrapper
+from .wsgi import FileWrapper
+from .wsgi import LimitedStream
 
 try:
     import ssl
@@ -85,6 +104,7 @@ class DechunkedInput(io.RawIOBase):
         self._rfile = rfile
         self._done = False
         self._len = 0
+        self._pos = 0
 
     def readable(self) -> bool:
         return True
@@ -128,12 +148,80 @@ class DechunkedInput(io.RawIOBase):
                 if terminator not in (b"\n", b"\r\n", b"\r"):
                     raise OSError("Missing chunk terminating newline")
 
+        self._pos += read
         return read
 
 
+class _SendfileWrapper(FileWrapper):
+    """The ``wsgi.file_wrapper`` of the development server. If the
+    application returns it unchanged, the file is sent with
+    :meth:`socket.socket.sendfile` instead of being iterated.
+    """
+
+
+def _get_file_range(
+    app_iter: Any,
+) -> Optional[Tuple[IO[bytes], int, Optional[int]]]:
+    """Return the file, offset and number of bytes to send if the
+    application returned a :class:`_SendfileWrapper` that wasn't read
+    yet, optionally wrapped for a range request. ``None`` means the
+    rest of the file.
+    """
+    offset = None
+    count = None
+
+    if isinstance(app_iter, _RangeWrapper):
+        if app_iter.read_length or not app_iter.seekable:
+            return None
+
+        offset = app_iter.start_byte
+        count = app_iter.byte_range
+        app_iter = app_iter.iterable
+
+    if not isinstance(app_iter, _SendfileWrapper):
+        return None
+
+    file = app_iter.file
+
+    try:
+        if not stat.S_ISREG(os.fstat(file.fileno()).st_mode):
+            return None
+
+        if offset is None:
+            offset = file.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    return file, offset, count
+
+
 class WSGIRequestHandler(BaseHTTPRequestHandler):
 
-    """A request handler that implements WSGI dispatching."""
+    """A request handler that implements WSGI dispatching.
+
+    .. versionchanged:: 2.0
+        Threaded and multi process servers use HTTP/1.1. Connections
+        are kept alive between requests, and responses without a
+        ``Content-Length`` use chunked transfer encoding. A connection
+        is closed if more than :attr:`keep_alive_max_skip` bytes of the
+        request body were not read by the application.
+    """
+
+    #: How long to wait for the next request on a kept alive
+    #: connection, in seconds.
+    keep_alive_timeout: Optional[float] = 5
+
+    #: The most bytes of a request body the application didn't read
+    #: that are skipped to keep the connection alive.  If more is left,
+    #: the connection is closed instead.
+    keep_alive_max_skip = 64 * 1024
+
+    #: Buffer the response, so the status line, the headers and the
+    #: start of the body are sent together.  :meth:`run_wsgi` flushes
+    #: after every write of the application.
+    wbufsize = io.DEFAULT_BUFFER_SIZE
+
+    _keep_alive = False
 
     @property
     def server_version(self) -> str:  # type: ignore
@@ -141,8 +229,25 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
 
         return f"Werkzeug/{__version__}"
 
+    @property
+    def disable_nagle_algorithm(self) -> bool:  # type: ignore
+        # Send every flushed part of a response right away instead of
+        # waiting until the client acknowledged the previous one. Unix
+        # sockets don't have the option.
+        return self.request.family != af_unix  # type: ignore
+
+    @property
+    def protocol_version(self) -> str:  # type: ignore
+        """HTTP/1.1 if other connections are handled while one is kept
+        alive, which is the case for threaded and multi process servers.
+        Set this in a subclass to always use one version.
+        """
+        if self.server.multithread or self.server.multiprocess:  # type: ignore
+            return "HTTP/1.1"
+
+        return "HTTP/1.0"
+
     def make_environ(self) -> WSGIEnvironment:
-        request_url = url_parse(self.path)
 
         def shutdown_server():
             warnings.warn(
@@ -162,15 +267,34 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
         else:
             pass
 
-        # If there was no scheme but the path started with two slashes,
-        # the first segment may have been incorrectly parsed as the
-        # netloc, prepend it to the path again.
-        if not request_url.scheme and request_url.netloc:
-            path_info = f"/{request_url.netloc}{request_url.path}"
+        request_uri = self.path
+        host = None
+
+        if request_uri[:1] == "/" and request_uri[:2] != "//":
+            # The common case, a path with an optional query string.
+            # Split it by hand, the result is the same as url_parse.
+            path_info, _, query = request_uri.partition("#")[0].partition("?")
         else:
-            path_info = request_url.path
+            request_url = url_parse(request_uri)
+            query = request_url.query  # type: ignore
+
+            # Per RFC 2616, if the URL is absolute, use that as the host.
+            # We're using "has a scheme" to indicate an absolute URL.
+            if request_url.scheme and request_url.netloc:
+                host = request_url.netloc
+
+            # If there was no scheme but the path started with two
+            # slashes, the first segment may have been incorrectly
+            # parsed as the netloc, prepend it to the path again.
+            if not request_url.scheme and request_url.netloc:
+                path_info = f"/{request_url.netloc}{request_url.path}"
+            else:
+                path_info = request_url.path  # type: ignore
+
+        if "%" in path_info:
+            path_info = url_unquote(path_info)  # type: ignore
 
-        path_info = url_unquote(path_info)  # type: ignore
+        raw_uri = _wsgi_encoding_dance(request_uri)
 
         environ = {
             "wsgi.version": (1, 0),
@@ -180,16 +304,17 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
             "wsgi.multithread": self.server.multithread,  # type: ignore
             "wsgi.multiprocess": self.server.multiprocess,  # type: ignore
             "wsgi.run_once": False,
+            "wsgi.file_wrapper": _SendfileWrapper,
             "werkzeug.server.shutdown": shutdown_server,
             "SERVER_SOFTWARE": self.server_version,
             "REQUEST_METHOD": self.command,
             "SCRIPT_NAME": "",
             "PATH_INFO": _wsgi_encoding_dance(path_info),
-            "QUERY_STRING": _wsgi_encoding_dance(request_url.query),
+            "QUERY_STRING": _wsgi_encoding_dance(query),
             # Non-standard, added by mod_wsgi, uWSGI
-            "REQUEST_URI": _wsgi_encoding_dance(self.path),
+            "REQUEST_URI": raw_uri,
             # Non-standard, added by gunicorn
-            "RAW_URI": _wsgi_encoding_dance(self.path),
+            "RAW_URI": raw_uri,
             "REMOTE_ADDR": self.address_string(),
             "REMOTE_PORT": self.port_integer(),
             "SERVER_NAME": self.server.server_address[0],
@@ -197,23 +322,35 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
             "SERVER_PROTOCOL": self.request_version,
         }
 
-        for key, value in self.headers.items():
-            key = key.upper().replace("-", "_")
+        # The headers were decoded as latin-1, so items() would return
+        # the same values, only slower.
+        for key, value in self.headers.raw_items():
+            key = _header_environ_key(key)
             value = value.replace("\r\n", "")
-            if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
-                key = f"HTTP_{key}"
-                if key in environ:
-                    value = f"{environ[key]},{value}"
+            if key in environ and key[:5] == "HTTP_":
+                value = f"{environ[key]},{value}"
             environ[key] = value
 
         if environ.get("HTTP_TRANSFER_ENCODING", "").strip().lower() == "chunked":
             environ["wsgi.input_terminated"] = True
             environ["wsgi.input"] = DechunkedInput(environ["wsgi.input"])
+        elif self.protocol_version >= "HTTP/1.1":
+            # Don't let the application read into the next request on a
+            # kept alive connection.
+            try:
+                content_length = max(0, int(environ.get("CONTENT_LENGTH", 0)))
+            except ValueError:
+                self.close_connection = True
+            else:
+                environ["wsgi.input_terminated"] = True
+                environ["wsgi.input"] = LimitedStream(self.rfile, content_length)
+
+        if host is not None:
+            environ["HTTP_HOST"] = host
 
-        # Per RFC 2616, if the URL is absolute, use that as the host.
-        # We're using "has a scheme" to indicate an absolute URL.
-        if request_url.scheme and request_url.netloc:
-            environ["HTTP_HOST"] = request_url.netloc
+        if self.server.ssl_context is None:  # type: ignore
+            # Not using TLS, there is no peer certificate.
+            return environ
 
         try:
             # binary_form=False gives nicer information, but wouldn't be compatible with
@@ -236,12 +373,21 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
     def run_wsgi(self) -> None:
         if self.headers.get("Expect", "").lower().strip() == "100-continue":
             self.wfile.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            self.wfile.flush()
 
         self.environ = environ = self.make_environ()
+        metrics = self.server.metrics  # type: ignore
+        metrics.request_started()
+        start = time.perf_counter()
+        time_to_first_byte = None
+        status_code = 0
+        bytes_out = 0
         headers_set: List[Any] = []
         headers_sent: List[Any] = []
+        chunk_response = False
 
         def write(data):
+            nonlocal chunk_response, time_to_first_byte, status_code, bytes_out
             assert headers_set, "write() before start_response"
             if not headers_sent:
                 status, response_headers = headers_sent[:] = headers_set
@@ -249,29 +395,61 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
                     code, msg = status.split(None, 1)
                 except ValueError:
                     code, msg = status, ""
-                code = int(code)
+                code = status_code = int(code)
                 self.send_response(code, msg)
                 header_keys = set()
                 for key, value in response_headers:
                     self.send_header(key, value)
                     key = key.lower()
                     header_keys.add(key)
+                stream = environ["wsgi.input"]
+                if (
+                    isinstance(stream, LimitedStream)
+                    and stream.limit - stream._pos > self.keep_alive_max_skip
+                ):
+                    # The body won't be skipped, tell the client.
+                    self.close_connection = True
                 if not (
                     "content-length" in header_keys
                     or environ["REQUEST_METHOD"] == "HEAD"
                     or code < 200
                     or code in (204, 304)
                 ):
-                    self.close_connection = True
-                    self.send_header("Connection", "close")
+                    if (
+                        "transfer-encoding" not in header_keys
+                        and self.protocol_version >= "HTTP/1.1"
+                        and self.request_version >= "HTTP/1.1"
+                    ):
+                        chunk_response = True
+                        self.send_header("Transfer-Encoding", "chunked")
+                    else:
+                        self.close_connection = True
+                        self.send_header("Connection", "close")
+                        header_keys.add("connection")
+                if "connection" not in header_keys:
+                    if self.close_connection:
+                        if self.protocol_version >= "HTTP/1.1":
+                            self.send_header("Connection", "close")
+                    elif self.request_version < "HTTP/1.1":
+                        # An HTTP/1.0 client asked to keep the connection
+                        # alive, it only does if the server agrees.
+                        self.send_header("Connection", "keep-alive")
                 if "server" not in header_keys:
                     self.send_header("Server", self.version_string())
                 if "date" not in header_keys:
                     self.send_header("Date", self.date_time_string())
                 self.end_headers()
+                time_to_first_byte = time.perf_counter() - start
 
             assert isinstance(data, bytes), "applications must write bytes"
-            self.wfile.write(data)
+            if data:
+                bytes_out += len(data)
+                if chunk_response:
+                    self.wfile.write(b"%x\r\n" % len(data))
+                    self.wfile.write(data)
+                    self.wfile.write(b"\r\n")
+                else:
+                    self.wfile.write(data)
             self.wfile.flush()
 
         def start_response(status, response_headers, exc_info=None):
@@ -287,21 +465,42 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
             return write
 
         def execute(app):
+            nonlocal bytes_out
             application_iter = app(environ, start_response)
             try:
-                for data in application_iter:
-                    write(data)
+                file_range = None
+                if headers_set:
+                    file_range = _get_file_range(application_iter)
+                if file_range is not None:
+                    write(b"")
+                if file_range is not None and not chunk_response:
+                    bytes_out += self.connection.sendfile(*file_range)
+                else:
+                    for data in application_iter:
+                        write(data)
                 if not headers_sent:
                     write(b"")
+                if chunk_response:
+                    self.wfile.write(b"0\r\n\r\n")
+                    self.wfile.flush()
             finally:
                 if hasattr(application_iter, "close"):
                     application_iter.close()
 
+        if environ["PATH_INFO"] == self.server.metrics_path:  # type: ignore
+            app = metrics
+        else:
+            app = self.server.app  # type: ignore
+
         try:
-            execute(self.server.app)  # type: ignore
+            execute(app)
         except (ConnectionError, socket.timeout) as e:
+            self.close_connection = True
             self.connection_dropped(e, environ)
         except Exception:
+            # A response that was started can't be finished properly.
+            self.close_connection = True
+
             if self.server.passthrough_errors:  # type: ignore
                 raise
             from .debug.tbtools import get_current_traceback
@@ -319,8 +518,62 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
                 "error", "Error on request:\n%s", traceback.plaintext
             )
 
+        if self.protocol_version < "HTTP/1.1":
+            self.close_connection = True
+
+        stream = environ["wsgi.input"]
+
+        if not self.close_connection:
+            # Skip the rest of a short body so the next request can be
+            # read, reading a large one would take longer than a new
+            # connection.
+            left = self.keep_alive_max_skip
+
+            try:
+                if isinstance(stream, LimitedStream):
+                    if stream.limit - stream._pos > left:
+                        self.close_connection = True
+                    else:
+                        stream.exhaust()
+                else:
+                    while True:
+                        data = stream.read(min(left + 1, 64 * 1024))
+
+                        if not data:
+                            break
+
+                        left -= len(data)
+
+                        if left < 0:
+                            self.close_connection = True
+                            break
+            except Exception:
+                self.close_connection = True
+
+        if isinstance(stream, (LimitedStream, DechunkedInput)):
+            bytes_in = stream._pos
+        else:
+            # HTTP/1.0 without a limited stream, count the declared size.
+            try:
+                bytes_in = max(0, int(environ.get("CONTENT_LENGTH", 0)))
+            except ValueError:
+                bytes_in = 0
+
+        metrics.request_finished(
+            RequestMetrics(
+                environ["REQUEST_METHOD"],
+                environ["PATH_INFO"],
+                status_code,
+                bytes_in,
+                bytes_out,
+                time_to_first_byte,
+                time.perf_counter() - start,
+            )
+        )
+
     def handle(self) -> None:
         """Handles a request ignoring dropped connections."""
+        self.server.metrics.connection_opened()  # type: ignore
         try:
             BaseHTTPRequestHandler.handle(self)
         except (ConnectionError, socket.timeout) as e:
@@ -328,6 +581,8 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
         except Exception as e:
             if self.server.ssl_context is None or not is_ssl_error(e):  # type: ignore
                 raise
+        finally:
+            self.server.metrics.connection_closed()  # type: ignore
         if self.server.shutdown_signal:  # type: ignore
             self.initiate_shutdown()
 
@@ -349,19 +604,32 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
     def handle_one_request(self) -> None:
         """Handle a single HTTP request."""
         self.raw_requestline = self.rfile.readline()
+
+        if self._keep_alive:
+            # The next request arrived, restore the normal timeout.
+            self.connection.settimeout(self.timeout)
+            self._keep_alive = False
+
         if not self.raw_requestline:
             self.close_connection = 1  # type: ignore
         elif self.parse_request():
-            return self.run_wsgi()
+            self.run_wsgi()
+
+            if not self.close_connection:
+                self.connection.settimeout(self.keep_alive_timeout)
+                self._keep_alive = True
 
     def send_response(self, code, message=None) -> None:
-        """Send the response header and log the response code."""
+        """Add the status line to the header buffer and log the response
+        code.
+
+        .. versionchanged:: 2.0
+            The status line is sent together with the headers.
+        """
         self.log_request(code)
         if message is None:
             message = self.responses[code][0] if code in self.responses else ""
-        if self.request_version != "HTTP/0.9":
-            hdr = f"{self.protocol_version} {code} {message}\r\n"
-            self.wfile.write(hdr.encode("ascii"))
+        self.send_response_only(code, message)
 
     def version_string(self) -> str:
         return BaseHTTPRequestHandler.version_string(self).strip()
@@ -592,6 +860,167 @@ def get_sockaddr(host, port, family):
     return res[0][4]
 
 
+class RequestMetrics(NamedTuple):
+    """The measurements of one request, passed to
+    :attr:`ServerMetrics.on_request`.
+
+    .. versionadded:: 2.0
+    """
+
+    #: The request method.
+    method: str
+    #: The requested path, ``PATH_INFO``.
+    path: str
+    #: The response status code, 0 if no response was sent.
+    status: int
+    #: Request body bytes read from the connection.
+    bytes_in: int
+    #: Response body bytes sent.
+    bytes_out: int
+    #: Seconds until the status line and headers were sent, ``None``
+    #: if no response was sent.
+    time_to_first_byte: Optional[float]
+    #: Seconds until the response was finished.
+    total_time: float
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+            "sum": self.sum,
+        }
+
+
+class ServerMetrics:
+    """Counters and latency histograms of a :class:`BaseWSGIServer`,
+    available as its ``metrics`` attribute. Read them with
+    :meth:`snapshot`, or set :attr:`on_request` to get the measurements
+    of every request.
+
+    The object is also a WSGI application that responds with the
+    snapshot as JSON, see the ``expose_metrics`` parameter of
+    :func:`run_simple`.
+
+    Every process counts the requests it handled itself. For servers
+    that fork, the metrics are per worker process, and the metrics of
+    processes that handle a single request are lost.
+
+    .. versionadded:: 2.0
+    """
+
+    #: The upper bounds of the latency histogram buckets, in seconds.
+    #: A last bucket counts anything slower.
+    buckets: Tuple[float, ...] = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        #: Called with a :class:`RequestMetrics` after every request, in
+        #: the thread that handled it.
+        self.on_request: Optional[Callable[[RequestMetrics], None]] = None
+        self.active_connections = 0
+        self.rejected_connections = 0
+        self.queue_depth = 0
+        self.requests_in_flight = 0
+        self.requests = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.time_to_first_byte = _Histogram(self.buckets)
+        self.total_time = _Histogram(self.buckets)
+
+    def _count(self, name: str, value: int) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def connection_opened(self) -> None:
+        self._count("active_connections", 1)
+
+    def connection_closed(self) -> None:
+        self._count("active_connections", -1)
+
+    def connection_rejected(self) -> None:
+        self._count("rejected_connections", 1)
+
+    def queued(self) -> None:
+        self._count("queue_depth", 1)
+
+    def dequeued(self) -> None:
+        self._count("queue_depth", -1)
+
+    def request_started(self) -> None:
+        self._count("requests_in_flight", 1)
+
+    def request_finished(self, request: RequestMetrics) -> None:
+        with self._lock:
+            self.requests_in_flight -= 1
+            self.requests += 1
+            self.bytes_in += request.bytes_in
+            self.bytes_out += request.bytes_out
+            self.total_time.observe(request.total_time)
+
+            if request.time_to_first_byte is not None:
+                self.time_to_first_byte.observe(request.time_to_first_byte)
+
+        if self.on_request is not None:
+            self.on_request(request)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current values as a dict that can be serialized
+        as JSON. ``queue_depth`` is the number of connections or
+        requests waiting for a worker thread in the thread pool and
+        asyncio servers. The histograms have a count for each bucket,
+        plus one for anything slower, and the sum of all values.
+        """
+        with self._lock:
+            return {
+                "active_connections": self.active_connections,
+                "rejected_connections": self.rejected_connections,
+                "queue_depth": self.queue_depth,
+                "requests_in_flight": self.requests_in_flight,
+                "requests": self.requests,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "time_to_first_byte": self.time_to_first_byte.to_dict(),
+                "total_time": self.total_time.to_dict(),
+            }
+
+    def __call__(
+        self, environ: WSGIEnvironment, start_response: Callable
+    ) -> List[bytes]:
+        body = json.dumps(self.snapshot()).encode()
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "application/json"),
+                ("Content-Length", str(len(body))),
+                ("Cache-Control", "no-store"),
+            ],
+        )
+        return [body]
+
+
 class BaseWSGIServer(HTTPServer):
 
     """Simple single-threaded, single-process WSGI server."""
@@ -600,6 +1029,11 @@ class BaseWSGIServer(HTTPServer):
     multiprocess: bool = False
     request_queue_size: int = LISTEN_QUEUE
 
+    #: Requests for this path are answered by :attr:`metrics` instead
+    #: of the application. ``expose_metrics`` of :func:`run_simple`
+    #: sets it to ``/__werkzeug__/metrics``.
+    metrics_path: Optional[str] = None
+
     def __init__(
         self,
         host: str,
@@ -629,6 +1063,7 @@ class BaseWSGIServer(HTTPServer):
         self.app = app
         self.passthrough_errors = passthrough_errors
         self.shutdown_signal = False
+        self.metrics = ServerMetrics()
         self.host = host
         self.port = self.socket.getsockname()[1]
 
@@ -682,6 +1117,129 @@ class ThreadedWSGIServer(socketserver.ThreadingMixIn, BaseWSGIServer):
     daemon_threads: bool = True
 
 
+class ThreadPoolWSGIServer(ThreadedWSGIServer):
+
+    """A threaded WSGI server that handles connections on a bounded pool
+    of worker threads instead of starting a thread for each connection.
+    Workers are started as connections come in and are kept running.
+
+    A worker handles all the requests of a connection, so a connection
+    that is kept alive keeps its worker while it waits for the next
+    request, up to :attr:`WSGIRequestHandler.keep_alive_timeout`.
+    Browsers open up to six connections to a server, which is enough to
+    keep a small pool busy. Use more threads, a lower
+    ``keep_alive_timeout``, or the :class:`AsyncioWSGIServer`, which
+    doesn't use a thread while a connection is idle.
+
+    .. versionadded:: 2.0
+
+    :param threads: The maximum number of worker threads.
+    :param max_queue: The number of accepted connections that may wait
+        for a worker. Connections beyond that are answered with
+        ``503 Service Unavailable``. If not given, the server stops
+        accepting connections while all workers are busy, and further
+        clients wait in the listen backlog.
+    """
+
+    def __init__(
+        self,
+        host,
+        port,
+        app,
+        handler=None,
+        passthrough_errors=False,
+        ssl_context=None,
+        fd=None,
+        threads=8,
+        max_queue=None,
+    ):
+        if threads < 1:
+            raise ValueError("A thread pool needs at least one thread.")
+
+        ThreadedWSGIServer.__init__(
+            self, host, port, app, handler, passthrough_errors, ssl_context, fd
+        )
+        self.threads = threads
+        self.max_queue = max_queue
+        self._queue: queue.Queue = queue.Queue()
+        self._slots = threading.Semaphore(threads + (max_queue or 0))
+        # Guards the workers and the queue together, so a worker that
+        # exits can't leave a connection behind in the queue.
+        self._workers_lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+
+    def process_request(self, request, client_address) -> None:
+        """Queue the connection for a worker thread."""
+        if not self._slots.acquire(blocking=self.max_queue is None):
+            self.metrics.connection_rejected()
+            self.reject_request(request)
+            return
+
+        self.metrics.queued()
+
+        with self._workers_lock:
+            if len(self._workers) < self.threads:
+                self._start_worker()
+
+            self._queue.put((request, client_address))
+
+    def _start_worker(self) -> None:
+        # Must be called with the workers lock held.
+        worker = threading.Thread(target=self._process_requests)
+        worker.daemon = self.daemon_threads
+        self._workers.append(worker)
+        worker.start()
+
+    def reject_request(self, request) -> None:
+        """Answer a connection that doesn't fit into the queue with
+        ``503 Service Unavailable`` and close it.
+        """
+        self.log("warning", "All workers are busy, rejecting a connection.")
+
+        try:
+            request.sendall(
+                b"HTTP/1.0 503 Service Unavailable\r\n"
+                b"Content-Length: 0\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+        except OSError:
+            pass
+
+        self.shutdown_request(request)
+
+    def _process_requests(self) -> None:
+        item = None
+
+        try:
+            while True:
+                item = self._queue.get()
+
+                if item is None:
+                    break
+
+                self.metrics.dequeued()
+
+                try:
+                    self.process_request_thread(*item)
+                finally:
+                    self._slots.release()
+        finally:
+            with self._workers_lock:
+                self._workers.remove(threading.current_thread())
+
+                # If an error ends the worker, start a new one for the
+                # connections that are already waiting.
+                if item is not None and not self._queue.empty():
+                    self._start_worker()
+
+    def server_close(self) -> None:
+        ThreadedWSGIServer.server_close(self)
+
+        with self._workers_lock:
+            for _ in self._workers:
+                self._queue.put(None)
+
+
 class ForkingWSGIServer(ForkingMixIn, BaseWSGIServer):
 
     """A WSGI server that does forking."""
@@ -707,6 +1265,617 @@ class ForkingWSGIServer(ForkingMixIn, BaseWSGIServer):
         self.max_children = processes
 
 
+class PreforkWSGIServer(BaseWSGIServer):
+
+    """A WSGI server that forks a fixed number of long-lived worker
+    processes up front. Each worker accepts connections and handles them
+    one after another, so it keeps its state between requests. The main
+    process restarts workers that exit with an error. If a worker exits
+    cleanly, for example after a shutdown was requested, all workers
+    are stopped.
+
+    Workers accept on the listening socket of the main process, which is
+    the socket passed in by the reloader if ``fd`` is given.
+
+    .. versionadded:: 2.0
+
+    :param processes: The number of worker processes.
+    :param reuse_port: Give each worker its own listening socket with
+        ``SO_REUSEPORT`` so the kernel balances connections between
+        them. The main process only keeps the address bound. Only
+        used for TCP sockets the server binds itself.
+    """
+
+    multiprocess: bool = True
+
+    def __init__(
+        self,
+        host,
+        port,
+        app,
+        processes=4,
+        handler=None,
+        passthrough_errors=False,
+        ssl_context=None,
+        fd=None,
+        reuse_port=False,
+    ):
+        if not can_fork:
+            raise ValueError("Your platform does not support forking.")
+
+        self.reuse_port = (
+            reuse_port
+            and fd is None
+            and hasattr(socket, "SO_REUSEPORT")
+            and select_address_family(host, port) != af_unix
+        )
+        BaseWSGIServer.__init__(
+            self, host, port, app, handler, passthrough_errors, ssl_context, fd
+        )
+        self.processes = processes
+        self._workers: Dict[int, float] = {}
+        self._main_pid = os.getpid()
+
+    def server_bind(self) -> None:
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+        BaseWSGIServer.server_bind(self)
+
+    def server_activate(self) -> None:
+        # With reuse_port, only the workers' sockets listen. Connections
+        # would be stuck in the main process' backlog otherwise.
+        if not self.reuse_port:
+            BaseWSGIServer.server_activate(self)
+
+    def serve_forever(self, poll_interval=0.5) -> None:
+        self._main_pid = os.getpid()
+
+        try:
+            while True:
+                while len(self._workers) < self.processes:
+                    self._start_worker(poll_interval)
+
+                pid, status = os.wait()
+                started = self._workers.pop(pid, None)
+
+                if started is None:
+                    continue
+
+                if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+                    break
+
+                self.log("warning", " * Worker %d died, restarting it", pid)
+
+                # Don't restart workers that fail right away too often.
+                if time.monotonic() - started < 1:
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._stop_workers()
+            self.server_close()
+
+    def service_actions(self) -> None:
+        # Stop a worker if the main process went away, for example
+        # because the reloader restarted it.
+        if os.getppid() != self._main_pid:
+            self._BaseServer__shutdown_request = True  # type: ignore
+
+    def _start_worker(self, poll_interval: float) -> None:
+        pid = os.fork()
+
+        if pid:
+            self._workers[pid] = time.monotonic()
+            return
+
+        status = 1
+
+        try:
+            self._workers.clear()
+
+            if self.reuse_port:
+                self._listen_on_own_socket()
+
+            BaseWSGIServer.serve_forever(self)  # type: ignore
+            status = 0
+        except Exception:
+            self.log("error", "Error in worker:\n%s", traceback.format_exc())
+        finally:
+            os._exit(status)
+
+    def _listen_on_own_socket(self) -> None:
+        sock = socket.socket(self.address_family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(self.server_address)
+        sock.listen(self.request_queue_size)
+
+        if self.ssl_context is not None:
+            sock = self.ssl_context.wrap_socket(sock, server_side=True)
+
+        self.socket.close()
+        self.socket = sock
+
+    def _stop_workers(self) -> None:
+        for pid in self._workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+        for pid in self._workers:
+            try:
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+
+        self._workers.clear()
+
+
+async def _read_request_head(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[bytes, bytes]]:
+    """Read the request line and the header lines of the next request
+    on a connection. Returns ``None`` if the connection was closed.
+    """
+    request_line = await reader.readline()
+
+    if not request_line:
+        return None
+
+    lines = []
+
+    # Stop after one line too many, parse_request reports that.
+    while len(lines) <= 100:
+        line = await reader.readline()
+        lines.append(line)
+
+        if line in (b"\r\n", b"\n", b""):
+            break
+
+    return request_line, b"".join(lines)
+
+
+async def _read(reader: asyncio.StreamReader, size: int) -> bytes:
+    if size < 0:
+        return await reader.read()
+
+    try:
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+
+
+async def _readline(reader: asyncio.StreamReader, size: int) -> bytes:
+    if size < 0:
+        return await reader.readline()
+
+    line = bytearray()
+
+    while len(line) < size:
+        char = await reader.read(1)
+        line += char
+
+        if char in (b"", b"\n"):
+            break
+
+    return bytes(line)
+
+
+async def _write(writer: asyncio.StreamWriter, data: bytes) -> None:
+    writer.write(data)
+    await writer.drain()
+
+
+async def _sendfile(
+    writer: asyncio.StreamWriter,
+    file: IO[bytes],
+    offset: int,
+    count: Optional[int],
+) -> int:
+    await writer.drain()
+    loop = asyncio.get_event_loop()
+
+    if hasattr(loop, "sendfile"):
+        return await loop.sendfile(  # type: ignore
+            writer.transport, file, offset, count
+        )
+
+    # Python 3.6 doesn't have loop.sendfile.
+    file.seek(offset)
+    sent = 0
+
+    while count is None or count > 0:
+        data = file.read(65536 if count is None else min(count, 65536))
+
+        if not data:
+            break
+
+        if count is not None:
+            count -= len(data)
+
+        await _write(writer, data)
+        sent += len(data)
+
+    return sent
+
+
+class _AsyncioConnection:
+    """Stands in for the connection of a request handled by
+    :class:`AsyncioWSGIServer`. The socket belongs to the event loop,
+    so :meth:`sendfile` goes through the loop as well.
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        run: Callable[[Any], Any],
+        connection: Any,
+    ) -> None:
+        self._writer = writer
+        self._run = run
+        self._connection = connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def sendfile(
+        self, file: IO[bytes], offset: int = 0, count: Optional[int] = None
+    ) -> int:
+        return self._run(_sendfile(self._writer, file, offset, count))
+
+
+class _AsyncioInput(io.RawIOBase):
+    """The input stream of a request handled by :class:`AsyncioWSGIServer`.
+    It is read by the thread that runs the application, the event loop
+    does the actual reading. Nothing past ``length`` bytes is read so
+    the next request on the connection stays intact.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        run: Callable[[Any], Any],
+        length: Optional[int] = None,
+    ) -> None:
+        self._reader = reader
+        self._run = run
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def _call(self, coro: Any) -> bytes:
+        data = self._run(coro)
+
+        if self._remaining is not None:
+            self._remaining -= len(data)
+
+        return data
+
+    def _limit(self, size: Optional[int]) -> int:
+        if size is None:
+            size = -1
+
+        if self._remaining is not None and not 0 <= size <= self._remaining:
+            return self._remaining
+
+        return size
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        size = self._limit(size)
+        return self._call(_read(self._reader, size)) if size else b""
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        size = self._limit(size)
+        return self._call(_readline(self._reader, size)) if size else b""
+
+    def readinto(self, buf: Any) -> int:
+        data = self.read(len(buf))
+        buf[: len(data)] = data
+        return len(data)
+
+
+class _AsyncioOutput(io.RawIOBase):
+    """The output stream of a request handled by :class:`AsyncioWSGIServer`.
+    Writes block the application thread until the event loop sent the
+    data, or at least buffered it without exceeding the write limit.
+    """
+
+    def __init__(
+        self, writer: asyncio.StreamWriter, run: Callable[[Any], Any]
+    ) -> None:
+        self._writer = writer
+        self._run = run
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        if data:
+            data = bytes(data)
+            self._run(_write(self._writer, data))
+
+        return len(data)
+
+
+class AsyncioWSGIServer(BaseWSGIServer):
+
+    """A WSGI server that accepts connections and reads requests in an
+    :mod:`asyncio` event loop. Only the application runs on a bounded
+    pool of threads, so slow or idle keep-alive connections don't use a
+    thread each.
+
+    Requests are handled by the request handler class like in the other
+    servers, but the handler reads and writes through the event loop
+    instead of using the socket directly.
+
+    .. versionadded:: 2.0
+
+    :param threads: The maximum number of threads that run the
+        application. Defaults to the :class:`ThreadPoolExecutor`
+        default.
+    """
+
+    multithread: bool = True
+
+    def __init__(
+        self,
+        host,
+        port,
+        app,
+        handler=None,
+        passthrough_errors=False,
+        ssl_context=None,
+        fd=None,
+        threads=None,
+    ):
+        # The event loop does TLS, don't wrap the listening socket.
+        BaseWSGIServer.__init__(
+            self, host, port, app, handler, passthrough_errors, None, fd
+        )
+
+        if isinstance(ssl_context, tuple):
+            ssl_context = load_ssl_context(*ssl_context)
+        if ssl_context == "adhoc":
+            ssl_context = generate_adhoc_ssl_context()
+
+        self.ssl_context = ssl_context
+        self.threads = threads
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped: Optional[asyncio.Future] = None
+        self._is_shut_down = threading.Event()
+        # The I/O that worker threads wait for, cancelled on shutdown.
+        self._io_lock = threading.Lock()
+        self._io_futures: Optional[Set[Future]] = None
+
+    def serve_forever(self, poll_interval=None) -> None:  # type: ignore
+        self.shutdown_signal = False
+        self._is_shut_down.clear()
+        self._loop = loop = asyncio.new_event_loop()
+        self._stopped = loop.create_future()
+        self._io_futures = set()
+        executor = ThreadPoolExecutor(self.threads)
+
+        try:
+            loop.run_until_complete(self._serve(executor))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                self._cancel_io(loop)
+            finally:
+                executor.shutdown(wait=False)
+                loop.close()
+                self._loop = None
+                self.server_close()
+                self._is_shut_down.set()
+
+    def _cancel_io(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Fail the I/O that worker threads are waiting for and finish
+        the remaining tasks, so the threads don't wait for a loop that
+        is closed.
+        """
+        with self._io_lock:
+            futures = self._io_futures or ()
+            self._io_futures = None
+
+        for future in futures:
+            future.cancel()
+
+        if hasattr(asyncio, "all_tasks"):
+            tasks = asyncio.all_tasks(loop)
+        else:
+            # Python 3.6
+            tasks = asyncio.Task.all_tasks(loop)  # type: ignore
+
+        for task in tasks:
+            task.cancel()
+
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def _run_io(self, coro: Any) -> Any:
+        """Run a coroutine on the event loop from a worker thread and
+        wait for the result.  Raises :exc:`ConnectionAbortedError` if
+        the server shuts down first.
+        """
+        with self._io_lock:
+            if self._io_futures is None:
+                coro.close()
+                raise ConnectionAbortedError("The server is shutting down.")
+
+            future = asyncio.run_coroutine_threadsafe(
+                coro, self._loop  # type: ignore
+            )
+            self._io_futures.add(future)
+
+        try:
+            return future.result()
+        except CancelledError:
+            raise ConnectionAbortedError("The server is shutting down.") from None
+        finally:
+            with self._io_lock:
+                if self._io_futures is not None:
+                    self._io_futures.discard(future)
+
+    def shutdown(self) -> None:
+        """Stop :meth:`serve_forever` and wait until it returns. Must be
+        called from another thread.
+        """
+        loop = self._loop
+
+        if loop is not None:
+            loop.call_soon_threadsafe(self._stop_serving)
+            self._is_shut_down.wait()
+
+    def _stop_serving(self, error: Optional[BaseException] = None) -> None:
+        if self._stopped is not None and not self._stopped.done():
+            if error is None:
+                self._stopped.set_result(None)
+            else:
+                self._stopped.set_exception(error)
+
+    async def _serve(self, executor: ThreadPoolExecutor) -> None:
+        loop = self._loop
+        tasks = set()
+
+        def connection_done(task):
+            tasks.discard(task)
+
+            # Errors are only raised with passthrough_errors, they stop
+            # the server like they do in the other servers.
+            if not task.cancelled() and task.exception() is not None:
+                self._stop_serving(task.exception())
+
+        def accept(reader, writer):
+            task = loop.create_task(  # type: ignore
+                self._handle_connection(reader, writer, executor)
+            )
+            tasks.add(task)
+            task.add_done_callback(connection_done)
+
+        server = await asyncio.start_server(
+            accept, sock=self.socket, ssl=self.ssl_context
+        )
+
+        try:
+            await self._stopped  # type: ignore
+        finally:
+            server.close()
+
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        loop = self._loop
+        client_address = writer.get_extra_info("peername")
+        connection = writer.get_extra_info("ssl_object")
+        sock = writer.get_extra_info("socket")
+
+        if connection is None:
+            connection = sock
+
+        if sock.family != af_unix:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        connection = _AsyncioConnection(writer, self._run_io, connection)
+        self.metrics.connection_opened()
+
+        try:
+            while True:
+                try:
+                    head = await _read_request_head(reader)
+                except (ValueError, OSError):
+                    break
+
+                if head is None:
+                    break
+
+                handler = self.RequestHandlerClass.__new__(  # type: ignore
+                    self.RequestHandlerClass
+                )
+                handler.server = self
+                handler.request = handler.connection = connection
+                handler.client_address = client_address
+                handler.close_connection = True
+                handler.raw_requestline, headers = head
+                # Parse the headers here, errors are written to wfile.
+                handler.rfile = io.BytesIO(headers)
+                handler.wfile = io.BytesIO()
+
+                if not handler.parse_request():
+                    writer.write(handler.wfile.getvalue())
+                    break
+
+                handler.rfile = _AsyncioInput(
+                    reader,
+                    self._run_io,
+                    self._get_input_length(handler),  # type: ignore
+                )
+                handler.wfile = io.BufferedWriter(
+                    _AsyncioOutput(writer, self._run_io)  # type: ignore
+                )
+
+                self.metrics.queued()
+
+                try:
+                    await loop.run_in_executor(  # type: ignore
+                        executor, self._handle_request, handler
+                    )
+                except Exception:
+                    self.handle_error(connection, client_address)
+                    break
+
+                if self.shutdown_signal:
+                    self._stop_serving()
+                    break
+
+                if handler.close_connection:
+                    break
+        finally:
+            self.metrics.connection_closed()
+            writer.close()
+
+    def _get_input_length(self, handler: "WSGIRequestHandler") -> Optional[int]:
+        """The number of body bytes that belong to the request, ``None``
+        if it is chunked or delimited by closing the connection.
+        """
+        if "chunked" in handler.headers.get("Transfer-Encoding", "").lower():
+            return None
+
+        try:
+            return max(0, int(handler.headers.get("Content-Length", "")))
+        except ValueError:
+            return None if handler.close_connection else 0
+
+    def _handle_request(self, handler: "WSGIRequestHandler") -> None:
+        """Run the application for a request, in a worker thread."""
+        self.metrics.dequeued()
+
+        try:
+            handler.run_wsgi()
+            handler.wfile.flush()
+        except (ConnectionError, socket.timeout) as e:
+            handler.close_connection = True
+            handler.connection_dropped(e)
+        except Exception as e:
+            handler.close_connection = True
+
+            if self.ssl_context is None or not is_ssl_error(e):
+                raise
+
+        if self.shutdown_signal:
+            handler.initiate_shutdown()
+
+
 def make_server(
     host=None,
     port=None,
@@ -717,18 +1886,71 @@ def make_server(
     passthrough_errors=False,
     ssl_context=None,
     fd=None,
+    server=None,
+    threads=None,
+    max_queue=None,
+    prefork=False,
+    expose_metrics=False,
 ) -> BaseWSGIServer:
     """Create a new server instance that is either threaded, or forks
     or just processes one request after another.
+
+    .. versionchanged:: 2.0
+        Added the ``server``, ``threads``, ``max_queue`` and
+        ``prefork`` parameters. Pass ``server="asyncio"`` to create an
+        :class:`AsyncioWSGIServer`. If ``threads`` is given, a threaded
+        server uses a :class:`ThreadPoolWSGIServer`. ``prefork`` creates
+        a :class:`PreforkWSGIServer` with ``processes`` workers.
+        ``expose_metrics`` serves the server's :class:`ServerMetrics` at
+        ``/__werkzeug__/metrics``.
     """
-    if threaded and processes > 1:
+    if server == "asyncio":
+        if processes > 1 or prefork:
+            raise ValueError("cannot have an asyncio and multi process server.")
+
+        srv: BaseWSGIServer = AsyncioWSGIServer(
+            host,
+            port,
+            app,
+            request_handler,
+            passthrough_errors,
+            ssl_context,
+            fd=fd,
+            threads=threads,
+        )
+    elif server is not None:
+        raise ValueError(f"Unknown server type {server!r}.")
+    elif (threaded or threads is not None) and (processes > 1 or prefork):
         raise ValueError("cannot have a multithreaded and multi process server.")
+    elif prefork:
+        srv = PreforkWSGIServer(
+            host,
+            port,
+            app,
+            processes,
+            request_handler,
+            passthrough_errors,
+            ssl_context,
+            fd=fd,
+        )
+    elif threads is not None:
+        srv = ThreadPoolWSGIServer(
+            host,
+            port,
+            app,
+            request_handler,
+            passthrough_errors,
+            ssl_context,
+            fd=fd,
+            threads=threads,
+            max_queue=max_queue,
+        )
     elif threaded:
-        return ThreadedWSGIServer(
+        srv = ThreadedWSGIServer(
             host, port, app, request_handler, passthrough_errors, ssl_context, fd=fd,
         )
     elif processes > 1:
-        return ForkingWSGIServer(
+        srv = ForkingWSGIServer(
             host,
             port,
             app,
@@ -739,10 +1961,15 @@ def make_server(
             fd=fd,
         )
     else:
-        return BaseWSGIServer(
+        srv = BaseWSGIServer(
             host, port, app, request_handler, passthrough_errors, ssl_context, fd=fd,
         )
 
+    if expose_metrics:
+        srv.metrics_path = "/__werkzeug__/metrics"
+
+    return srv
+
 
 def is_running_from_reloader() -> bool:
     """Checks if the application is running from within the Werkzeug
@@ -769,6 +1996,11 @@ def run_simple(
     static_files=None,
     passthrough_errors=False,
     ssl_context=None,
+    server=None,
+    threads=None,
+    max_queue=None,
+    prefork=False,
+    expose_metrics=False,
 ):
     """Start a WSGI application. Optional features include a reloader,
     multithreading and fork support.
@@ -800,6 +2032,10 @@ def run_simple(
         Bind to a Unix socket by passing a path that starts with
         ``unix://`` as the ``hostname``.
 
+    .. versionchanged:: 2.0
+        Added the ``server``, ``threads``, ``max_queue``, ``prefork``
+        and ``expose_metrics`` parameters.
+
     :param hostname: The host to bind to, for example ``'localhost'``.
         If the value is a path that starts with ``unix://`` it will bind
         to a Unix socket instead of a TCP socket..
@@ -821,6 +2057,8 @@ def run_simple(
                      thread?
     :param processes: if greater than 1 then handle each request in a new process
                       up to this maximum number of concurrent processes.
+                      With `prefork` this is the number of worker
+                      processes.
     :param request_handler: optional parameter that can be used to replace
                             the default one.  You can use this to replace it
                             with a different
@@ -838,6 +2076,25 @@ def run_simple(
                         ``(cert_file, pkey_file)``, the string ``'adhoc'`` if
                         the server should automatically create one, or ``None``
                         to disable SSL (which is the default).
+    :param server: pass ``'asyncio'`` to accept connections and read
+                   requests in an :mod:`asyncio` event loop, and to run
+                   the application on a pool of threads.  See
+                   :class:`AsyncioWSGIServer`.
+    :param threads: the maximum number of threads that run the
+                    application.  If this is set, the threaded server
+                    handles connections on a pool of worker threads
+                    instead of starting a thread for each one.  See
+                    :class:`ThreadPoolWSGIServer`.
+    :param max_queue: the number of connections that may wait for a
+                      worker thread before the threaded server answers
+                      ``503 Service Unavailable``.  By default it stops
+                      accepting connections while all workers are busy.
+    :param prefork: start `processes` long-lived worker processes up front
+                    instead of forking for each request.  See
+                    :class:`PreforkWSGIServer`.
+    :param expose_metrics: respond to ``/__werkzeug__/metrics`` with the
+                           server's :class:`ServerMetrics` as JSON
+                           instead of calling the application.
     """
     if not isinstance(port, int):
         raise TypeError("port must be an integer")
@@ -883,6 +2140,11 @@ def run_simple(
             passthrough_errors,
             ssl_context,
             fd=fd,
+            server=server,
+            threads=threads,
+            max_queue=max_queue,
+            prefork=prefork,
+            expose_metrics=expose_metrics,
         )
         if fd is None:
             log_startup(srv.socket)
@@ -106,13 +106,30 @@ class BaseRequest:
     #: .. versionadded:: 0.5
     max_form_memory_size = None
 
+    #: The maximum number of multipart parts or url encoded fields to
+    #: parse.  This is forwarded to the form data parsing function
+    #: (:func:`parse_form_data`).  When set and the :attr:`form` or
+    #: :attr:`files` attribute is accessed and the data has more parts, a
+    #: :exc:`~werkzeug.exceptions.RequestEntityTooLarge` exception is
+    #: raised.
+    #:
+    #: Have a look at :doc:`/request_data` for more details.
+    #:
+    #: .. versionadded:: 2.0
+    max_form_parts: Optional[int] = None
+
     #: the class to use for `args` and `form`.  The default is an
     #: :class:`~werkzeug.datastructures.ImmutableMultiDict` which supports
     #: multiple values per key.  alternatively it makes sense to use an
     #: :class:`~werkzeug.datastructures.ImmutableOrderedMultiDict` which
-    #: preserves order or a :class:`~werkzeug.datastructures.ImmutableDict`
-    #: which is the fastest but only remembers the last key.  It is also
-    #: possible to use mutable structures, but this is not recommended.
+    #: preserves order, an
+    #: :class:`~werkzeug.datastructures.ImmutableCompactMultiDict` which
+    #: uses less memory for large query strings and forms, an
+    #: :class:`~werkzeug.datastructures.ImmutableLazyMultiDict` which only
+    #: decodes the query string up to the keys that are looked up, or an
+    #: :class:`~werkzeug.datastructures.ImmutableDict` which is the fastest
+    #: but only remembers the last key.  It is also possible to use mutable
+    #: structures, but this is not recommended.
     #:
     #: .. versionadded:: 0.6
     parameter_storage_class = ImmutableMultiDict
@@ -302,6 +319,9 @@ class BaseRequest:
         :attr:`form_data_parser_class` with some parameters.
 
         .. versionadded:: 0.8
+
+        .. versionchanged:: 2.0
+           Passes :attr:`max_form_parts`.
         """
         return self.form_data_parser_class(
             self._get_file_stream,
@@ -310,6 +330,7 @@ class BaseRequest:
             self.max_form_memory_size,
             self.max_content_length,
             self.parameter_storage_class,
+            max_form_parts=self.max_form_parts,
         )
 
     def _load_form_data(self) -> None:
@@ -710,6 +710,23 @@ def _make_chunk_iter(
         yield item
 
 
+def _make_chunk_view_iter(
+    stream: Union[IO[bytes], Iterator[bytes]], limit: Optional[int], buffer_size: int,
+) -> Iterator[Union[bytes, memoryview]]:
+    """Like :func:`_make_chunk_iter`, but if the stream is limited and
+    supports ``readinto`` the chunks are views of one reused buffer, see
+    :meth:`LimitedStream.iter_chunks`.
+    """
+    if hasattr(stream, "readinto"):
+        if not isinstance(stream, LimitedStream) and limit is not None:
+            stream = LimitedStream(stream, limit)  # type: ignore
+
+        if isinstance(stream, LimitedStream):
+            return stream.iter_chunks(buffer_size)
+
+    return _make_chunk_iter(stream, limit, buffer_size)
+
+
 def make_line_iter(
     stream: Union[Iterator[AnyStr], IO],
     limit: Optional[int] = None,
@@ -737,15 +754,20 @@ def make_line_iter(
     .. versionadded:: 0.11.10
        added support for the `cap_at_buffer` parameter.
 
+    .. versionchanged:: 2.0
+       Chunks are split into lines with ``splitlines`` instead of
+       buffering every line break separately, which is a lot faster
+       for short lines. With `cap_at_buffer` no chunk is longer than
+       the buffer size anymore, except that a line ending in CRLF is
+       not split between the CR and the LF.
+
     :param stream: the stream or iterate to iterate over.
     :param limit: the limit in bytes for the stream.  (Usually
                   content length.  Not necessary if the `stream`
                   is a :class:`LimitedStream`.
     :param buffer_size: The optional buffer size.
     :param cap_at_buffer: if this is set chunks are split if they are longer
-                          than the buffer size.  Internally this is implemented
-                          that the buffer size might be exhausted by a factor
-                          of two however.
+                          than the buffer size.
     """
     _iter: Iterator[AnyStr] = _make_chunk_iter(stream, limit, buffer_size)
 
@@ -758,46 +780,106 @@ def make_line_iter(
     cr = s("\r")
     lf = s("\n")
     crlf = s("\r\n")
+    _join = empty.join
+    # str.splitlines also splits at other line boundaries than CR and LF
+    other_breaks = _other_line_breaks_re.search if isinstance(empty, str) else None
+    # The start of a line that continues in the next chunk.  If it ends
+    # with CR the line is complete unless the next chunk starts with LF.
+    pending: List[AnyStr] = []
+    pending_size = 0
+
+    for chunk in chain((first_item,), _iter):
+        if pending and pending[-1][-1:] == cr and chunk[:1] != lf:
+            yield from _cap_lines([_join(pending)], buffer_size, cap_at_buffer, crlf)
+            pending = []
+            pending_size = 0
+
+        if lf not in chunk and cr not in chunk:
+            # a part of a long line, it is joined once the line ends
+            pending.append(chunk)
+            pending_size += len(chunk)
+
+            if cap_at_buffer and pending_size >= buffer_size:
+                rest = _join(pending)
+                end = pending_size - pending_size % buffer_size
+                yield from _cap_lines([rest[:end]], buffer_size, cap_at_buffer, crlf)
+                pending = [rest[end:]] if end < pending_size else []
+                pending_size -= end
+
+            continue
+
+        lines = chunk.splitlines(True)
+
+        if other_breaks is not None and other_breaks(chunk) is not None:
+            lines = _merge_other_line_breaks(lines, _join, crlf)
+
+        if pending:
+            pending.append(lines[0])
+            lines[0] = _join(pending)
+            pending = []
+            pending_size = 0
+
+        if lines[-1][-1:] != lf:
+            # The last line may continue in the next chunk.  Keep less
+            # than buffer_size of it if lines are capped.
+            last = lines.pop()
+            if cap_at_buffer and len(last) > buffer_size:
+                end = len(last) - 1 if last[-1:] == cr else len(last)
+                end -= end % buffer_size
+                lines.append(last[:end])
+                last = last[end:]
+            if last:
+                pending.append(last)
+                pending_size = len(last)
+
+        yield from _cap_lines(lines, buffer_size, cap_at_buffer, crlf)
+
+    if pending:
+        yield from _cap_lines([_join(pending)], buffer_size, cap_at_buffer, crlf)
+
+
+#: line boundaries other than CR and LF that str.splitlines splits at
+_other_line_breaks_re = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _merge_other_line_breaks(
+    lines: List[AnyStr], join: Callable, crlf: AnyStr
+) -> List[AnyStr]:
+    """Join the lines from ``splitlines`` that do not end in CR or LF
+    with the line after them.
+    """
+    rv = []
+    buffer = []
 
-    _iter = chain((first_item,), _iter)
+    for line in lines:
+        buffer.append(line)
+        if line[-1:] in crlf:
+            rv.append(join(buffer))
+            buffer = []
 
-    def _iter_basic_lines() -> Iterator[AnyStr]:
-        _join = empty.join
-        buffer: List[Any] = []
-        while 1:
-            new_data = next(_iter, "")
-            if not new_data:
-                break
-            new_buf = []
-            buf_size = 0
-            for item in chain(buffer, new_data.splitlines(True)):
-                new_buf.append(item)
-                buf_size += len(item)
-                if item and item[-1:] in crlf:
-                    yield _join(new_buf)
-                    new_buf = []
-                elif cap_at_buffer and buf_size >= buffer_size:
-                    rv = _join(new_buf)
-                    while len(rv) >= buffer_size:
-                        yield rv[:buffer_size]
-                        rv = rv[buffer_size:]
-                    new_buf = [rv]
-            buffer = new_buf
-        if buffer:
-            yield _join(buffer)
-
-    # This hackery is necessary to merge 'foo\r' and '\n' into one item
-    # of 'foo\r\n' if we were unlucky and we hit a chunk boundary.
-    previous = empty
-    for item in _iter_basic_lines():
-        if item == lf and previous[-1:] == cr:
-            previous += item
-            item = empty
-        if previous:
-            yield previous
-        previous = item
-    if previous:
-        yield previous
+    if buffer:
+        rv.append(join(buffer))
+
+    return rv
+
+
+def _cap_lines(
+    lines: List[AnyStr], buffer_size: int, cap_at_buffer: bool, crlf: AnyStr
+) -> Iterator[AnyStr]:
+    if not cap_at_buffer or not lines or max(map(len, lines)) <= buffer_size:
+        yield from lines
+        return
+
+    for line in lines:
+        # Never split a CRLF, the last piece may be one item longer.
+        end = len(line) - 1 if line[-2:] == crlf else len(line)
+        start = 0
+
+        while end - start > buffer_size:
+            yield line[start : start + buffer_size]
+            start += buffer_size
+
+        yield line[start:]
 
 
 def make_chunk_iter(
@@ -877,6 +959,15 @@ def make_chunk_iter(
         yield _join(buffer)
 
 
+def _copy_into(view: memoryview, data: bytes) -> int:
+    """Copy as much of ``data`` into ``view`` as fits and return the
+    number of bytes copied.
+    """
+    size = min(len(data), len(view))
+    view[:size] = data[:size]
+    return size
+
+
 class LimitedStream(io.IOBase):
     """Wraps a stream so that it doesn't read more than n bytes.  If the
     stream is exhausted and the caller tries to get more bytes from it
@@ -913,6 +1004,7 @@ class LimitedStream(io.IOBase):
 
     def __init__(self, stream: Union[IO], limit: int) -> None:
         self._read = stream.read
+        self._readinto = getattr(stream, "readinto", None)
         self._readline = stream.readline
         self._pos = 0
         self.limit = limit
@@ -953,10 +1045,12 @@ class LimitedStream(io.IOBase):
                            the results.
         """
         to_read = self.limit - self._pos
-        chunk = chunk_size
+        # read into the same buffer over and over instead of creating
+        # a bytes object for every chunk
+        buffer = memoryview(bytearray(min(to_read, chunk_size)))
         while to_read > 0:
-            chunk = min(to_read, chunk)
-            self.read(chunk)
+            chunk = min(to_read, len(buffer))
+            self.readinto(buffer[:chunk])
             to_read -= chunk
 
     def read(self, size: Optional[int] = None) -> Union[str, bytes]:
@@ -978,6 +1072,53 @@ class LimitedStream(io.IOBase):
         self._pos += len(read)
         return read
 
+    def readinto(self, b: Any) -> int:
+        """Read bytes into the pre-allocated, writable buffer ``b`` and
+        return the number of bytes read.  At most ``len(b)`` bytes are
+        read, never more than the limit allows.  If the wrapped stream
+        has no ``readinto`` method, :meth:`~file.read` is used instead.
+
+        The values returned by :meth:`on_exhausted` and
+        :meth:`on_disconnect` are copied into the buffer.
+
+        .. versionadded:: 2.0
+        """
+        view = memoryview(b).cast("B")
+        if self._pos >= self.limit:
+            return _copy_into(view, self.on_exhausted())
+        to_read = min(self.limit - self._pos, len(view))
+        view = view[:to_read]
+        try:
+            if self._readinto is not None:
+                read = self._readinto(view) or 0
+            else:
+                data = self._read(to_read)
+                read = len(data)
+                view[:read] = data
+        except (OSError, ValueError):
+            return _copy_into(view, self.on_disconnect())
+        if to_read and read != to_read:
+            return _copy_into(view, self.on_disconnect())
+        self._pos += read
+        return read
+
+    def iter_chunks(self, buffer_size: int = 1024 * 64) -> Iterator[memoryview]:
+        """Iterate over the rest of the stream in chunks of up to
+        `buffer_size` bytes.  All chunks are views of the same buffer
+        that is filled with :meth:`readinto`, so a chunk is only valid
+        until the next one is requested.  Copy it to keep it longer.
+
+        .. versionadded:: 2.0
+
+        :param buffer_size: the size of the reused buffer.
+        """
+        buffer = memoryview(bytearray(buffer_size))
+        while True:
+            read = self.readinto(buffer)
+            if not read:
+                break
+            yield buffer[:read]
+
     def readline(self, size: Optional[int] = None) -> BytesOrStr:  # type: ignore
         """Reads one line from the stream."""
         if self._pos >= self.limit:
@@ -0,0 +1,59 @@
+import io
+import os
+from pstats import Stats
+
+from werkzeug.middleware.profiler import ProfilerMiddleware
+from werkzeug.test import Client
+from werkzeug.wrappers import BaseResponse as Response
+
+
+def hello_app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [b"Hello, ", b"World!"]
+
+
+def test_profiler(tmpdir):
+    stream = io.StringIO()
+    app = ProfilerMiddleware(hello_app, stream=stream, profile_dir=str(tmpdir))
+    response = Client(app, Response).get("/foo/bar")
+
+    assert response.data == b"Hello, World!"
+    assert "PATH: '/foo/bar'" in stream.getvalue()
+    (name,) = os.listdir(str(tmpdir))
+    assert name.startswith("GET.foo.bar.")
+
+
+def test_sample_rate():
+    stream = io.StringIO()
+    app = ProfilerMiddleware(hello_app, stream=stream, sample_rate=0)
+    response = Client(app, Response).get("/")
+
+    assert response.data == b"Hello, World!"
+    assert stream.getvalue() == ""
+
+
+def test_aggregate(tmpdir):
+    stream = io.StringIO()
+    app = ProfilerMiddleware(
+        hello_app, stream=stream, profile_dir=str(tmpdir), aggregate_interval=3600
+    )
+    client = Client(app, Response)
+    client.get("/")
+    client.get("/")
+
+    assert stream.getvalue() == ""
+    assert os.listdir(str(tmpdir)) == []
+
+    app = ProfilerMiddleware(
+        hello_app, stream=stream, profile_dir=str(tmpdir), aggregate_interval=0
+    )
+    client = Client(app, Response)
+    client.get("/")
+
+    assert "1 requests in" in stream.getvalue()
+    (name,) = os.listdir(str(tmpdir))
+    assert name.startswith("aggregate.")
+    stats = Stats(os.path.join(str(tmpdir), name))
+    assert any(
+        func[2] == "hello_app" and stat[1] == 1 for func, stat in stats.stats.items()
+    )
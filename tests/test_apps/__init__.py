@@ -1,8 +1,10 @@
 from .chunked_encoding_app import app as chunked_app
 from .debug_app import app as debug_app
+from .file_app import app as file_app
 from .proxy_app import app as proxy_app
 from .reloader_app import app as reloader_app
 from .standard_app import app as standard_app
 from .stdlib_ssl_app import ssl_kwargs
 from .stdlib_ssl_app import stdlib_ssl_app
+from .streaming_app import app as streaming_app
 from werkzeug.testapp import test_app
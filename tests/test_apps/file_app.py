@@ -0,0 +1,10 @@
+import os
+
+from werkzeug.utils import send_file
+from werkzeug.wrappers import Request
+
+
+@Request.application
+def app(request):
+    path = os.path.join(os.path.dirname(__file__), "..", "res", "index.html")
+    return send_file(path, environ=request.environ, conditional=True)
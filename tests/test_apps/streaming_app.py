@@ -0,0 +1,4 @@
+def app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    yield b"Hello, "
+    yield b"World!"
@@ -1,4 +1,5 @@
 import io
+import json
 import pickle
 import tempfile
 from contextlib import contextmanager
@@ -325,6 +326,63 @@ class TestImmutableMultiDict(_ImmutableDictTests):
         assert immutable2 in x
 
 
+class TestImmutableLazyMultiDict(TestImmutableMultiDict):
+    storage_class = datastructures.ImmutableLazyMultiDict  # type: ignore
+
+    def test_lazy(self):
+        consumed = []
+
+        def pairs():
+            for pair in [("a", 1), ("b", 2), ("a", 3), ("c", 4)]:
+                consumed.append(pair)
+                yield pair
+
+        d = self.storage_class(pairs())
+        assert d
+        assert d["a"] == 1
+        assert d.get("b") == 2
+        assert "b" in d
+        assert len(consumed) == 2
+        assert "c" in d
+        assert d.get("a", type=str) == "1"
+        assert len(consumed) == 4
+        assert d.getlist("a") == [1, 3]
+        assert d.get("missing") is None
+        assert not self.storage_class()
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            len,
+            list,
+            hash,
+            lambda d: pickle.loads(pickle.dumps(d)).to_dict(flat=False),
+            lambda d: d.getlist("a"),
+            lambda d: list(d.items(multi=True)),
+            lambda d: d.to_dict(flat=False),
+            lambda d: d == datastructures.ImmutableMultiDict(d),
+            lambda d: d.copy(),
+        ],
+    )
+    def test_same_as_immutable_multidict(self, op):
+        pairs = [("a", 1), ("b", 2), ("a", 3), ("c", 4)]
+        d = self.storage_class(iter(pairs))
+        assert op(d) == op(datastructures.ImmutableMultiDict(pairs))
+
+    def test_request_args(self):
+        from werkzeug.wrappers import Request
+
+        class LazyRequest(Request):
+            parameter_storage_class = datastructures.ImmutableLazyMultiDict
+
+        request = LazyRequest.from_values("/?a=1&b=2&a=3&c=%C3%A9")
+        assert request.args["a"] == "1"
+        assert dict.__len__(request.args) == 1
+        assert request.args.getlist("a") == ["1", "3"]
+        assert request.args["c"] == "\u00e9"
+        assert request.values["b"] == "2"
+
+
 class TestImmutableDict(_ImmutableDictTests):
     storage_class = datastructures.ImmutableDict  # type: ignore
 
@@ -338,6 +396,10 @@ class TestImmutableOrderedMultiDict(_ImmutableDictTests):
         assert hash(a) != hash(b)
 
 
+class TestImmutableCompactMultiDict(TestImmutableMultiDict):
+    storage_class = datastructures.ImmutableCompactMultiDict  # type: ignore
+
+
 class TestMultiDict(_MutableMultiDictTests):
     storage_class = datastructures.MultiDict  # type: ignore
 
@@ -505,6 +567,42 @@ class TestOrderedMultiDict(_MutableMultiDictTests):
         d.add("foo", 23)
         pytest.raises(TypeError, hash, d)
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"cwerkzeug.datastructures\nOrderedMultiDict\np0\n((lp1\n(Va\np2\nI1\n"
+            b"tp3\na(Vb\np4\nI2\ntp5\na(g2\nI3\ntp6\natp7\nRp8\n.",
+            b"\x80\x02cwerkzeug.datastructures\nOrderedMultiDict\nq\x00]q\x01(X"
+            b"\x01\x00\x00\x00aq\x02K\x01\x86q\x03X\x01\x00\x00\x00bq\x04K\x02"
+            b"\x86q\x05h\x02K\x03\x86q\x06e\x85q\x07Rq\x08.",
+        ],
+    )
+    def test_unpickle_bucket_version(self, data):
+        d = pickle.loads(data)
+        assert list(d.items(multi=True)) == [("a", 1), ("b", 2), ("a", 3)]
+        d.add("b", 4)
+        assert d.getlist("b") == [2, 4]
+
+    def test_removed_values(self):
+        d = self.storage_class([(str(i % 4), i) for i in range(8)])
+        d.poplist("1")
+        d["2"] = 8
+        assert list(d.items(multi=True)) == [
+            ("0", 0),
+            ("3", 3),
+            ("0", 4),
+            ("3", 7),
+            ("2", 8),
+        ]
+        assert d == self.storage_class(d)
+        assert not d != self.storage_class(d)
+        d.poplist("0")
+        assert list(d.items(multi=True)) == [("3", 3), ("3", 7), ("2", 8)]
+        assert d.getlist("3") == [3, 7]
+        assert d.popitemlist() == ("2", [8])
+        d.clear()
+        assert list(d.items(multi=True)) == []
+
     def test_iterables(self):
         a = datastructures.MultiDict((("key_a", "value_a"),))
         b = datastructures.MultiDict((("key_b", "value_b"),))
@@ -537,6 +635,85 @@ class TestOrderedMultiDict(_MutableMultiDictTests):
         assert "baz" not in exc_info.value.get_description()
 
 
+class TestCompactMultiDict(_MutableMultiDictTests):
+    storage_class = datastructures.CompactMultiDict  # type: ignore
+
+    def test_same_as_multidict(self):
+        mapping = [("a", 1), ("b", 2), ("a", 3), ("c", 4), ("b", 5), ("a", 6)]
+        md = datastructures.MultiDict(mapping)
+        cmd = self.storage_class(mapping)
+
+        def check():
+            assert list(cmd.items(multi=True)) == list(md.items(multi=True))
+            assert list(cmd.items()) == list(md.items())
+            assert list(cmd.lists()) == list(md.lists())
+            assert list(cmd.values()) == list(md.values())
+            assert list(cmd) == list(md)
+            assert len(cmd) == len(md)
+            assert cmd.to_dict() == md.to_dict()
+            assert dict(cmd) == md.to_dict()
+            assert cmd == md
+            assert not cmd != md
+
+        check()
+        cmd["b"] = md["b"] = 7
+        check()
+        cmd.add("d", 8)
+        md.add("d", 8)
+        check()
+        cmd.setlist("a", [9, 10])
+        md.setlist("a", [9, 10])
+        check()
+        assert cmd.pop("c") == md.pop("c")
+        check()
+        assert cmd.popitemlist() == md.popitemlist()
+        check()
+        cmd.update({"b": [11, 12]})
+        md.update({"b": [11, 12]})
+        check()
+        assert repr(cmd) == (
+            "CompactMultiDict([('a', 9), ('a', 10), ('b', 7), ('b', 11), ('b', 12)])"
+        )
+
+    def test_dict_storage(self):
+        md = self.storage_class([("a", "1"), ("b", "2"), ("a", "3")])
+        assert dict.__len__(md) == 2
+        assert json.loads(json.dumps(md)) == {"a": "1", "b": "2"}
+        assert {**md} == {"a": "1", "b": "2"}
+        assert list(copy(md).items(multi=True)) == list(md.items(multi=True))
+        md.add("c", "4")
+        md["a"] = "5"
+        md.setlist("b", [])
+        assert json.loads(json.dumps(md)) == {"a": "5", "c": "4"}
+        md.clear()
+        assert json.dumps(md) == "{}"
+
+    def test_setlist_empty(self):
+        md = self.storage_class([("a", 1), ("a", 2), ("b", 3)])
+        md.setlist("a", [])
+        assert "a" not in md
+        assert list(md.items(multi=True)) == [("b", 3)]
+
+    def test_setlistdefault(self):
+        with pytest.raises(TypeError):
+            self.storage_class().setlistdefault("a")
+
+    def test_parameter_storage_class(self):
+        from werkzeug.wrappers import Request
+
+        class CompactRequest(Request):
+            parameter_storage_class = datastructures.ImmutableCompactMultiDict
+
+        request = CompactRequest.from_values(
+            "/?a=1&b=2&a=3", data={"c": "4", "d": ["5", "6"]}, method="POST"
+        )
+        assert isinstance(request.args, datastructures.ImmutableCompactMultiDict)
+        assert request.args.getlist("a") == ["1", "3"]
+        assert json.loads(json.dumps(request.args)) == {"a": "1", "b": "2"}
+        assert request.form.getlist("d") == ["5", "6"]
+        assert request.values["c"] == "4"
+
+
 class TestTypeConversionDict:
     storage_class = datastructures.TypeConversionDict
 
@@ -762,6 +939,31 @@ class TestHeaders:
         assert h.setlistdefault("a", ["3"]) == ["0"]
         assert h.setlistdefault("d", ["4", "5"]) == ["4", "5"]
 
+    def test_lookup_after_changes(self):
+        h = self.storage_class([("A", "1"), ("B", "2"), ("a", "3"), ("C", "4")])
+        assert h["a"] == "1"
+        assert h.getlist("A") == ["1", "3"]
+        h.add("b", "5")
+        assert h.getlist("B") == ["2", "5"]
+        h.set("A", "6")
+        assert h.to_wsgi_list() == [("A", "6"), ("B", "2"), ("C", "4"), ("b", "5")]
+        assert h.getlist("a") == ["6"]
+        assert h["c"] == "4"
+        del h[0]
+        assert "A" not in h
+        assert h.getlist("b") == ["2", "5"]
+        h[0] = ("D", "7")
+        assert h.getlist("b") == ["5"]
+        assert h["d"] == "7"
+        h.remove("C")
+        assert h.pop() == ("b", "5")
+        assert "b" not in h
+        assert h.to_wsgi_list() == [("D", "7")]
+        h.clear()
+        assert "D" not in h
+        h.add("E", "8")
+        assert h["e"] == "8"
+
     def test_to_wsgi_list(self):
         h = self.storage_class()
         h.set("Key", "Value")
@@ -826,6 +1028,20 @@ class TestEnvironHeaders:
         headers = self.storage_class(env)
         assert dict(headers) == {"X-Foo": "42", "Content-Length": "0"}
 
+    def test_environ_changes(self):
+        env = {"HTTP_X_FOO": "1", "CONTENT_TYPE": "text/plain"}
+        headers = self.storage_class(env)
+        assert list(headers) == [("X-Foo", "1"), ("Content-Type", "text/plain")]
+        env["HTTP_X_FOO"] = "2"
+        assert headers["X-Foo"] == "2"
+        assert headers.getlist("x-foo") == ["2"]
+        del env["CONTENT_TYPE"]
+        env["HTTP_X_BAR"] = "3"
+        assert list(headers) == [("X-Foo", "2"), ("X-Bar", "3")]
+        env.clear()
+        assert len(headers) == 0
+        assert "X-Foo" not in headers
+
     def test_return_type_is_str(self):
         headers = self.storage_class({"HTTP_FOO": "\xe2\x9c\x93"})
         assert headers["Foo"] == "\xe2\x9c\x93"
@@ -1,5 +1,9 @@
+import base64
 import csv
+import hashlib
 import io
+import quopri
+from concurrent.futures import ThreadPoolExecutor
 from os.path import dirname
 from os.path import join
 
@@ -111,6 +115,74 @@ class TestFormParser:
         req.max_form_memory_size = 400
         assert req.form["foo"] == "Hello World"
 
+    def test_max_form_parts(self):
+        data = b"".join(
+            b"--foo\r\nContent-Disposition: form-field; name=f%d\r\n\r\nv\r\n" % i
+            for i in range(3)
+        )
+        data += b"--foo--"
+        req = Request.from_values(
+            input_stream=io.BytesIO(data),
+            content_length=len(data),
+            content_type="multipart/form-data; boundary=foo",
+            method="POST",
+        )
+        req.max_form_parts = 2
+        pytest.raises(RequestEntityTooLarge, lambda: req.form["f0"])
+
+        req = Request.from_values(
+            input_stream=io.BytesIO(data),
+            content_length=len(data),
+            content_type="multipart/form-data; boundary=foo",
+            method="POST",
+        )
+        req.max_form_parts = 3
+        assert req.form.getlist("f2") == ["v"]
+
+        data = b"a=1&b=2&c=3"
+        req = Request.from_values(
+            input_stream=io.BytesIO(data),
+            content_length=len(data),
+            content_type="application/x-www-form-urlencoded",
+            method="POST",
+        )
+        req.max_form_parts = 2
+        pytest.raises(RequestEntityTooLarge, lambda: req.form["a"])
+
+        _, form, _ = parse_form_data(
+            create_environ(
+                data=data,
+                method="POST",
+                content_type="application/x-www-form-urlencoded",
+            ),
+            max_form_parts=3,
+        )
+        assert form["c"] == "3"
+
+        # There is no limit by default.
+        data = b"&".join(b"f%d=v" % i for i in range(2000))
+        req = Request.from_values(
+            input_stream=io.BytesIO(data),
+            content_length=len(data),
+            content_type="application/x-www-form-urlencoded",
+            method="POST",
+        )
+        assert len(req.form) == 2000
+
+    def test_max_form_parts_stops_parsing(self):
+        parser = formparser.MultiPartParser(max_form_parts=10)
+        parts = iter(range(100000))
+
+        def parse_lines(*args):
+            for i in parts:
+                yield "begin_form", ({}, str(i))
+                yield "cont", b"v"
+                yield "end", None
+
+        parser.parse_lines = parse_lines
+        pytest.raises(RequestEntityTooLarge, parser.parse, None, b"foo", None)
+        assert next(parts) == 11
+
     def test_missing_multipart_boundary(self):
         data = (
             b"--foo\r\nContent-Disposition: form-field; name=foo\r\n\r\n"
@@ -485,6 +557,32 @@ class TestMultiPart:
         )
         assert req.form["test"] == "Sk\xe5ne l\xe4n"
 
+    @pytest.mark.parametrize(
+        ("encoding", "encode"),
+        [
+            ("base64", base64.encodebytes),
+            ("quoted-printable", lambda x: quopri.encodestring(x, True)),
+        ],
+    )
+    def test_transfer_encoding_chunks(self, encoding, encode):
+        contents = bytes(i % 256 for i in range(10000) if i % 256 not in b"\r\n")
+        data = (
+            b'--foo\r\nContent-Disposition: form-data; name="a"; filename="a"\r\n'
+            b"Content-Transfer-Encoding: %s\r\n\r\n%s\r\n--foo--"
+        ) % (encoding.encode(), encode(contents).replace(b"\n", b"\r\n"))
+        parser = formparser.MultiPartParser(buffer_size=1024)
+        _, files = parser.parse(io.BytesIO(data), b"foo", len(data))
+        assert files["a"].read() == contents
+
+    def test_base64_padded_lines(self):
+        data = (
+            b'--foo\r\nContent-Disposition: form-data; name="a"\r\n'
+            b"Content-Transfer-Encoding: base64\r\n\r\n"
+            b"YQ==\r\nYmM=\r\nZGVm\r\n--foo--"
+        )
+        form, _ = formparser.MultiPartParser().parse(io.BytesIO(data), b"foo", None)
+        assert form["a"] == "abcdef"
+
     def test_empty_multipart(self):
         environ = {}
         data = b"--boundary--"
@@ -534,6 +632,189 @@ class TestMultiPartParser:
         assert request.files["rfc2231"].filename == "a b c d e f.txt"
         assert request.files["rfc2231"].read() == b"file contents"
 
+    @pytest.mark.parametrize("nl", [b"\n", b"\r", b"\r\n"])
+    def test_boundary_lookalikes(self, nl):
+        contents = nl.join([b"--fo", b"-foo", b"--foo--x", nl, b"\x00" * 3000])
+        data = nl.join(
+            (
+                b"",
+                b"--foo",
+                b"Content-Disposition: form-data; name=foo",
+                b"",
+                b"--foo",
+                b'Content-Disposition: form-data; name=bar; filename="bar.txt"',
+                b"",
+                contents,
+                b"--foo--",
+            )
+        )
+        parser = formparser.MultiPartParser(buffer_size=1024)
+        form, files = parser.parse(io.BytesIO(data), b"foo", len(data))
+        assert form["foo"] == ""
+        assert files["bar"].read() == contents
+
+    def test_large_chunks(self):
+        contents = b"\r\n".join([b"a"] * 10000)
+        data = (
+            b"--foo\r\n"
+            b'Content-Disposition: form-data; name="f"; filename="f.txt"\r\n\r\n'
+            + contents
+            + b"\r\n--foo--"
+        )
+        parser = formparser.MultiPartParser(buffer_size=1024)
+        events = list(parser.parse_lines(io.BytesIO(data), b"foo", len(data)))
+        chunks = [e[1] for e in events if e[0] == "cont"]
+        assert b"".join(chunks) == contents
+        assert len(chunks) < 100
+
+
+class TestFileSink:
+    contents = b"".join(bytes([i % 256]) * 1000 for i in range(300))
+    data = (
+        b"--foo\r\n"
+        b'Content-Disposition: form-data; name="a"; filename="a.bin"\r\n\r\n'
+        + contents
+        + b"\r\n--foo\r\n"
+        b'Content-Disposition: form-data; name="b"\r\n\r\nb\r\n'
+        b"--foo--"
+    )
+
+    def parse(self, file_sink_factory):
+        return parse_form_data(
+            create_environ(
+                data=self.data,
+                method="POST",
+                content_type="multipart/form-data; boundary=foo",
+            ),
+            silent=False,
+            file_sink_factory=file_sink_factory,
+        )
+
+    def test_file_sink_factory(self):
+        sinks = []
+
+        class Sink:
+            def __init__(self, container, name, filename, headers):
+                self.container = container
+                self.args = (name, filename, headers["Content-Disposition"])
+                self.chunks = []
+                sinks.append(self)
+
+            def write(self, data):
+                self.chunks.append(data)
+
+            def flush(self):
+                self.container.write(b"".join(self.chunks))
+
+        _, form, files = self.parse(Sink)
+        assert form["b"] == "b"
+        assert files["a"].read() == self.contents
+        assert len(sinks) == 1
+        assert sinks[0].args[:2] == ("a", "a.bin")
+        assert len(sinks[0].chunks) > 1
+
+    def test_executor_file_sink(self):
+        digests = {}
+
+        with ThreadPoolExecutor(2) as executor:
+
+            def file_sink_factory(container, name, filename, headers):
+                digests[name] = hashlib.sha256()
+                return formparser.ExecutorFileSink(
+                    container, executor, [digests[name]], max_pending=2
+                )
+
+            _, form, files = self.parse(file_sink_factory)
+
+        assert files["a"].read() == self.contents
+        assert digests["a"].digest() == hashlib.sha256(self.contents).digest()
+        assert list(digests) == ["a"]
+
+    def test_executor_file_sink_error(self):
+        class Container(io.BytesIO):
+            def write(self, data):
+                raise OSError("disk full")
+
+        with ThreadPoolExecutor(1) as executor:
+            sink = formparser.ExecutorFileSink(Container(), executor)
+            with pytest.raises(OSError, match="disk full"):
+                for _ in range(10):
+                    sink.write(b"data")
+                sink.flush()
+
+
+class TestMultipartDecoder:
+    data = (
+        b"--foo\r\n"
+        b'Content-Disposition: form-data; name="a"\r\n\r\n'
+        b"value\r\n"
+        b"--foo\r\n"
+        b'Content-Disposition: form-data; name="b"; filename="b.txt"\r\n'
+        b"Content-Type: text/plain\r\n\r\n"
+        b"line\r\n--foobar\r\n\r\n"
+        b"--foo--\r\n"
+        b"epilogue"
+    )
+
+    def decode(self, chunks):
+        decoder = formparser.MultipartDecoder(b"foo")
+        chunks = iter(chunks)
+        events = []
+        data = b""
+
+        while True:
+            event = decoder.next_event()
+            if event is formparser.NEED_DATA:
+                decoder.receive_data(next(chunks, None))
+            elif isinstance(event, formparser.Data):
+                data += event.data
+                if not event.more_data:
+                    events.append(formparser.Data(data, False))
+                    data = b""
+            else:
+                events.append(event)
+                if isinstance(event, formparser.Epilogue):
+                    return events
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 1000])
+    def test_events(self, size):
+        data = self.data
+        events = self.decode(data[i : i + size] for i in range(0, len(data), size))
+        assert [type(e).__name__ for e in events] == [
+            "Field",
+            "Data",
+            "File",
+            "Data",
+            "Epilogue",
+        ]
+        assert events[0].name == "a"
+        assert events[1] == formparser.Data(b"value", False)
+        assert events[2].name == "b"
+        assert events[2].filename == "b.txt"
+        assert events[2].headers["Content-Type"] == "text/plain"
+        assert events[3] == formparser.Data(b"line\r\n--foobar\r\n", False)
+        assert isinstance(events[4].data, bytes)
+
+    def test_ignores_data_after_epilogue(self):
+        decoder = formparser.MultipartDecoder(b"foo")
+        decoder.receive_data(b"--foo--\r\n")
+        assert decoder.next_event() == formparser.Epilogue(b"")
+        decoder.receive_data(b"more")
+        assert decoder.next_event() is formparser.NEED_DATA
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"foo\r\n--foo--",
+            b"--foo\r\nContent-Type: text/plain\r\n\r\n\r\n--foo--",
+            b"--foo\r\nContent-Disposition: form-data; name=a\r\n\r\nvalue",
+        ],
+    )
+    def test_errors(self, data):
+        with pytest.raises(ValueError):
+            self.decode([data])
+
 
 class TestInternalFunctions:
     def test_line_parser(self):
@@ -541,12 +822,3 @@ class TestInternalFunctions:
         assert formparser._line_parse("foo\r\n") == ("foo", True)
         assert formparser._line_parse("foo\r") == ("foo", True)
         assert formparser._line_parse("foo\n") == ("foo", True)
-
-    def test_find_terminator(self):
-        lineiter = iter(b"\n\n\nfoo\nbar\nbaz".splitlines(True))
-        find_terminator = formparser.MultiPartParser()._find_terminator
-        line = find_terminator(lineiter)
-        assert line == b"foo"
-        assert list(lineiter) == [b"bar\n", b"baz"]
-        assert find_terminator([]) == b""
-        assert find_terminator([b""]) == b""
@@ -3,6 +3,7 @@ import uuid
 
 import pytest
 
+from werkzeug import datastructures
 from werkzeug import routing as r
 from werkzeug.datastructures import ImmutableDict
 from werkzeug.datastructures import MultiDict
@@ -733,10 +734,19 @@ def test_build_append_multiple():
     assert set(b.split("&")) == set("y=2.0&x=1.0&x=3.0".split("&"))
 
 
-def test_build_append_multidict():
+@pytest.mark.parametrize(
+    "cls",
+    [
+        MultiDict,
+        datastructures.OrderedMultiDict,
+        datastructures.CompactMultiDict,
+        datastructures.ImmutableLazyMultiDict,
+    ],
+)
+def test_build_append_multidict(cls):
     map = r.Map([r.Rule("/bar/<float:foo>", endpoint="endp")])
     adapter = map.bind("example.org", "/", subdomain="subd")
-    params = MultiDict((("foo", 0.815), ("x", 1.0), ("x", 3.0), ("y", 2.0)))
+    params = cls((("foo", 0.815), ("x", 1.0), ("x", 3.0), ("y", 2.0)))
     a, b = adapter.build("endp", params).split("?")
     assert a == "http://example.org/bar/0.815"
     assert set(b.split("&")) == set("y=2.0&x=1.0&x=3.0".split("&"))
@@ -1229,3 +1239,286 @@ def test_rule_websocket_methods():
             methods=["get", "head", "options", "post"],
         )
     r.Rule("/ws", endpoint="ws", websocket=True, methods=["get", "head", "options"])
+
+
+def test_trie_matcher():
+    class TrieMap(r.Map):
+        matcher_class = r.TrieMatcher
+
+    map = TrieMap(
+        [
+            r.Rule("/", endpoint="index"),
+            r.Rule("/users/", endpoint="users"),
+            r.Rule("/users/new", endpoint="new_user"),
+            r.Rule("/users/<int:id>", endpoint="user"),
+            r.Rule("/users/<int:id>/edit", endpoint="edit_user", methods=["POST"]),
+            r.Rule("/users/<name>", endpoint="user_by_name"),
+            r.Rule("/files/<path:name>", endpoint="file"),
+            r.Rule("/page-<int:page>", endpoint="page"),
+            r.Rule("/index.html", endpoint="index", alias=True),
+            r.Rule("/", endpoint="api_index", subdomain="api"),
+            r.Rule("/", endpoint="user_index", subdomain="<user>"),
+        ]
+    )
+    adapter = map.bind("example.org", "/")
+    assert adapter.match("/") == ("index", {})
+    assert adapter.match("/users/") == ("users", {})
+    assert adapter.match("/users/new") == ("new_user", {})
+    assert adapter.match("/users/42") == ("user", {"id": 42})
+    assert adapter.match("/users/bob") == ("user_by_name", {"name": "bob"})
+    assert adapter.match("/users/42/edit", "POST") == ("edit_user", {"id": 42})
+    assert adapter.match("/files/a/b/c.txt") == ("file", {"name": "a/b/c.txt"})
+    assert adapter.match("/page-2") == ("page", {"page": 2})
+
+    with pytest.raises(r.RequestRedirect) as excinfo:
+        adapter.match("/users")
+    assert excinfo.value.new_url == "http://example.org/users/"
+
+    with pytest.raises(r.RequestRedirect) as excinfo:
+        adapter.match("/index.html")
+    assert excinfo.value.new_url == "http://example.org/"
+
+    with pytest.raises(r.MethodNotAllowed) as excinfo:
+        adapter.match("/users/42/edit")
+    assert excinfo.value.valid_methods == ["POST"]
+
+    pytest.raises(r.NotFound, adapter.match, "/missing")
+    pytest.raises(r.NotFound, adapter.match, "/users/42/delete")
+
+    assert map.bind("example.org", subdomain="api").match("/") == ("api_index", {})
+    assert map.bind("example.org", subdomain="bob").match("/") == (
+        "user_index",
+        {"user": "bob"},
+    )
+
+
+def test_trie_matcher_not_part_isolating():
+    class SlashConverter(r.BaseConverter):
+        def __init__(self, map):
+            super().__init__(map)
+            self.regex = r"\w+/\w+"
+
+    class TrieMap(r.Map):
+        matcher_class = r.TrieMatcher
+
+    assert not SlashConverter.part_isolating
+    assert not r.PathConverter.part_isolating
+    assert r.IntegerConverter.part_isolating
+    map = TrieMap(
+        [
+            r.Rule("/<slash:value>/end", endpoint="slash"),
+            r.Rule("/<any(a, 'b/c'):value>/x", endpoint="any"),
+        ],
+        converters={"slash": SlashConverter},
+    )
+    adapter = map.bind("example.org", "/")
+    assert adapter.match("/a/b/end") == ("slash", {"value": "a/b"})
+    assert adapter.match("/b/c/x") == ("any", {"value": "b/c"})
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 64])
+def test_regex_matcher(block_size):
+    class BlockRegexMatcher(r.RegexMatcher):
+        pass
+
+    BlockRegexMatcher.block_size = block_size
+
+    class RegexMap(r.Map):
+        matcher_class = BlockRegexMatcher
+
+    map = RegexMap(
+        [
+            r.Rule("/", endpoint="index"),
+            r.Rule("/users/", endpoint="users"),
+            r.Rule("/users/<int:id>", endpoint="user", methods=["GET"]),
+            r.Rule("/users/<int:id>", endpoint="update_user", methods=["POST"]),
+            r.Rule("/users/<name>", endpoint="user_by_name"),
+            r.Rule("/posts/<int:id>", endpoint="post", methods=["GET"]),
+            r.Rule("/", endpoint="api_index", subdomain="api"),
+            r.Rule("/<page>", endpoint="user_page", subdomain="<user>"),
+        ]
+    )
+    adapter = map.bind("example.org", "/")
+    assert adapter.match("/") == ("index", {})
+    assert adapter.match("/users/42") == ("user", {"id": 42})
+    assert adapter.match("/users/42", "POST") == ("update_user", {"id": 42})
+    assert adapter.match("/users/bob") == ("user_by_name", {"name": "bob"})
+    pytest.raises(r.RequestRedirect, adapter.match, "/users")
+    pytest.raises(r.MethodNotAllowed, adapter.match, "/posts/42", "PUT")
+    pytest.raises(r.NotFound, adapter.match, "/missing/page")
+
+    api = map.bind("example.org", subdomain="api")
+    assert api.match("/") == ("api_index", {})
+    assert api.match("/about") == ("user_page", {"user": "api", "page": "about"})
+    bob = map.bind("example.org", subdomain="bob")
+    pytest.raises(r.NotFound, bob.match, "/")
+
+    # one combined pattern per static domain, plus one for the rest
+    assert set(map._matcher._index[3]) == {"", "api", None}
+    map.update()
+    assert set(map._matcher._index[3]) == {"", "api", None}
+    map.add(r.Rule("/new", endpoint="new"))
+    assert adapter.match("/new") == ("new", {})
+    assert set(map._matcher._index[3]) == {""}
+
+
+def test_match_cache():
+    map = r.Map(
+        [
+            r.Rule("/", endpoint="index"),
+            r.Rule("/users/<int:id>", endpoint="user", methods=["GET"]),
+        ],
+        match_cache_size=2,
+    )
+    adapter = map.bind("example.org", "/")
+    assert map.match_cache_info() == (0, 0, 2, 0)
+
+    assert adapter.match("/users/1") == ("user", {"id": 1})
+    rule, args = adapter.match("/users/1", return_rule=True)
+    assert rule.endpoint == "user"
+    args["id"] = 2
+    assert adapter.match("/users/1") == ("user", {"id": 1})
+    assert map.match_cache_info() == (2, 1, 2, 1)
+
+    for _ in range(2):
+        with pytest.raises(r.MethodNotAllowed) as excinfo:
+            adapter.match("/users/1", "POST")
+        assert set(excinfo.value.valid_methods) == {"GET", "HEAD"}
+
+    assert map.match_cache_info() == (3, 2, 2, 2)
+
+    # redirects and missing paths are not cached
+    pytest.raises(r.RequestRedirect, adapter.match, "/users//1")
+    pytest.raises(r.NotFound, adapter.match, "/missing")
+    assert map.match_cache_info().currsize == 2
+
+    # least recently used is discarded
+    adapter.match("/")
+    assert map.match_cache_info().currsize == 2
+    pytest.raises(r.MethodNotAllowed, adapter.match, "/users/1", "POST")
+    assert map.match_cache_info().hits == 4
+    adapter.match("/users/1")
+    assert map.match_cache_info().hits == 4
+
+    map.add(r.Rule("/users/<int:id>", endpoint="update_user", methods=["POST"]))
+    assert adapter.match("/users/1", "POST") == ("update_user", {"id": 1})
+    assert map.match_cache_info().currsize == 1
+    assert r.Map().match_cache_info() is None
+
+
+def test_match_cache_not_cacheable():
+    class CounterConverter(r.BaseConverter):
+        cacheable = False
+        count = 0
+
+        def to_python(self, value):
+            CounterConverter.count += 1
+            return CounterConverter.count
+
+    map = r.Map(
+        [
+            r.Rule("/count/<counter:value>", endpoint="count"),
+            r.Rule("/<int:id>", endpoint="id"),
+        ],
+        converters={"counter": CounterConverter},
+        match_cache_size=10,
+    )
+    adapter = map.bind("example.org", "/")
+    assert adapter.match("/count/a") == ("count", {"value": 1})
+    assert adapter.match("/count/a") == ("count", {"value": 2})
+    assert adapter.match("/1") == ("id", {"id": 1})
+    assert adapter.match("/1") == ("id", {"id": 1})
+    assert map.match_cache_info() == (1, 3, 10, 1)
+
+
+def test_build_cache():
+    map = r.Map(
+        [
+            r.Rule("/blog/", defaults={"page": 1}, endpoint="blog"),
+            r.Rule("/blog/page/<int:page>", endpoint="blog"),
+            r.Rule("/blog/<int:year>/", endpoint="blog", methods=["GET"]),
+            r.Rule("/blog/<int:year>/edit", endpoint="blog", methods=["POST"]),
+        ]
+    )
+    adapter = map.bind("example.org", "/")
+
+    for _ in range(2):
+        assert adapter.build("blog") == "/blog/"
+        assert adapter.build("blog", {"page": 1}) == "/blog/"
+        assert adapter.build("blog", {"page": 2}) == "/blog/page/2"
+        assert adapter.build("blog", {"year": 2020}) == "/blog/?year=2020"
+        assert adapter.build("blog", {"year": 2020, "page": 1}) == "/blog/?year=2020"
+        assert (
+            adapter.build("blog", {"year": 2020, "page": 2}, "POST")
+            == "/blog/page/2?year=2020"
+        )
+
+    rules = map._build_candidates("blog", {"year": 2020, "page": 1}, "POST")
+    assert [rule.rule for rule in rules] == [
+        "/blog/",
+        "/blog/page/<int:page>",
+        "/blog/<int:year>/edit",
+    ]
+
+    map.add(r.Rule("/blog/<int:year>/<int:month>/", endpoint="blog"))
+    assert adapter.build("blog", {"year": 2020, "month": 1}) == "/blog/2020/1/"
+    assert len(map._build_cache) == 1
+
+
+def test_build_many():
+    map = r.Map(
+        [
+            r.Rule("/", endpoint="index"),
+            r.Rule("/users/<int:id>", endpoint="user"),
+            r.Rule("/", endpoint="api", subdomain="api"),
+            r.Rule("/ws", endpoint="ws", websocket=True),
+        ],
+        default_subdomain="www",
+    )
+    adapter = map.bind("example.org", "/app", url_scheme="https")
+    builds = [
+        ("index", None),
+        ("user", {"id": 1, "q": "x"}),
+        ("api", {}),
+        ("user", MultiDict([("id", 2)])),
+        ("api", {"page": 2}),
+        ("ws", {}),
+    ]
+    expect = [adapter.build(endpoint, values) for endpoint, values in builds]
+    assert expect == [
+        "/app/",
+        "/app/users/1?q=x",
+        "https://api.example.org/app/",
+        "/app/users/2",
+        "https://api.example.org/app/?page=2",
+        "wss://www.example.org/app/ws",
+    ]
+    assert adapter.build_many(builds) == expect
+    assert adapter.build_many(builds[:2], force_external=True) == [
+        "https://www.example.org/app/",
+        "https://www.example.org/app/users/1?q=x",
+    ]
+
+    with pytest.raises(r.BuildError):
+        adapter.build_many([("index", None), ("missing", None)])
+
+
+def test_rule_compiled_on_first_use():
+    rule = r.Rule("/users/<int:id>", endpoint="user")
+    map = r.Map([rule])
+    assert not {"_regex", "_build", "_build_unknown"} & rule.__dict__.keys()
+
+    adapter = map.bind("example.org", "/")
+    assert adapter.match("/users/1") == ("user", {"id": 1})
+    assert "_regex" in rule.__dict__
+    assert adapter.build("user", {"id": 1, "q": "x"}) == "/users/1?q=x"
+    assert "_build_unknown" in rule.__dict__
+
+    rule.rule = "/people/<int:id>"
+    rule.refresh()
+    assert not {"_regex", "_build", "_build_unknown"} & rule.__dict__.keys()
+    assert adapter.match("/people/1") == ("user", {"id": 1})
+    assert adapter.build("user", {"id": 1}) == "/people/1"
+    build_only = r.Rule("/static/<path:p>", endpoint="static", build_only=True)
+    r.Map([build_only])
+    assert build_only._regex is None
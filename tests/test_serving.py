@@ -7,6 +7,7 @@ import ssl
 import subprocess
 import sys
 import textwrap
+import threading
 import time
 from http import client as http_client
 
@@ -16,6 +17,7 @@ import test_apps.reloader_real_app as reloader_real_app
 from werkzeug import __version__ as version
 from werkzeug import _reloader
 from werkzeug import serving
+from werkzeug.exceptions import ClientDisconnected
 
 
 try:
@@ -66,6 +68,24 @@ def test_double_slash_path(standard_app):
     assert "fail" not in environ["HTTP_HOST"]
 
 
+@pytest.mark.parametrize(
+    ("target", "path", "query"),
+    [
+        ("/", "/", ""),
+        ("/a%20b/c?x=%20y&z", "/a b/c", "x=%20y&z"),
+        ("/a?b#c", "/a", "b"),
+        ("/a#b?c", "/a", ""),
+        ("/%C3%A9?", "/\xc3\xa9", ""),
+    ],
+)
+def test_request_target(standard_app, target, path, query):
+    environ = json.loads(standard_app.get(target).read())
+
+    assert environ["PATH_INFO"] == path
+    assert environ["QUERY_STRING"] == query
+    assert environ["REQUEST_URI"] == target
+
+
 def test_broken_app(standard_app):
     r = standard_app.get(f"{standard_app.url}/crash=True")
 
@@ -381,3 +401,301 @@ def test_unix_socket(tmpdir, dev_server):
     socket_f = str(tmpdir.join("socket"))
     dev_server(None, hostname=f"unix://{socket_f}")
     assert os.path.exists(socket_f)
+
+
+def test_asyncio_server(dev_server):
+    server = dev_server("standard_app", server="asyncio", threads=2)
+    environ = json.loads(server.get(f"{server.url}/?foo=bar").read())
+
+    assert environ["QUERY_STRING"] == "foo=bar"
+    assert environ["wsgi.multithread"] == "True"
+
+    r = server.get(f"{server.url}/crash=True")
+    assert r.status == 500
+
+
+def test_asyncio_server_chunked_encoding(dev_server):
+    server = dev_server("chunked_app", server="asyncio")
+    testfile = os.path.join(os.path.dirname(__file__), "res", "chunked.http")
+
+    server.conn.putrequest("POST", "/", skip_host=1, skip_accept_encoding=1)
+    server.conn.putheader("Transfer-Encoding", "chunked")
+    server.conn.putheader(
+        "Content-Type",
+        "multipart/form-data; boundary="
+        "--------------------------898239224156930639461866",
+    )
+    server.conn.endheaders()
+
+    with open(testfile, "rb") as f:
+        server.conn.send(f.read())
+
+    res = server.conn.getresponse()
+    assert res.status == 200
+    assert res.read() == b"YES"
+
+
+@pytest.mark.parametrize("interrupt", [False, True])
+def test_asyncio_server_shutdown_during_request(interrupt):
+    reading = threading.Event()
+    errors = []
+
+    def app(environ, start_response):
+        reading.set()
+
+        try:
+            environ["wsgi.input"].read()
+        except Exception as e:
+            errors.append(e)
+            raise
+
+    def keyboard_interrupt():
+        raise KeyboardInterrupt
+
+    server = serving.make_server("localhost", 0, app, server="asyncio")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.socket.getsockname()[1]
+
+    with socket.create_connection(("localhost", port)) as sock:
+        sock.sendall(b"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Length: 5\r\n\r\n")
+        assert reading.wait(5)
+
+        if interrupt:
+            # Like Ctrl+C, stop the loop without stopping the server.
+            server._loop.call_soon_threadsafe(keyboard_interrupt)
+        else:
+            server.shutdown()
+
+        thread.join(5)
+
+    assert not thread.is_alive()
+
+    # The worker thread stopped waiting for the body.
+    for _ in range(50):
+        if errors:
+            break
+
+        time.sleep(0.1)
+
+    # LimitedStream reports the aborted read as a disconnect.
+    assert isinstance(errors[0], ClientDisconnected)
+
+
+def test_make_server_unknown_server():
+    with pytest.raises(ValueError):
+        serving.make_server("localhost", 0, None, server="gevent")
+
+
+def test_thread_pool_server(dev_server):
+    server = dev_server("standard_app", threads=2, max_queue=4)
+    environ = json.loads(server.get(f"{server.url}/").read())
+    assert environ["wsgi.multithread"] == "True"
+
+
+def test_thread_pool_server_rejects_connections():
+    release = threading.Event()
+
+    def app(environ, start_response):
+        release.wait(5)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    server = serving.make_server("localhost", 0, app, threads=1, max_queue=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.socket.getsockname()[1]
+
+    try:
+        busy = http_client.HTTPConnection("localhost", port)
+        busy.request("GET", "/")
+        time.sleep(0.2)
+
+        rejected = http_client.HTTPConnection("localhost", port)
+        rejected.request("GET", "/")
+        assert rejected.getresponse().status == 503
+
+        release.set()
+        assert busy.getresponse().read() == b"ok"
+    finally:
+        release.set()
+        server.shutdown()
+        thread.join()
+
+
+def test_thread_pool_server_replaces_failed_worker():
+    class Server(serving.ThreadPoolWSGIServer):
+        failed = False
+
+        def process_request_thread(self, request, client_address):
+            if not self.failed:
+                self.failed = True
+
+                # Exit once the next connection is waiting for this worker.
+                while self._queue.empty():
+                    time.sleep(0.01)
+
+                self.shutdown_request(request)
+                raise SystemExit
+
+            super().process_request_thread(request, client_address)
+
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    server = Server("localhost", 0, app, threads=1, max_queue=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.socket.getsockname()[1]
+
+    try:
+        failed = http_client.HTTPConnection("localhost", port, timeout=5)
+        failed.request("GET", "/")
+        time.sleep(0.2)
+
+        waiting = http_client.HTTPConnection("localhost", port, timeout=5)
+        waiting.request("GET", "/")
+        assert waiting.getresponse().read() == b"ok"
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+@pytest.mark.skipif(not serving.can_fork, reason="requires fork")
+def test_prefork_server(dev_server):
+    server = dev_server("standard_app", processes=2, prefork=True)
+    environ = json.loads(server.get(f"{server.url}/").read())
+    assert environ["wsgi.multiprocess"] == "True"
+    assert environ["wsgi.multithread"] == "False"
+
+
+def test_prefork_server_threaded():
+    with pytest.raises(ValueError):
+        serving.make_server("localhost", 0, None, threaded=True, prefork=True)
+
+
+def test_keep_alive(dev_server):
+    server = dev_server("standard_app", threaded=True)
+
+    for path in ("/a", "/b"):
+        r = server.get(f"{server.url}{path}")
+        assert r.version == 11
+        assert json.loads(r.read())["PATH_INFO"] == path
+
+    # The body of the first request isn't read by the application.
+    with socket.create_connection(("localhost", server.port)) as sock:
+        sock.sendall(
+            b"POST /a HTTP/1.1\r\nHost: localhost\r\nContent-Length: 5\r\n\r\nhello"
+            b"GET /b HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
+        )
+        data = b""
+
+        while True:
+            chunk = sock.recv(4096)
+
+            if not chunk:
+                break
+
+            data += chunk
+
+    assert data.count(b"HTTP/1.1 200 OK") == 2
+
+
+def _read_until_closed(sock):
+    data = b""
+
+    while True:
+        chunk = sock.recv(4096)
+
+        if not chunk:
+            return data
+
+        data += chunk
+
+
+@pytest.mark.parametrize("kwargs", [{"threaded": True}, {"server": "asyncio"}])
+def test_keep_alive_large_unread_body(dev_server, kwargs):
+    server = dev_server("standard_app", **kwargs)
+
+    # Only the start of the body is sent, the server doesn't wait for
+    # the rest of it and closes the connection after the response.
+    with socket.create_connection(("localhost", server.port), timeout=5) as sock:
+        sock.sendall(
+            b"POST / HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Length: 100000000\r\n\r\n" + b"x" * 100000
+        )
+        data = _read_until_closed(sock)
+
+    assert data.startswith(b"HTTP/1.1 200 OK")
+    assert b"\r\nConnection: close\r\n" in data
+
+
+def test_keep_alive_http_1_0(dev_server):
+    server = dev_server("standard_app", threaded=True)
+
+    with socket.create_connection(("localhost", server.port), timeout=5) as sock:
+        sock.sendall(b"GET /a HTTP/1.0\r\nConnection: keep-alive\r\n\r\n")
+        data = sock.recv(4096)
+        assert b"\r\nConnection: keep-alive\r\n" in data
+        sock.sendall(b"GET /b HTTP/1.0\r\n\r\n")
+        data += _read_until_closed(sock)
+
+    assert data.count(b"HTTP/1.1 200 OK") == 2
+
+
+@pytest.mark.parametrize("kwargs", [{"threaded": True}, {"server": "asyncio"}])
+def test_file_wrapper_sendfile(dev_server, kwargs):
+    server = dev_server("file_app", **kwargs)
+    path = os.path.join(os.path.dirname(__file__), "res", "index.html")
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    r = server.get(server.url)
+    assert r.status == 200
+    assert r.read() == data
+    r = server.get(server.url, headers={"Range": "bytes=10-19"})
+    assert r.status == 206
+    assert r.read() == data[10:20]
+    r = server.get(server.url, headers={"Range": "bytes=-5"})
+    assert r.status == 206
+    assert r.read() == data[-5:]
+
+
+@pytest.mark.parametrize("kwargs", [{"threaded": True}, {"server": "asyncio"}])
+def test_metrics(dev_server, kwargs):
+    server = dev_server("standard_app", expose_metrics=True, **kwargs)
+
+    def get_metrics():
+        r = server.get(f"{server.url}/__werkzeug__/metrics")
+        assert r.getheader("Content-Type") == "application/json"
+        return json.loads(r.read())
+
+    # The fixture's startup requests are counted too, compare against
+    # a snapshot taken before the requests under test.
+    before = get_metrics()
+    server.get(server.url).read()
+    server.get(server.url).read()
+    metrics = get_metrics()
+
+    # Two requests and the first metrics request.
+    assert metrics["requests"] - before["requests"] == 3
+    assert metrics["requests_in_flight"] == 1
+    assert metrics["bytes_out"] > before["bytes_out"]
+    total_counts = sum(metrics["total_time"]["counts"])
+    assert total_counts - sum(before["total_time"]["counts"]) == 3
+
+
+def test_metrics_not_exposed(standard_app):
+    r = standard_app.get(f"{standard_app.url}/__werkzeug__/metrics")
+    environ = json.loads(r.read())
+    assert environ["PATH_INFO"] == "/__werkzeug__/metrics"
+
+
+def test_chunked_response(dev_server):
+    server = dev_server("streaming_app", threaded=True)
+    r = server.get(server.url)
+    assert r.getheader("Transfer-Encoding") == "chunked"
+    assert r.read() == b"Hello, World!"
+    assert not r.will_close
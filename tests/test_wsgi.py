@@ -220,6 +220,55 @@ def test_limited_stream_disconnection():
         stream.read()
 
 
+def test_limited_stream_readinto():
+    stream = wsgi.LimitedStream(io.BytesIO(b"123456"), 5)
+    buffer = bytearray(2)
+    assert stream.readinto(buffer) == 2
+    assert buffer == b"12"
+    assert stream.readinto(buffer) == 2
+    assert buffer == b"34"
+    assert stream.readinto(buffer) == 1
+    assert buffer[:1] == b"5"
+    assert stream.tell() == 5
+    assert stream.readinto(buffer) == 0
+
+    class ExhaustedStream(wsgi.LimitedStream):
+        def on_exhausted(self):
+            return b"exhausted"
+
+    stream = ExhaustedStream(io.BytesIO(b"123456"), 0)
+    assert stream.readinto(buffer) == 2
+    assert buffer == b"ex"
+
+    class ReadOnlyStream:
+        def __init__(self, data):
+            self.read = io.BytesIO(data).read
+            self.readline = None
+
+    # streams without readinto are read with read
+    stream = wsgi.LimitedStream(ReadOnlyStream(b"123"), 3)
+    assert stream.readinto(buffer) == 2
+    assert buffer == b"12"
+
+    with pytest.raises(ClientDisconnected):
+        wsgi.LimitedStream(io.BytesIO(b"123"), 5).readinto(bytearray(5))
+
+
+def test_limited_stream_iter_chunks():
+    stream = wsgi.LimitedStream(io.BytesIO(b"1234567890"), 9)
+    chunks = [bytes(chunk) for chunk in stream.iter_chunks(4)]
+    assert chunks == [b"1234", b"5678", b"9"]
+    assert stream.is_exhausted
+
+    stream = wsgi.LimitedStream(io.BytesIO(b"1234567890"), 9)
+    stream.read(2)
+    stream.exhaust(2)
+    assert stream.tell() == 9
+
+    with pytest.raises(ClientDisconnected):
+        list(wsgi.LimitedStream(io.BytesIO(b"123"), 9).iter_chunks(4))
+
+
 def test_path_info_extraction():
     x = wsgi.extract_path_info("http://example.com/app", "/app/hello")
     assert x == "/hello"
@@ -407,6 +456,43 @@ def test_lines_longer_buffer_size_cap():
         assert len(lines[0]) == bufsize or lines[0].endswith("\n")
 
 
+@pytest.mark.parametrize("cap_at_buffer", [False, True])
+def test_line_breaks_across_chunks(cap_at_buffer):
+    chunks = [b"a\r", b"\nb\r", b"c", b"\r", b"", b"\nd" * 10, b"e\r"]
+    lines = list(
+        wsgi.make_line_iter(chunks, buffer_size=8, cap_at_buffer=cap_at_buffer)
+    )
+    assert b"".join(lines) == b"".join(chunks)
+
+    if cap_at_buffer:
+        assert all(
+            len(line) <= 8 or (len(line) == 9 and line.endswith(b"\r\n"))
+            for line in lines
+        )
+    else:
+        assert lines == [b"a\r\n", b"b\r", b"c\r\n"] + [b"d\n"] * 9 + [b"de\r"]
+
+
+@pytest.mark.parametrize("buffer_size", [4, 10, 11])
+def test_cap_at_buffer_keeps_crlf(buffer_size):
+    data = b"a" * (buffer_size - 1) + b"\r\nb\r\n"
+    lines = list(
+        wsgi.make_line_iter(
+            io.BytesIO(data),
+            limit=len(data),
+            buffer_size=buffer_size,
+            cap_at_buffer=True,
+        )
+    )
+    assert lines == [b"a" * (buffer_size - 1) + b"\r\n", b"b\r\n"]
+
+
+def test_str_line_breaks():
+    data = "a\x0bb\u2028c\r\nd"
+    lines = list(wsgi.make_line_iter(io.StringIO(data), limit=len(data)))
+    assert lines == ["a\x0bb\u2028c\r\n", "d"]
+
+
 def test_range_wrapper():
     response = BaseResponse(b"Hello World")
     range_wrapper = _RangeWrapper(response.response, 6, 4)